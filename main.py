@@ -1,12 +1,1757 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import tkinter.font as tkfont
 import subprocess
 import threading
 import os
+import sys
 from datetime import datetime
 import re
 import csv
 import io
+import tempfile
+import json
+import sqlite3
+import time
+import signal
+import itertools
+import bisect
+import heapq
+import shutil
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Default worker pool settings for bulk GAM operations
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_JOB_TIMEOUT = 30
+DEFAULT_GROUPS_PER_CALL = 20
+DEFAULT_BATCH_SIZE = 100  # Commands per GAM batch process
+DEFAULT_COMMAND_TIMEOUT = 300
+DEFAULT_SIGNOUT_RATE = 5  # Bulk sign-outs started per second, to stay under Admin SDK quotas
+REPORT_FLUSH_SECONDS = 2  # Streamed reports are flushed to disk at least this often
+EVENT_DELETED_RESULT = "🗑️ deleted"  # Row result shown for events removed by a bulk delete
+
+# Job scheduling: interactive lookups run ahead of bulk work, and bulk work
+# is capped so it can never use every worker or flood the system with GAM processes
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+MAX_JOB_WORKERS = 6
+MAX_BULK_JOBS = 3
+MAX_BULK_PROCESSES = 16
+
+# How often queued GUI updates (status, progress, streamed output) are applied
+UI_TICK_MS = 50
+
+# Local application data (session logs, caches)
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".gam_made_simple")
+LOG_DIR = os.path.join(APP_DATA_DIR, "logs")
+
+# Group reports journal their progress here so an interrupted report can be resumed
+REPORT_JOURNAL_DIR = os.path.join(APP_DATA_DIR, "report_journals")
+
+# Finished and failed drive transfers are appended here, one JSON object per line
+TRANSFER_LOG_FILE = os.path.join(APP_DATA_DIR, "drive_transfers.jsonl")
+MAX_CONCURRENT_TRANSFERS = 2
+MAX_TRANSFER_LIMIT = 6  # Upper end of the Concurrent Transfers setting
+
+# Drive usage analysis: rows shown per table and how often running totals are redrawn
+DRIVE_USAGE_TOP_N = 25
+DRIVE_USAGE_REFRESH_SECONDS = 2
+DRIVE_USAGE_FIELDS = ['id', 'mimetype', 'size', 'quotabytesused', 'owners', 'permissions']
+
+# Last known member counts and role lists per group, used by delta report refreshes
+GROUP_SNAPSHOT_FILE = os.path.join(APP_DATA_DIR, "group_snapshot.db")
+
+# Organizational units are served from this cache at startup and refreshed once it is stale
+OU_CACHE_FILE = os.path.join(APP_DATA_DIR, "ou_cache.json")
+OU_CACHE_TTL = 12 * 60 * 60
+
+# Group membership cache
+MEMBERSHIP_CACHE_FILE = os.path.join(APP_DATA_DIR, "membership_cache.json")
+MEMBERSHIP_CACHE_TTL = 30 * 60
+MEMBERSHIP_CACHE_MAX_ENTRIES = 50000
+MEMBERSHIP_INDEX_MAX_GROUPS = 5000  # Least recently fetched groups are dropped from the reverse index
+
+# Optional local SQLite mirror of users, groups, memberships and OUs
+DIRECTORY_MIRROR_FILE = os.path.join(APP_DATA_DIR, "directory.db")
+MIRROR_FULL_MEMBERSHIP_SYNC_AGE = 7 * 86400  # Sync Changes refetches every group once the last full refresh is this old
+
+MIRROR_USER_COLUMNS = ['email', 'name', 'orgUnitPath', 'suspended', 'lastLoginTime']
+
+# Fields requested by user listings, and the keys GAM's CSV header gives them
+USER_LISTING_FIELDS = ['primaryemail', 'name', 'orgunitpath', 'suspended', 'lastlogintime']
+MIRROR_USER_KEYS = ['primaryemail', 'name.fullname', 'orgunitpath', 'suspended', 'lastlogintime']
+
+# Output tab limits; older lines are spilled to the session log on disk
+DEFAULT_OUTPUT_MAX_LINES = 5000
+OUTPUT_TRIM_PAUSE_FACTOR = 4  # While earlier pages are shown, new output may grow to this many times the cap
+OUTPUT_PAGE_LINES = 1000
+LOG_PART_BYTES = 10 * 1024 * 1024
+LOG_MAX_PARTS = 10
+LOG_MAX_SESSIONS = 10
+LOG_INDEX_INTERVAL = 1000
+
+
+class FanOutExecutor:
+    """Run a function over many items on a bounded pool of worker threads"""
+    
+    def __init__(self, max_workers=DEFAULT_MAX_CONCURRENCY):
+        self.max_workers = max(1, int(max_workers))
+        
+    def map(self, func, items, on_result=None, cancel_event=None, keep_results=True):
+        """Apply func to every item and return the results in input order.
+        
+        Only a small window of items is in flight at any time, so very large
+        inputs do not queue thousands of futures up front. If func raises, the
+        exception object is stored as that item's result. on_result is called
+        from a worker thread as (index, item, result, completed_count) in
+        completion order, which callers use for progress reporting. Once
+        cancel_event is set no new items are started and the results of
+        items that never ran stay None. With keep_results=False results are
+        only passed to on_result and every returned result is None.
+        """
+        items = list(items)
+        results = [None] * len(items)
+        if not items:
+            return results
+            
+        completed = 0
+        pending = {}
+        next_index = 0
+        window = self.max_workers * 2
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while next_index < len(items) or pending:
+                # Keep the pool fed without submitting everything at once
+                while next_index < len(items) and len(pending) < window:
+                    if cancel_event is not None and cancel_event.is_set():
+                        next_index = len(items)
+                        break
+                    future = pool.submit(func, items[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+                    
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    if keep_results:
+                        results[index] = result
+                    completed += 1
+                    if on_result:
+                        on_result(index, items[index], result, completed)
+                        
+        return results
+
+
+class RateLimiter:
+    """Space out operations started from many worker threads to a steady rate
+    
+    Each acquire reserves the next free start time, so concurrent callers
+    queue up behind each other instead of bursting together. A rate of 0
+    or less disables limiting.
+    """
+    
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0
+        self.next_start = 0
+        self.lock = threading.Lock()
+        
+    def acquire(self, count=1, cancel_event=None):
+        """Wait until count more operations may start; raises JobCancelled if cancelled meanwhile"""
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval * count
+        delay = start - now
+        if delay > 0:
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    raise JobCancelled()
+            else:
+                time.sleep(delay)
+
+
+class SessionLog:
+    """Append-only on-disk log of everything written to the Output tab
+    
+    The log is split into numbered part files so it can be capped on disk;
+    once more than max_parts exist the oldest part is deleted. A sparse
+    index of line offsets lets earlier lines be read back without scanning
+    the whole log; every part starts with a checkpoint so each retained
+    part can be read from its first line.
+    """
+    
+    def __init__(self, log_dir=LOG_DIR, part_bytes=LOG_PART_BYTES, max_parts=LOG_MAX_PARTS,
+                 max_sessions=LOG_MAX_SESSIONS):
+        self.part_bytes = part_bytes
+        self.max_parts = max_parts
+        self.lock = threading.Lock()
+        self.parts = []  # Paths of the retained part files, oldest first
+        self.checkpoints = []  # (line_number, part_path, byte_offset) per part and every LOG_INDEX_INTERVAL lines
+        self.line_count = 0  # Lines written this session, including rotated-out ones
+        self.first_line = 0  # First line still available on disk
+        self.at_line_start = True
+        self.file = None
+        self.part_size = 0
+        self.part_number = 0
+        
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            self.prune_sessions(log_dir, max_sessions)
+            self.base_path = os.path.join(log_dir, f"session-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+            self.open_part()
+        except OSError:
+            # Without a writable log directory the Output tab simply keeps its capped view
+            self.file = None
+            
+    def prune_sessions(self, log_dir, max_sessions):
+        """Delete the part files of all but the most recent sessions"""
+        sessions = {}
+        for name in os.listdir(log_dir):
+            if name.startswith("session-") and name.endswith(".log"):
+                sessions.setdefault(name.rsplit('-', 1)[0], []).append(name)
+                
+        # Keep room for the session that is about to start
+        keep = max(max_sessions - 1, 0)
+        expired = sorted(sessions)[:len(sessions) - keep] if len(sessions) > keep else []
+        for session in expired:
+            for name in sessions[session]:
+                try:
+                    os.remove(os.path.join(log_dir, name))
+                except OSError:
+                    pass
+                    
+    def open_part(self):
+        """Start a new part file, deleting the oldest one once the cap is reached"""
+        self.part_number += 1
+        path = f"{self.base_path}-{self.part_number:03d}.log"
+        if self.file:
+            self.file.close()
+        self.file = open(path, 'ab')
+        self.parts.append(path)
+        self.part_size = 0
+        
+        if len(self.parts) > self.max_parts:
+            oldest = self.parts.pop(0)
+            self.checkpoints = [c for c in self.checkpoints if c[1] != oldest]
+            self.first_line = self.checkpoints[0][0] if self.checkpoints else self.line_count
+            try:
+                os.remove(oldest)
+            except OSError:
+                pass
+                
+    def write(self, text):
+        """Append text to the log"""
+        with self.lock:
+            for line in text.splitlines(keepends=True):
+                if self.at_line_start:
+                    if self.file and self.part_size >= self.part_bytes:
+                        self.open_part()
+                    if self.file and (self.part_size == 0 or self.line_count % LOG_INDEX_INTERVAL == 0):
+                        self.checkpoints.append((self.line_count, self.parts[-1], self.part_size))
+                        
+                data = line.encode('utf-8', errors='replace')
+                if self.file:
+                    self.file.write(data)
+                self.part_size += len(data)
+                
+                self.at_line_start = line.endswith('\n')
+                if self.at_line_start:
+                    self.line_count += 1
+                    
+            if self.file:
+                self.file.flush()
+                
+    def read_lines(self, start, end):
+        """Read lines [start, end) back from disk, clamped to what is retained"""
+        with self.lock:
+            start = max(start, self.first_line)
+            if not self.file or start >= end:
+                return []
+                
+            checkpoint = None
+            for candidate in self.checkpoints:
+                if candidate[0] > start:
+                    break
+                checkpoint = candidate
+            if checkpoint is None:
+                return []
+                
+            line_number, part_path, offset = checkpoint
+            lines = []
+            for path in self.parts[self.parts.index(part_path):]:
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    for raw in f:
+                        if line_number >= end:
+                            return lines
+                        if line_number >= start:
+                            lines.append(raw.decode('utf-8', errors='replace'))
+                        line_number += 1
+                offset = 0
+            return lines
+            
+    def export(self, filename):
+        """Copy every retained line of the log into filename"""
+        with self.lock:
+            with open(filename, 'wb') as out:
+                for path in self.parts:
+                    with open(path, 'rb') as f:
+                        while True:
+                            chunk = f.read(1024 * 1024)
+                            if not chunk:
+                                break
+                            out.write(chunk)
+                            
+    def has_content(self):
+        return bool(self.file) and (self.line_count > self.first_line or not self.at_line_start)
+
+
+def kill_process_tree(process):
+    """Kill a shell=True child process together with the GAM process it started"""
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == 'nt':
+            subprocess.run(f"taskkill /F /T /PID {process.pid}", shell=True, capture_output=True)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        process.kill()
+
+
+def popen_gam(command, **kwargs):
+    """Start a GAM command in its own process group so it can be killed as a tree"""
+    if os.name != 'nt':
+        kwargs.setdefault('start_new_session', True)
+    return subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, errors='replace', **kwargs)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once it has been cancelled"""
+
+
+class Job:
+    """A unit of GAM work tracked by the JobScheduler
+    
+    Job functions receive the job and should start GAM processes through
+    popen or run_process, so that cancel() can kill them.
+    """
+    
+    def __init__(self, scheduler, job_id, name, func, priority):
+        self.scheduler = scheduler
+        self.id = job_id
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.state = 'queued'
+        self.error = None
+        self.progress = ""
+        self.created = datetime.now()
+        self.started = None
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self.processes = set()
+        self.lock = threading.Lock()
+        
+    @property
+    def is_bulk(self):
+        return self.priority >= PRIORITY_BULK
+        
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+        
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled()
+            
+    def set_progress(self, text):
+        self.progress = text
+        self.scheduler.notify(self)
+        
+    def cancel(self):
+        """Stop the job and kill any GAM processes it is running"""
+        self.cancel_event.set()
+        with self.lock:
+            processes = list(self.processes)
+        for process in processes:
+            kill_process_tree(process)
+        self.scheduler.cancel_queued(self)
+        
+    def popen(self, command, **kwargs):
+        """Start a GAM process owned by this job"""
+        self.check_cancelled()
+        process = popen_gam(command, **kwargs)
+        with self.lock:
+            self.processes.add(process)
+        if self.cancelled:
+            kill_process_tree(process)
+        return process
+        
+    def release(self, process):
+        with self.lock:
+            self.processes.discard(process)
+            
+    def run_process(self, command, timeout=None):
+        """Run a GAM command to completion, like subprocess.run with captured text output"""
+        with self.scheduler.process_slot(self):
+            process = self.popen(command)
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                kill_process_tree(process)
+                process.communicate()
+                raise
+            finally:
+                self.release(process)
+                
+        self.check_cancelled()
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+class JobScheduler:
+    """Priority scheduler for all GAM work started from the GUI
+    
+    A fixed pool of worker threads runs queued jobs, interactive ones first.
+    Bulk jobs may only occupy max_bulk_jobs workers, so quick lookups always
+    have a free worker, and bulk GAM processes share one global limit.
+    Jobs that run for hours can be started with submit_dedicated instead, so
+    they hold neither a worker nor a bulk slot.
+    """
+    
+    def __init__(self, max_workers=MAX_JOB_WORKERS, max_bulk_jobs=MAX_BULK_JOBS,
+                 max_bulk_processes=MAX_BULK_PROCESSES, on_change=None):
+        self.max_bulk_jobs = min(max_bulk_jobs, max_workers - 1) if max_workers > 1 else 1
+        self.on_change = on_change
+        self.condition = threading.Condition()
+        self.queue = []  # Queued jobs, kept sorted by (priority, id)
+        self.jobs = {}  # Every job by ID, in submission order
+        self.running_bulk = 0
+        self.bulk_process_slots = threading.BoundedSemaphore(max_bulk_processes)
+        self.ids = itertools.count(1)
+        
+        for _ in range(max_workers):
+            worker = threading.Thread(target=self._worker)
+            worker.daemon = True
+            worker.start()
+            
+    def submit(self, name, func, priority=PRIORITY_INTERACTIVE):
+        """Queue func(job) to run in the background and return its Job"""
+        with self.condition:
+            job = Job(self, next(self.ids), name, func, priority)
+            self.jobs[job.id] = job
+            self.queue.append(job)
+            self.queue.sort(key=lambda j: (j.priority, j.id))
+            self.condition.notify_all()
+        self.notify(job)
+        return job
+        
+    def submit_dedicated(self, name, func, priority=PRIORITY_BULK):
+        """Run func(job) on its own thread, outside the worker pool and the bulk job limit
+        
+        The caller decides how many dedicated jobs run at once.
+        """
+        with self.condition:
+            job = Job(self, next(self.ids), name, func, priority)
+            self.jobs[job.id] = job
+            job.state = 'running'
+            job.started = datetime.now()
+        thread = threading.Thread(target=self._run, args=(job,))
+        thread.daemon = True
+        thread.start()
+        self.notify(job)
+        return job
+        
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if job and job.state in ('queued', 'running'):
+            job.cancel()
+            
+    def cancel_queued(self, job):
+        """Drop a cancelled job that has not started yet"""
+        with self.condition:
+            if job in self.queue:
+                self.queue.remove(job)
+                job.state = 'cancelled'
+                job.finished = datetime.now()
+        self.notify(job)
+        
+    def clear_finished(self):
+        with self.condition:
+            for job_id in [j.id for j in self.jobs.values() if j.state not in ('queued', 'running')]:
+                del self.jobs[job_id]
+        self.notify(None)
+        
+    def notify(self, job):
+        if self.on_change:
+            self.on_change(job)
+            
+    def process_slot(self, job):
+        """Context manager holding a GAM process slot for the duration of a command"""
+        return self.bulk_process_slots if job.is_bulk else _NoSlot()
+        
+    def _next_job(self):
+        for job in self.queue:
+            if not job.is_bulk or self.running_bulk < self.max_bulk_jobs:
+                return job
+        return None
+        
+    def _worker(self):
+        while True:
+            with self.condition:
+                job = self._next_job()
+                while job is None:
+                    self.condition.wait()
+                    job = self._next_job()
+                self.queue.remove(job)
+                if job.is_bulk:
+                    self.running_bulk += 1
+                job.state = 'running'
+                job.started = datetime.now()
+            self.notify(job)
+            
+            try:
+                self._run(job)
+            finally:
+                with self.condition:
+                    if job.is_bulk:
+                        self.running_bulk -= 1
+                    self.condition.notify_all()
+                    
+    def _run(self, job):
+        try:
+            job.func(job)
+            job.state = 'cancelled' if job.cancelled else 'done'
+        except JobCancelled:
+            job.state = 'cancelled'
+        except Exception as e:
+            job.state = 'cancelled' if job.cancelled else 'failed'
+            job.error = str(e)
+        finally:
+            job.finished = datetime.now()
+        self.notify(job)
+
+
+class _NoSlot:
+    """Stand-in for a process slot when a job is not subject to the bulk limit"""
+    
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc_info):
+        return False
+
+
+class MembershipCache:
+    """TTL + LRU cache of group membership lists keyed by (group, role)
+    
+    Entries expire after ttl seconds and the least recently used entries are
+    evicted once max_entries is exceeded. Member emails are interned, so a
+    user in many groups is stored once however many entries list them. Hit
+    and miss counts are kept so the hit rate can be shown in the GUI.
+    """
+    
+    def __init__(self, ttl=MEMBERSHIP_CACHE_TTL, max_entries=MEMBERSHIP_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (group, role) -> (fetched_at, emails)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+    def get(self, group_email, role):
+        """Return the cached emails for a group role, or None on a miss"""
+        key = (group_email.lower(), role)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[1])
+            if entry:
+                del self.entries[key]
+            self.misses += 1
+            return None
+            
+    def age(self, group_email, role):
+        """Seconds since a cached entry was fetched, or None if it is not cached"""
+        with self.lock:
+            entry = self.entries.get((group_email.lower(), role))
+            return time.time() - entry[0] if entry else None
+            
+    def put(self, group_email, role, emails, fetched_at=None):
+        key = (group_email.lower(), role)
+        with self.lock:
+            self.entries[key] = (fetched_at or time.time(), [sys.intern(email) for email in emails])
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+        
+    def save(self, filename):
+        """Write the unexpired entries to disk"""
+        now = time.time()
+        with self.lock:
+            rows = [[group, role, fetched_at, emails]
+                    for (group, role), (fetched_at, emails) in self.entries.items()
+                    if now - fetched_at < self.ttl]
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        temp_file = filename + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(rows, f)
+        os.replace(temp_file, filename)
+        
+    def load(self, filename):
+        """Load entries saved by save(); expired entries are skipped"""
+        with open(filename, encoding='utf-8') as f:
+            rows = json.load(f)
+        now = time.time()
+        for group, role, fetched_at, emails in rows:
+            if now - fetched_at < self.ttl:
+                self.put(group, role, emails, fetched_at)
+
+
+class MembershipIndex:
+    """Reverse index of member email -> groups and roles
+    
+    Filled from every membership fetch so "which groups is X in?" is a dict
+    lookup instead of a GAM call. Replacing a group's role list removes the
+    stale entries for that group, so the index always reflects the most
+    recent fetch of each group. Member emails are interned so they are shared
+    with the membership cache. Role lists expire with the cache ttl, and once
+    more than max_groups groups are indexed the least recently fetched ones
+    are dropped.
+    
+    A partial index cannot show that a user is not in a group, so the index
+    is only complete after mark_complete confirms every group in the domain
+    is indexed with every role; any expiry or eviction makes it partial again.
+    """
+    
+    ROLES = ('member', 'owner', 'manager')
+    
+    def __init__(self, ttl=MEMBERSHIP_CACHE_TTL, max_groups=MEMBERSHIP_INDEX_MAX_GROUPS):
+        self.ttl = ttl
+        self.max_groups = max_groups
+        self.by_member = {}  # member -> {group: set of roles}
+        self.by_group = OrderedDict()  # group -> {member: set of roles}, least recently fetched first
+        self.fetched_at = {}  # group -> {role: time the role list was fetched}
+        self.oldest_fetch = None  # Earliest time in fetched_at, so lookups can skip the expiry scan
+        self.complete = False
+        self.lock = threading.Lock()
+        
+    def set_role(self, group_email, role, emails, fetched_at=None):
+        """Replace the members a group has for one role"""
+        group = group_email.lower()
+        with self.lock:
+            self.remove_role(group, role)
+            group_members = self.by_group.setdefault(group, {})
+            for email in emails:
+                member = sys.intern(email.lower())
+                group_members.setdefault(member, set()).add(role)
+                self.by_member.setdefault(member, {})[group] = group_members[member]
+            fetched_at = fetched_at or time.time()
+            self.fetched_at.setdefault(group, {})[role] = fetched_at
+            if self.oldest_fetch is None or fetched_at < self.oldest_fetch:
+                self.oldest_fetch = fetched_at
+            self.by_group.move_to_end(group)
+            while len(self.by_group) > self.max_groups:
+                self.remove_group(next(iter(self.by_group)))
+                
+    def remove_role(self, group, role):
+        """Drop the members a group has for one role; the caller holds the lock"""
+        group_members = self.by_group.get(group, {})
+        for member, member_roles in list(group_members.items()):
+            if role in member_roles:
+                member_roles.discard(role)
+                if not member_roles:
+                    del group_members[member]
+                    del self.by_member[member][group]
+                    if not self.by_member[member]:
+                        del self.by_member[member]
+        self.fetched_at.get(group, {}).pop(role, None)
+        
+    def remove_group(self, group):
+        """Drop every entry of a group; the caller holds the lock"""
+        self.complete = False
+        self.fetched_at.pop(group, None)
+        for member in self.by_group.pop(group, {}):
+            member_groups = self.by_member.get(member)
+            if member_groups is not None:
+                member_groups.pop(group, None)
+                if not member_groups:
+                    del self.by_member[member]
+                    
+    def expire(self):
+        """Drop role lists older than the ttl; the caller holds the lock"""
+        cutoff = time.time() - self.ttl
+        if self.oldest_fetch is None or self.oldest_fetch >= cutoff:
+            return
+        for group, roles in list(self.fetched_at.items()):
+            for role, fetched_at in list(roles.items()):
+                if fetched_at < cutoff:
+                    self.remove_role(group, role)
+                    self.complete = False
+            if not self.fetched_at[group]:
+                self.remove_group(group)
+        self.oldest_fetch = min((fetched_at for roles in self.fetched_at.values() for fetched_at in roles.values()),
+                                default=None)
+                
+    def mark_complete(self, group_emails):
+        """Mark the index complete if every given group is indexed with every role"""
+        with self.lock:
+            self.expire()
+            self.complete = all(set(self.ROLES) <= self.fetched_at.get(group.lower(), {}).keys()
+                                for group in group_emails)
+            return self.complete
+            
+    def is_complete(self):
+        with self.lock:
+            self.expire()
+            return self.complete
+            
+    def groups_for(self, member_email):
+        """Return [(group, [roles])] for a member, sorted by group"""
+        with self.lock:
+            self.expire()
+            groups = self.by_member.get(member_email.lower(), {})
+            return [(group, sorted(roles)) for group, roles in sorted(groups.items())]
+            
+    def group_count(self):
+        with self.lock:
+            self.expire()
+            return len(self.by_group)
+            
+    def clear(self):
+        with self.lock:
+            self.by_member.clear()
+            self.by_group.clear()
+            self.fetched_at.clear()
+            self.oldest_fetch = None
+            self.complete = False
+
+
+class GroupReportWriter:
+    """Write group report CSV rows one group at a time
+    
+    detailed writes one row per member, otherwise one row per group with
+    counts and joined member lists. The file is flushed at least every
+    REPORT_FLUSH_SECONDS so a crash loses at most the last few groups.
+    """
+    
+    ROLE_NAMES = {'members': 'Member', 'owners': 'Owner', 'managers': 'Manager'}
+    
+    def __init__(self, csvfile, detailed, role_keys):
+        self.csvfile = csvfile
+        self.writer = csv.writer(csvfile)
+        self.detailed = detailed
+        self.role_keys = list(role_keys)
+        self.groups_written = 0
+        self.entries_written = 0
+        self.last_flush = time.monotonic()
+        
+        header = ['Group Email', 'Group Name']
+        if detailed:
+            header.extend(['Member Email', 'Role'])
+        else:
+            for role_key in self.role_keys:
+                role_name = self.ROLE_NAMES[role_key]
+                header.extend([f'{role_name} Count', f'{role_name}s'])
+        self.writer.writerow(header)
+        
+    def write_group(self, group_email, group_name, group_roles):
+        """Write one group; group_roles maps role keys to lists of emails"""
+        if self.detailed:
+            for role_key in self.role_keys:
+                emails = group_roles.get(role_key, [])
+                role_name = self.ROLE_NAMES[role_key]
+                self.writer.writerows([group_email, group_name, email, role_name] for email in emails)
+                self.entries_written += len(emails)
+        else:
+            row = [group_email, group_name]
+            for role_key in self.role_keys:
+                emails = group_roles.get(role_key, [])
+                row.extend([len(emails), '; '.join(emails)])
+                self.entries_written += len(emails)
+            self.writer.writerow(row)
+            
+        self.groups_written += 1
+        if time.monotonic() - self.last_flush >= REPORT_FLUSH_SECONDS:
+            self.flush()
+            
+    def flush(self):
+        self.csvfile.flush()
+        self.last_flush = time.monotonic()
+
+
+class ReportJournal:
+    """On-disk checkpoint journal for one group report
+    
+    job.json holds the report settings and the captured groups. results.jsonl
+    gets one line per finished group with its role lists, appended and
+    flushed as each fetch completes. A report that stops part way can be
+    resumed from the journal, skipping every group already recorded. The
+    number of recorded groups is kept in job.json whenever the journal is
+    closed, so listing journals never has to read the results.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.spec_file = os.path.join(directory, "job.json")
+        self.results_file = os.path.join(directory, "results.jsonl")
+        self.spec = None
+        self.results = None
+        
+    @classmethod
+    def create(cls, spec, journal_dir=REPORT_JOURNAL_DIR):
+        name = datetime.now().strftime("report-%Y%m%d-%H%M%S-%f")
+        journal = cls(os.path.join(journal_dir, name))
+        os.makedirs(journal.directory, exist_ok=True)
+        journal.spec = dict(spec, created=time.time(), state='running')
+        journal.save_spec()
+        return journal
+        
+    @classmethod
+    def list_journals(cls, journal_dir=REPORT_JOURNAL_DIR):
+        """Return every readable journal, newest first"""
+        journals = []
+        if os.path.isdir(journal_dir):
+            for name in sorted(os.listdir(journal_dir), reverse=True):
+                journal = cls(os.path.join(journal_dir, name))
+                try:
+                    journal.load()
+                except (OSError, ValueError):
+                    continue
+                journals.append(journal)
+        return journals
+        
+    def load(self):
+        with open(self.spec_file, encoding='utf-8') as f:
+            self.spec = json.load(f)
+        return self
+        
+    def save_spec(self):
+        temp_file = self.spec_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.spec, f)
+        os.replace(temp_file, self.spec_file)
+        
+    def set_state(self, state):
+        self.spec['state'] = state
+        self.save_spec()
+        
+    def completed_groups(self):
+        """Yield (group_email, group_roles) for every recorded group"""
+        try:
+            with open(self.results_file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # A line cut short by a crash
+                    yield entry['group'], entry['roles']
+        except FileNotFoundError:
+            return
+            
+    def completed_count(self):
+        """Recorded groups as of the last close; may lag behind after a crash"""
+        return self.spec.get('completed', 0)
+        
+    def open(self, completed=0):
+        """Start appending results after the completed groups already recorded"""
+        self.spec['completed'] = completed
+        self.results = open(self.results_file, 'a', encoding='utf-8')
+        
+    def record(self, group_email, group_roles):
+        self.results.write(json.dumps({'group': group_email, 'roles': group_roles}) + "\n")
+        self.results.flush()
+        self.spec['completed'] += 1
+        
+    def close(self):
+        if self.results:
+            self.results.close()
+            self.results = None
+            self.save_spec()
+            
+    def delete(self):
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class OUIndex:
+    """Tree-ordered index of OU paths for type-to-filter and subtree lookups
+    
+    Paths are kept in tree order, each OU followed by its children, so every
+    subtree is a contiguous slice. Filtering bisects sorted keys: a query
+    matches the start of any word in an OU's name, or the start of the full
+    path when it contains a slash.
+    """
+    
+    def __init__(self, ou_paths=()):
+        self.paths = sorted(set(ou_paths), key=lambda path: path.lower().strip('/').split('/'))
+        self.positions = {path: i for i, path in enumerate(self.paths)}
+        self.depths = [path.strip('/').count('/') for path in self.paths]
+        
+        # subtree_ends[i] is one past the last descendant of paths[i]
+        self.subtree_ends = [len(self.paths)] * len(self.paths)
+        open_paths = []
+        for i, path in enumerate(self.paths):
+            while open_paths and not path.startswith(self.paths[open_paths[-1]] + '/'):
+                self.subtree_ends[open_paths.pop()] = i
+            open_paths.append(i)
+            
+        # Sorted (key, position) pairs split into parallel lists so bisect compares plain strings
+        path_keys = sorted((path.lower(), i) for i, path in enumerate(self.paths))
+        word_keys = sorted(set((word, i) for i, path in enumerate(self.paths)
+                               for word in self.name_words(path.rsplit('/', 1)[-1].lower())))
+        self.path_keys = ([key for key, i in path_keys], array('I', [i for key, i in path_keys]))
+        self.word_keys = ([key for key, i in word_keys], array('I', [i for key, i in word_keys]))
+        
+    @staticmethod
+    def name_words(name):
+        """The whole OU name plus each word in it"""
+        yield name
+        for word in re.split(r'[\s_\-.]+', name):
+            if word:
+                yield word
+                
+    def __len__(self):
+        return len(self.paths)
+        
+    def __contains__(self, path):
+        return path in self.positions
+        
+    def subtree_range(self, path):
+        """Return (start, end) of an OU and all its children in tree order"""
+        start = self.positions[path]
+        return start, self.subtree_ends[start]
+        
+    def filter(self, query):
+        """Return the paths matching a typed query, in tree order"""
+        query = query.strip().lower()
+        if not query:
+            return list(self.paths)
+        if '/' in query:
+            keys, positions = self.path_keys
+            if not query.startswith('/'):
+                query = '/' + query
+        else:
+            keys, positions = self.word_keys
+            
+        start = bisect.bisect_left(keys, query)
+        end = bisect.bisect_left(keys, query + '\uffff', start)
+        paths = self.paths
+        return [paths[i] for i in sorted(set(positions[start:end]))]
+
+
+class GroupReportRecord:
+    """One group in a GroupReportStore; role columns are arrays of member ids"""
+    
+    __slots__ = ('group_email', 'group_name', 'members', 'owners', 'managers')
+    
+    def __init__(self, group_email, group_name):
+        self.group_email = group_email
+        self.group_name = group_name
+        self.members = self.owners = self.managers = array('I')
+
+
+class GroupReportStore:
+    """Compact storage for group report results
+    
+    Each member email is stored once in a shared table and groups refer to
+    it by integer id, so a user who belongs to thousands of groups costs four
+    bytes per membership instead of a string per membership. Records keep
+    the order groups were added in.
+    """
+    
+    ROLE_KEYS = ('members', 'owners', 'managers')
+    
+    def __init__(self):
+        self.emails = []  # member id -> email
+        self.email_ids = {}  # email -> member id
+        self.records = []
+        self.positions = {}  # lowercase group email -> record indexes
+        
+    def __len__(self):
+        return len(self.records)
+        
+    def __iter__(self):
+        return iter(self.records)
+        
+    def member_id(self, email):
+        member_id = self.email_ids.get(email)
+        if member_id is None:
+            member_id = self.email_ids[email] = len(self.emails)
+            self.emails.append(email)
+        return member_id
+        
+    def add_group(self, group_email, group_name):
+        self.positions.setdefault(group_email.lower(), []).append(len(self.records))
+        self.records.append(GroupReportRecord(group_email, group_name))
+        
+    def set_roles(self, group_email, group_roles):
+        """Store a group's role lists, as returned by parse_group_members"""
+        for index in self.positions.get(group_email.lower(), []):
+            record = self.records[index]
+            for role_key in self.ROLE_KEYS:
+                if role_key in group_roles:
+                    setattr(record, role_key, array('I', map(self.member_id, group_roles[role_key])))
+                    
+    def role_emails(self, record, role_key):
+        """Return the member emails a record has for one role"""
+        emails = self.emails
+        return [emails[member_id] for member_id in getattr(record, role_key)]
+        
+    def entry_count(self):
+        return sum(len(record.members) + len(record.owners) + len(record.managers) for record in self.records)
+
+
+class DriveUsageAggregator:
+    """Running drive usage totals built one file listing row at a time
+    
+    Only counters per owner and per MIME type are kept, so memory grows with
+    the number of owners and types, never with the number of files. A file
+    counts as shared externally when anyone can open it or one of its
+    permissions names a domain other than its owner's.
+    """
+    
+    PERMISSION_COLUMN = re.compile(r'^permissions\.(\d+)\.(type|emailaddress|domain)$')
+    
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.shared_external = 0
+        self.owners = {}  # owner -> [files, bytes, files shared externally]
+        self.mime_types = {}  # MIME type -> [files, bytes]
+        self.owner_idx = self.mime_idx = None
+        self.size_idxs = []
+        self.permission_idxs = []
+        
+    def bind(self, headers):
+        """Look up the column positions once from the listing's header"""
+        def index(*names):
+            for name in names:
+                if name in headers:
+                    return headers.index(name)
+            return None
+            
+        self.owner_idx = index('owner', 'owners.0.emailaddress')
+        self.mime_idx = index('mimetype')
+        self.size_idxs = [i for i in (index('quotabytesused'), index('size')) if i is not None]
+        permissions = {}
+        for i, header in enumerate(headers):
+            match = self.PERMISSION_COLUMN.match(header)
+            if match:
+                permissions.setdefault(int(match.group(1)), {})[match.group(2)] = i
+        self.permission_idxs = [permissions[n] for n in sorted(permissions)]
+        
+    def add(self, fields):
+        def field(i):
+            return fields[i].strip() if i is not None and i < len(fields) else ''
+            
+        owner = field(self.owner_idx).lower() or '(unknown owner)'
+        mime_type = field(self.mime_idx) or '(unknown type)'
+        size = 0
+        for i in self.size_idxs:
+            if field(i).isdigit():
+                size = int(field(i))
+                break
+        external = self.is_shared_externally(fields, field, owner.partition('@')[2])
+        
+        self.files += 1
+        self.bytes += size
+        owner_totals = self.owners.get(owner)
+        if owner_totals is None:
+            owner_totals = self.owners[owner] = [0, 0, 0]
+        owner_totals[0] += 1
+        owner_totals[1] += size
+        mime_totals = self.mime_types.get(mime_type)
+        if mime_totals is None:
+            mime_totals = self.mime_types[mime_type] = [0, 0]
+        mime_totals[0] += 1
+        mime_totals[1] += size
+        if external:
+            self.shared_external += 1
+            owner_totals[2] += 1
+            
+    def is_shared_externally(self, fields, field, owner_domain):
+        for columns in self.permission_idxs:
+            permission_type = field(columns.get('type')).lower()
+            if permission_type == 'anyone':
+                return True
+            domain = field(columns.get('domain')).lower() or field(columns.get('emailaddress')).lower().partition('@')[2]
+            if domain and owner_domain and domain != owner_domain:
+                return True
+        return False
+        
+    def top_owners(self, n=DRIVE_USAGE_TOP_N):
+        """[(owner, files, bytes, shared externally)] for the n owners using the most storage"""
+        return [(owner,) + tuple(totals) for owner, totals in
+                heapq.nlargest(n, self.owners.items(), key=lambda item: (item[1][1], item[1][0]))]
+                
+    def top_mime_types(self, n=DRIVE_USAGE_TOP_N):
+        """[(MIME type, files, bytes)] for the n types using the most storage"""
+        return [(mime_type,) + tuple(totals) for mime_type, totals in
+                heapq.nlargest(n, self.mime_types.items(), key=lambda item: (item[1][1], item[1][0]))]
+
+
+class DirectoryMirror:
+    """Local SQLite copy of users, groups, group memberships and OUs
+    
+    The mirror is filled from bulk 'gam print' exports and answers read-only
+    lookups without calling the Google API. sync_state records when each
+    table was last refreshed so views can show how old their data is, and
+    'memberships_full' records when every group's memberships were last
+    refetched rather than only the groups whose member count changed.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            email TEXT PRIMARY KEY,
+            name TEXT,
+            org_unit_path TEXT,
+            suspended TEXT,
+            last_login TEXT
+        );
+        CREATE INDEX IF NOT EXISTS users_org_unit ON users (org_unit_path);
+        CREATE TABLE IF NOT EXISTS groups (
+            email TEXT PRIMARY KEY,
+            name TEXT,
+            description TEXT,
+            direct_members_count INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS memberships (
+            group_email TEXT,
+            member_email TEXT,
+            role TEXT,
+            PRIMARY KEY (group_email, member_email, role)
+        );
+        CREATE INDEX IF NOT EXISTS memberships_member ON memberships (member_email);
+        CREATE TABLE IF NOT EXISTS membership_sync (
+            group_email TEXT PRIMARY KEY,
+            direct_members_count INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS org_units (
+            path TEXT PRIMARY KEY,
+            name TEXT
+        );
+        CREATE TABLE IF NOT EXISTS sync_state (
+            name TEXT PRIMARY KEY,
+            synced_at REAL
+        );
+    """
+    
+    def __init__(self, filename=DIRECTORY_MIRROR_FILE):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+            
+    def _mark_synced(self, name):
+        self.connection.execute("INSERT OR REPLACE INTO sync_state (name, synced_at) VALUES (?, ?)",
+                                (name, time.time()))
+                                
+    def synced_at(self, name):
+        """Time a table was last refreshed, or None if it never has been"""
+        with self.lock:
+            row = self.connection.execute("SELECT synced_at FROM sync_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+        
+    def replace_users(self, users):
+        """Replace every user with (email, name, org_unit_path, suspended, last_login) rows"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM users")
+            self.connection.executemany("INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?)",
+                                        ((u[0].lower(),) + tuple(u[1:]) for u in users))
+            self._mark_synced('users')
+            
+    def replace_org_units(self, org_units):
+        """Replace every OU with (path, name) rows"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM org_units")
+            self.connection.executemany("INSERT OR REPLACE INTO org_units VALUES (?, ?)", org_units)
+            self._mark_synced('org_units')
+            
+    def replace_groups(self, groups):
+        """Replace every group with (email, name, description, direct_members_count) rows
+        
+        Memberships of groups that no longer exist are removed.
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM groups")
+            self.connection.executemany("INSERT OR REPLACE INTO groups VALUES (?, ?, ?, ?)",
+                                        ((g[0].lower(),) + tuple(g[1:]) for g in groups))
+            self.connection.execute("DELETE FROM memberships WHERE group_email NOT IN (SELECT email FROM groups)")
+            self.connection.execute("DELETE FROM membership_sync WHERE group_email NOT IN (SELECT email FROM groups)")
+            self._mark_synced('groups')
+            
+    def stale_membership_groups(self):
+        """Groups whose memberships were never fetched or whose member count has changed since
+        
+        Only the direct member count is compared, so swapping one member for
+        another or changing a member's role is not detected; those changes
+        are picked up by the next full membership refresh.
+        """
+        with self.lock:
+            return [row[0] for row in self.connection.execute(
+                "SELECT g.email FROM groups g LEFT JOIN membership_sync s ON s.group_email = g.email "
+                "WHERE s.group_email IS NULL OR s.direct_members_count IS NOT g.direct_members_count "
+                "ORDER BY g.email")]
+                
+    def replace_memberships(self, group_roles):
+        """Replace the memberships of the given groups
+        
+        group_roles maps a group email to {'members': [...], 'owners': [...], 'managers': [...]}.
+        """
+        role_names = {'members': 'MEMBER', 'owners': 'OWNER', 'managers': 'MANAGER'}
+        with self.lock, self.connection:
+            for group_email, roles in group_roles.items():
+                group_email = group_email.lower()
+                self.connection.execute("DELETE FROM memberships WHERE group_email = ?", (group_email,))
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO memberships VALUES (?, ?, ?)",
+                    ((group_email, email.lower(), role_names[role_key])
+                     for role_key, emails in roles.items() for email in emails))
+                     
+                # Remember the member count these memberships correspond to
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO membership_sync "
+                    "SELECT email, direct_members_count FROM groups WHERE email = ?", (group_email,))
+            self._mark_synced('memberships')
+            
+    def mark_full_membership_sync(self):
+        """Record that every group's memberships have just been refetched"""
+        with self.lock, self.connection:
+            self._mark_synced('memberships_full')
+            
+    def user(self, email):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT email, name, org_unit_path, suspended, last_login FROM users WHERE email = ?",
+                (email.lower(),)).fetchone()
+                
+    def users_in_ou(self, ou_path, include_children=False):
+        with self.lock:
+            if include_children:
+                # Compare the prefix directly; LIKE would treat '_' and '%' in OU names as wildcards
+                prefix = ou_path.rstrip('/') + '/'
+                return self.connection.execute(
+                    "SELECT email, name, org_unit_path, suspended, last_login FROM users "
+                    "WHERE org_unit_path = ? OR substr(org_unit_path, 1, ?) = ? ORDER BY email",
+                    (ou_path, len(prefix), prefix)).fetchall()
+            return self.connection.execute(
+                "SELECT email, name, org_unit_path, suspended, last_login FROM users "
+                "WHERE org_unit_path = ? ORDER BY email", (ou_path,)).fetchall()
+                
+    def group_members(self, group_email):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT member_email, role FROM memberships WHERE group_email = ? ORDER BY role, member_email",
+                (group_email.lower(),)).fetchall()
+                
+    def groups_for_member(self, member_email):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT group_email, role FROM memberships WHERE member_email = ? ORDER BY group_email",
+                (member_email.lower(),)).fetchall()
+                
+    def group_emails(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT email FROM groups ORDER BY email")]
+
+
+class GroupSnapshot:
+    """Member counts and role lists of each group as of the last delta refresh
+    
+    Kept in SQLite and read and written one group at a time, so a delta
+    refresh never holds the whole snapshot in memory. Changes made during a
+    refresh are only kept once commit() is called; closing without it
+    leaves the previous snapshot as it was.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS groups (
+            email TEXT PRIMARY KEY,
+            direct_members_count INTEGER,
+            roles TEXT
+        );
+    """
+    
+    def __init__(self, filename=GROUP_SNAPSHOT_FILE):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.executescript(self.SCHEMA)
+            
+    def get(self, group_email):
+        """Return {'count': n, 'roles': {role_key: [emails]}} for a group, or None"""
+        with self.lock:
+            row = self.connection.execute("SELECT direct_members_count, roles FROM groups WHERE email = ?",
+                                          (group_email.lower(),)).fetchone()
+        return {'count': row[0], 'roles': json.loads(row[1])} if row else None
+        
+    def put(self, group_email, count, roles):
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO groups VALUES (?, ?, ?)",
+                                    (group_email.lower(), count, json.dumps(roles)))
+                                    
+    def commit(self):
+        with self.lock:
+            self.connection.commit()
+            
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class UIUpdateQueue:
+    """Thread-safe channel for GUI updates, drained by the Tk main loop on a fixed tick
+    
+    Worker threads post callables and output text here instead of calling
+    root.after themselves. Updates posted with a key replace any pending
+    update with the same key, so a flood of progress messages collapses into
+    the latest one per tick. Output text posted between two calls is joined
+    and written in a single insert.
+    """
+    
+    def __init__(self, root, write_output, interval_ms=UI_TICK_MS):
+        self.root = root
+        self.write_output = write_output
+        self.interval_ms = interval_ms
+        self.lock = threading.Lock()
+        self.pending = []  # Ordered ('call', func) and ('text', [chunks]) entries
+        self.latest = {}  # Coalesced updates by key, applied after the ordered entries
+        
+    def start(self):
+        self.root.after(self.interval_ms, self.drain)
+        
+    def post(self, func, key=None):
+        """Queue func to run on the main thread; keyed updates only keep the newest"""
+        with self.lock:
+            if key is None:
+                self.pending.append(('call', func))
+            else:
+                self.latest.pop(key, None)
+                self.latest[key] = func
+                
+    def post_output(self, text):
+        """Queue text for the Output tab"""
+        with self.lock:
+            if self.pending and self.pending[-1][0] == 'text':
+                self.pending[-1][1].append(text)
+            else:
+                self.pending.append(('text', [text]))
+                
+    def drain(self):
+        """Apply everything queued since the last tick, then schedule the next one"""
+        with self.lock:
+            pending, self.pending = self.pending, []
+            latest, self.latest = self.latest, {}
+            
+        for kind, item in pending:
+            if kind == 'text':
+                self.apply(self.write_output, ''.join(item))
+            else:
+                self.apply(item)
+                
+        for func in latest.values():
+            self.apply(func)
+            
+        self.root.after(self.interval_ms, self.drain)
+        
+    def apply(self, func, *args):
+        """Run one update; a failure is reported like any Tk callback error but does not stop the queue"""
+        try:
+            func(*args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+
+class GAMCSVReader:
+    """Stream the CSV table out of GAM output
+    
+    GAM prints progress lines such as "Getting members for..." ahead of the
+    CSV header. The reader skips those until is_header accepts a line, parses
+    that header once and reads everything after it with a single csv.reader,
+    so quoted fields with commas or newlines in them come through intact.
+    Column names are stripped and lowercased. With has_header=False the
+    first accepted line is returned as data instead.
+    """
+    
+    STATUS_PREFIXES = ('Getting', 'Got')
+    
+    def __init__(self, lines, is_header=None, has_header=True):
+        if isinstance(lines, str):
+            lines = io.StringIO(lines)
+        self.lines = iter(lines)
+        self.is_header = is_header
+        self.has_header = has_header
+        self.headers = None
+        self.lines_skipped = 0
+        self.reader = None
+        
+    def find_header(self):
+        """Consume lines up to the header; returns False if there is none"""
+        if self.reader is not None:
+            return True
+        for line in self.lines:
+            if line.strip() and not line.startswith(self.STATUS_PREFIXES):
+                if self.is_header is None or self.is_header(line):
+                    break
+            self.lines_skipped += 1
+        else:
+            return False
+            
+        if self.has_header:
+            self.headers = [h.strip().lower() for h in next(csv.reader([line]))]
+            self.reader = csv.reader(self.lines)
+        else:
+            self.headers = []
+            self.reader = csv.reader(itertools.chain([line], self.lines))
+        return True
+        
+    def column(self, *names, default=None):
+        """Index of the first of names found in the header"""
+        for name in names:
+            if self.headers and name in self.headers:
+                return self.headers.index(name)
+        return default
+        
+    @property
+    def line_num(self):
+        return self.reader.line_num if self.reader else 0
+        
+    def rows(self):
+        """Yield the field lists after the header, skipping blank lines"""
+        if not self.find_header():
+            return
+        for fields in self.reader:
+            if any(field.strip() for field in fields):
+                yield fields
+                
+    def records(self):
+        """Yield each row as a dict keyed by column name"""
+        for fields in self.rows():
+            yield dict(zip(self.headers, fields))
+
+
+class GAMBatchRunner:
+    """Run many GAM commands inside one GAM process using 'gam batch'
+    
+    Every command in the batch file redirects its own stdout and stderr to a
+    numbered file, so the combined run can be split back into one result per
+    command afterwards. The batch runs with showcmds, which makes GAM print an
+    End line with each command's return code; that code decides whether the
+    command failed, never the text it wrote.
+    """
+    
+    END_LINE = re.compile(r',End,(-?\d+),(.*)$')
+    
+    def __init__(self, gam_command="gam", run_process=None):
+        self.gam_command = gam_command
+        self.run_process = run_process  # Job.run_process when running under the scheduler
+        
+    def run(self, commands, timeout=None):
+        """Run the commands and return one CompletedProcess per command, in order"""
+        with tempfile.TemporaryDirectory(prefix="gam_batch_") as work_dir:
+            batch_file = os.path.join(work_dir, "commands.gam")
+            with open(batch_file, 'w', encoding='utf-8') as f:
+                for i, command in enumerate(commands):
+                    args = command.strip()
+                    if args.startswith("gam "):
+                        args = args[4:]
+                    out_file = os.path.join(work_dir, f"{i}.out")
+                    err_file = os.path.join(work_dir, f"{i}.err")
+                    f.write(f'gam redirect stdout "{out_file}" redirect stderr "{err_file}" {args}\n')
+                    
+            batch_command = f'{self.gam_command} batch "{batch_file}" showcmds'
+            if self.run_process:
+                batch = self.run_process(batch_command, timeout=timeout)
+            else:
+                batch = subprocess.run(batch_command, shell=True, capture_output=True, text=True, timeout=timeout)
+            returncodes = self._returncodes(batch, work_dir)
+            
+            results = []
+            for i, command in enumerate(commands):
+                stdout = self._read(os.path.join(work_dir, f"{i}.out"))
+                stderr = self._read(os.path.join(work_dir, f"{i}.err"))
+                if stdout is None and stderr is None:
+                    # The command never ran, report the batch failure against it
+                    results.append(subprocess.CompletedProcess(command, batch.returncode or 1, "", batch.stderr))
+                    continue
+                    
+                # Without an End line for the command, fall back to the status of the whole batch
+                returncode = returncodes.get(i, batch.returncode)
+                results.append(subprocess.CompletedProcess(command, returncode, stdout or "", stderr or ""))
+                
+            return results
+            
+    def _returncodes(self, batch, work_dir):
+        """Map command index -> return code from the End lines showcmds prints"""
+        command_index = re.compile(re.escape(work_dir) + r'[\\/](\d+)\.out')
+        returncodes = {}
+        for line in (batch.stdout or "").splitlines() + (batch.stderr or "").splitlines():
+            end = self.END_LINE.search(line)
+            if end:
+                index = command_index.search(end.group(2))
+                if index:
+                    returncodes[int(index.group(1))] = int(end.group(1))
+        return returncodes
+        
+    def _read(self, path):
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8', errors='replace') as f:
+            return f.read()
+
+
+class VirtualListbox(ttk.Frame):
+    """Listbox that keeps its rows in Python and only renders the visible ones
+    
+    Rows can be any objects; format_row turns one into display text when it
+    scrolls into view, so set_rows is constant time however many rows there
+    are. Filtering and sorting only rebuild a list of row positions. Rows
+    are replaced with set_rows or added with append_rows. The Listbox-style
+    methods (curselection, selection_set, see, get, size) take and return
+    positions in the current filtered and sorted view, and selections
+    survive filtering and sorting.
+    """
+    
+    def __init__(self, parent, selectmode=tk.BROWSE, format_row=str, **listbox_options):
+        super().__init__(parent)
+        self.selectmode = selectmode
+        self.format_row = format_row
+        self.rows = []
+        self.view = None  # Row positions after filter and sort, None for every row in order
+        self.filter_func = None
+        self.sort_key = None
+        self.sort_reverse = False
+        self.selected = set()  # Selected row positions
+        self.top = 0
+        self.visible_rows = int(listbox_options.get('height', 10))
+        self.render_pending = False
+        
+        self.listbox = tk.Listbox(self, selectmode=selectmode, exportselection=False, **listbox_options)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.listbox.pack(side='left', fill='both', expand=True)
+        
+        # Selection has to be recorded before any handler bound by the caller runs
+        self.listbox.bind('<<ListboxSelect>>', self.sync_selection)
+        self.listbox.bind('<ButtonPress-1>', self.on_click)
+        self.listbox.bind('<Configure>', self.on_resize)
+        self.listbox.bind('<MouseWheel>', lambda event: self.scroll(-1 if event.delta > 0 else 1, 'units'))
+        self.listbox.bind('<Button-4>', lambda event: self.scroll(-1, 'units'))
+        self.listbox.bind('<Button-5>', lambda event: self.scroll(1, 'units'))
+        self.listbox.bind('<Up>', lambda event: self.move_selection(-1))
+        self.listbox.bind('<Down>', lambda event: self.move_selection(1))
+        
+    def bind(self, sequence=None, func=None, add=None):
+        """Bind on the inner listbox, after the selection bookkeeping"""
+        return self.listbox.bind(sequence, func, '+')
+        
+    def xview(self, *args):
+        return self.listbox.xview(*args)
+        
+    def selected_rows(self):
+        """Return the selected row objects in view order"""
+        return [self.rows[self.row_at(index)] for index in self.curselection()]
+        
+    # Data
+    
+    def set_rows(self, rows):
+        """Show a new list of rows; the list is used as is, not copied"""
+        self.rows = rows
+        self.selected = set()
+        self.top = 0
+        self.apply_view()
+        
+    def set_filter(self, filter_func):
+        """Only show rows for which filter_func(row) is true; None shows every row"""
+        self.filter_func = filter_func
+        self.top = 0
+        self.apply_view()
+        
+    def sort(self, key=None, reverse=False):
+        """Order the view by key(row); key=None restores the original order"""
+        self.sort_key = key
+        self.sort_reverse = reverse
+        self.apply_view()
+        
+    def apply_view(self):
+        if self.filter_func is None and self.sort_key is None:
+            self.view = None
+        else:
+            rows = self.rows
+            positions = range(len(rows))
+            if self.filter_func is not None:
+                positions = [i for i in positions if self.filter_func(rows[i])]
+            if self.sort_key is not None:
+                positions = sorted(positions, key=lambda i: self.sort_key(rows[i]), reverse=self.sort_reverse)
+            self.view = list(positions)
+        self.schedule_render()
+        
+    def row_at(self, index):
+        return index if self.view is None else self.view[index]
+        
+    def view_index(self, index):
+        if index == tk.END:
+            return self.size() - 1
+        return int(index)
+        
+    def size(self):
+        return len(self.rows) if self.view is None else len(self.view)
+        
+    def get(self, index):
+        return self.format_row(self.rows[self.row_at(self.view_index(index))])
+        
+    def append_rows(self, rows):
+        """Add rows at the end, keeping the current filter and sort
+        
+        Only the new rows are tested against the filter, so rows can be
+        streamed in batches without rebuilding the whole view each time.
+        """
+        position = len(self.rows)
+        self.rows.extend(rows)
+        if self.view is not None:
+            if self.sort_key is not None:
+                self.apply_view()
+                return
+            self.view.extend(i for i in range(position, len(self.rows)) if self.filter_func(self.rows[i]))
+        self.schedule_render()
+        
+    # Selection
+    
+    def curselection(self):
+        if self.view is None:
+            return tuple(sorted(self.selected))
+        return tuple(index for index, row in enumerate(self.view) if row in self.selected)
+        
+    def selection_set(self, first, last=None):
+        first = self.view_index(first)
+        last = first if last is None else self.view_index(last)
+        if self.selectmode in (tk.BROWSE, tk.SINGLE):
+            self.selected = set()
+            first = last
+        self.selected.update(self.row_at(i) for i in range(first, last + 1))
+        self.schedule_render()
+        
+    def selection_clear(self, first, last=None):
+        first = self.view_index(first)
+        last = first if last is None else self.view_index(last)
+        if first <= 0 and last >= self.size() - 1:
+            self.selected = set()
+        else:
+            self.selected.difference_update(self.row_at(i) for i in range(first, last + 1))
+        self.schedule_render()
+        
+    def sync_selection(self, event=None):
+        """Copy the selection of the rendered rows into the full selection"""
+        visible = set(self.listbox.curselection())
+        if self.selectmode in (tk.BROWSE, tk.SINGLE) and visible:
+            self.selected = set()
+        for offset in range(min(self.visible_rows, self.size() - self.top)):
+            row = self.row_at(self.top + offset)
+            if offset in visible:
+                self.selected.add(row)
+            else:
+                self.selected.discard(row)
+                
+    def on_click(self, event):
+        # A plain click replaces the whole selection, including rows scrolled out of view
+        if not event.state & 0x0005:  # Shift or Control held
+            self.selected = set()
+            
+    def move_selection(self, step):
+        """Keyboard navigation that can move past the rendered rows"""
+        selection = self.curselection()
+        if not self.size():
+            return "break"
+        index = min(max(0, (selection[0] if step < 0 else selection[-1]) + step if selection else 0),
+                    self.size() - 1)
+        self.selection_clear(0, tk.END)
+        self.selection_set(index)
+        self.see(index)
+        self.render()
+        self.listbox.event_generate('<<ListboxSelect>>')
+        return "break"
+        
+    # Scrolling and rendering
+    
+    def see(self, index):
+        index = self.view_index(index)
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.visible_rows:
+            self.top = index - self.visible_rows + 1
+        self.schedule_render()
+        
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', count, 'units' or 'pages')"""
+        if args and args[0] == 'moveto':
+            self.top = int(float(args[1]) * self.size())
+            self.render()
+        elif args and args[0] == 'scroll':
+            self.scroll(int(args[1]), args[2])
+            
+    def scroll(self, count, what):
+        self.top += count * (self.visible_rows if what == 'pages' else 1)
+        self.render()
+        return "break"
+        
+    def on_resize(self, event):
+        line_height = max(1, tkfont.Font(font=self.listbox['font']).metrics('linespace'))
+        visible_rows = max(1, event.height // line_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.schedule_render()
+            
+    def schedule_render(self):
+        # Many selection or data changes in one event only render once
+        if not self.render_pending:
+            self.render_pending = True
+            self.after_idle(self.render)
+            
+    def render(self):
+        self.render_pending = False
+        total = self.size()
+        self.top = max(0, min(self.top, total - self.visible_rows))
+        end = min(total, self.top + self.visible_rows)
+        
+        self.listbox.delete(0, tk.END)
+        rows = [self.rows[self.row_at(i)] for i in range(self.top, end)]
+        if rows:
+            self.listbox.insert(tk.END, *map(self.format_row, rows))
+        for offset in range(end - self.top):
+            if self.row_at(self.top + offset) in self.selected:
+                self.listbox.selection_set(offset)
+                
+        if total:
+            self.scrollbar.set(self.top / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+
 
 class GAMSimplifiedGUI:
     def __init__(self, root):
@@ -18,12 +1763,19 @@ class GAMSimplifiedGUI:
         # Initialize data storage
         self.organizational_units = []
         self.formatted_ous = []  # Store formatted display versions of OUs
+        self.available_ou_paths = []  # OU paths in the order shown in available_ous_listbox
+        self.ou_index = OUIndex()  # Tree order, depth and filter index for the loaded OUs
         self.is_loading_ous = True
         self.parsed_events = []  # Store parsed calendar events
         self.captured_groups = []  # Store captured groups for reporting
-        self.group_report_data = []  # Store generated report data
+        self.group_report_data = GroupReportStore()  # Store generated report data
+        self.group_change_report = []  # Membership changes found by the last delta refresh
         self.selected_ous = []  # Store multiple selected OUs
-        self.user_report_data = []  # Store user report data
+        self.user_report_file = None  # Spool file of the last user report
+        self.user_report_rows = 0
+        self.signout_results = []  # (email, result, error, completed) rows of the last bulk sign out
+        self.drive_transfers = OrderedDict()  # Queued, running and finished transfers by ID
+        self.transfer_ids = itertools.count(1)
         
         # Create main style
         self.style = ttk.Style()
@@ -33,8 +1785,36 @@ class GAMSimplifiedGUI:
         self.style.configure('Title.TLabel', font=('Arial', 16, 'bold'), background='#f0f0f0')
         self.style.configure('Header.TLabel', font=('Arial', 12, 'bold'), background='#f0f0f0')
         
+        # Group membership lookups are cached in memory and optionally on disk
+        self.membership_cache = MembershipCache()
+        self.cache_save_lock = threading.Lock()  # One cache write at a time
+        if os.path.exists(MEMBERSHIP_CACHE_FILE):
+            try:
+                self.membership_cache.load(MEMBERSHIP_CACHE_FILE)
+            except (OSError, ValueError, TypeError):
+                pass
+                
+        # Every membership fetch also feeds the member -> groups index
+        self.membership_index = MembershipIndex()
+        for (group_email, role), (fetched_at, emails) in list(self.membership_cache.entries.items()):
+            self.membership_index.set_role(group_email, role, emails, fetched_at)
+            
         self.setup_gui()
         
+        # Worker threads hand GUI work to this queue; the main loop applies it every tick
+        self.ui_updates = UIUpdateQueue(self.root, self.write_streamed_output)
+        self.ui_updates.start()
+        
+        self.directory_mirror = None  # Opened on first use
+        self.update_mirror_status()
+        
+        # All GAM work runs through the scheduler so it can be prioritised, limited and cancelled
+        self.job_scheduler = JobScheduler(
+            on_change=lambda job: self.ui_updates.post(self.refresh_jobs_panel, key='jobs_panel'))
+        self.report_job = None
+        self.active_journals = {}  # Journal directory -> Job of reports started in this session
+        self.refresh_report_journals()
+        
         # Load organizational units on startup
         self.load_organizational_units()
         
@@ -55,12 +1835,21 @@ class GAMSimplifiedGUI:
         self.create_calendar_management_tab()
         self.create_custom_command_tab()
         self.create_output_tab()
+        self.create_jobs_tab()
         
         # Status bar
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side='bottom', fill='x')
+        
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
-        status_bar = ttk.Label(self.root, textvariable=self.status_var, relief='sunken')
-        status_bar.pack(side='bottom', fill='x')
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, relief='sunken')
+        status_bar.pack(side='left', fill='x', expand=True)
+        
+        self.cache_status_var = tk.StringVar()
+        cache_status_bar = ttk.Label(status_frame, textvariable=self.cache_status_var, relief='sunken')
+        cache_status_bar.pack(side='right')
+        self.update_cache_status()
         
     def create_user_management_tab(self):
         # User Management Tab
@@ -77,13 +1866,17 @@ class GAMSimplifiedGUI:
         self.user_email_entry.grid(row=0, column=1, padx=5, pady=2)
         
         ttk.Button(user_ops_frame, text="Get User Info", 
-                  command=lambda: self.run_gam_command(f"gam info user {self.user_email_entry.get()}")).grid(row=0, column=2, padx=5)
+                  command=lambda: self.get_user_info()).grid(row=0, column=2, padx=5)
+                  
+        ttk.Button(user_ops_frame, text="Which Groups?",
+                  command=lambda: self.show_user_groups()).grid(row=0, column=3, padx=5)
         
         # List users in OU - Single Selection
         ttk.Label(user_ops_frame, text="Organizational Unit:").grid(row=1, column=0, sticky='w', padx=5)
-        self.ou_combobox = ttk.Combobox(user_ops_frame, width=45, state="readonly", font=('Arial', 9))
+        self.ou_combobox = ttk.Combobox(user_ops_frame, width=45, font=('Arial', 9))
         self.ou_combobox.grid(row=1, column=1, padx=5, pady=2)
         self.ou_combobox.set("🔄 Loading organizational units...")
+        self.bind_ou_filter(self.ou_combobox)
         
         ttk.Button(user_ops_frame, text="List Users in OU", 
                   command=lambda: self.list_users_in_single_ou()).grid(row=1, column=2, padx=5)
@@ -98,6 +1891,60 @@ class GAMSimplifiedGUI:
         
         ttk.Button(user_ops_frame, text="Force Sign Out", 
                   command=lambda: self.force_sign_out_user()).grid(row=2, column=2, padx=5)
+                  
+        # Bulk force sign out for an OU, group or list of users
+        ttk.Label(user_ops_frame, text="Bulk Sign Out:").grid(row=3, column=0, sticky='w', padx=5)
+        
+        signout_frame = ttk.Frame(user_ops_frame)
+        signout_frame.grid(row=3, column=1, columnspan=3, sticky='w', padx=5, pady=2)
+        
+        self.signout_source = ttk.Combobox(signout_frame, values=["OU", "Group", "CSV File", "Pasted List"],
+                                           width=10, state='readonly')
+        self.signout_source.set("OU")
+        self.signout_source.pack(side='left')
+        self.signout_source.bind('<<ComboboxSelected>>', lambda event: self.update_signout_source())
+        
+        self.signout_target_entry = ttk.Entry(signout_frame, width=30)
+        self.signout_target_entry.pack(side='left', padx=5)
+        
+        ttk.Label(signout_frame, text="Per Second:").pack(side='left')
+        self.signout_rate = tk.IntVar(value=DEFAULT_SIGNOUT_RATE)
+        ttk.Spinbox(signout_frame, from_=1, to=50, width=4,
+                   textvariable=self.signout_rate).pack(side='left', padx=5)
+                   
+        ttk.Button(signout_frame, text="Sign Out All",
+                  command=lambda: self.bulk_sign_out_users()).pack(side='left', padx=5)
+                  
+        ttk.Button(signout_frame, text="Export Results",
+                  command=lambda: self.save_sign_out_results()).pack(side='left')
+                  
+        signout_details = ttk.Frame(user_ops_frame)
+        signout_details.grid(row=4, column=1, columnspan=3, sticky='w', padx=5)
+        
+        self.signout_status_label = ttk.Label(signout_details, text="", font=('Arial', 9, 'italic'))
+        self.signout_status_label.pack(side='bottom', anchor='w')
+        
+        # A pasted list usually spans many lines, so it gets its own box instead of the one-line entry
+        self.signout_paste_text = scrolledtext.ScrolledText(signout_details, height=4, width=50, wrap=tk.WORD)
+        
+        # Local directory mirror
+        ttk.Label(user_ops_frame, text="Local Mirror:").grid(row=5, column=0, sticky='w', padx=5)
+        
+        mirror_frame = ttk.Frame(user_ops_frame)
+        mirror_frame.grid(row=5, column=1, columnspan=3, sticky='w', padx=5, pady=2)
+        
+        self.use_directory_mirror = tk.BooleanVar(value=False)
+        ttk.Checkbutton(mirror_frame, text="Answer lookups from local mirror",
+                       variable=self.use_directory_mirror).pack(side='left')
+                       
+        ttk.Button(mirror_frame, text="Sync Changes",
+                  command=lambda: self.sync_directory_mirror()).pack(side='left', padx=5)
+                  
+        ttk.Button(mirror_frame, text="Full Sync",
+                  command=lambda: self.sync_directory_mirror(full=True)).pack(side='left', padx=5)
+                  
+        self.user_mirror_label = ttk.Label(mirror_frame, text="", font=('Arial', 9, 'italic'))
+        self.user_mirror_label.pack(side='left', padx=5)
         
         # Multi-OU Selection Section
         multi_ou_frame = ttk.LabelFrame(user_frame, text="Multi-OU User Management", padding=10)
@@ -111,17 +1958,22 @@ class GAMSimplifiedGUI:
         available_frame = ttk.Frame(selection_frame)
         available_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
         
-        ttk.Label(available_frame, text="Available OUs:").pack(anchor='w')
+        available_header = ttk.Frame(available_frame)
+        available_header.pack(fill='x')
+        
+        ttk.Label(available_header, text="Available OUs:").pack(side='left')
+        
+        # Typing narrows the list to matching OUs
+        self.available_ou_filter = ttk.Entry(available_header, width=20)
+        self.available_ou_filter.pack(side='right')
+        self.available_ou_filter.bind('<KeyRelease>', lambda event: self.show_available_ous())
+        ttk.Label(available_header, text="Filter:").pack(side='right', padx=(0, 2))
         
         available_listbox_frame = ttk.Frame(available_frame)
         available_listbox_frame.pack(fill='both', expand=True, pady=(2, 0))
         
-        self.available_ous_listbox = tk.Listbox(available_listbox_frame, height=6, selectmode=tk.EXTENDED)
-        ou_scrollbar = ttk.Scrollbar(available_listbox_frame, orient='vertical', command=self.available_ous_listbox.yview)
-        self.available_ous_listbox.configure(yscrollcommand=ou_scrollbar.set)
-        
+        self.available_ous_listbox = VirtualListbox(available_listbox_frame, height=6, selectmode=tk.EXTENDED)
         self.available_ous_listbox.pack(side='left', fill='both', expand=True)
-        ou_scrollbar.pack(side='right', fill='y')
         
         # Control buttons
         control_frame = ttk.Frame(selection_frame)
@@ -132,7 +1984,9 @@ class GAMSimplifiedGUI:
         ttk.Button(control_frame, text="<< Remove", 
                   command=lambda: self.remove_selected_ous()).pack(pady=(0, 5))
         ttk.Button(control_frame, text="Clear All", 
-                  command=lambda: self.clear_selected_ous()).pack()
+                  command=lambda: self.clear_selected_ous()).pack(pady=(0, 5))
+        ttk.Button(control_frame, text="Select Sub-OUs",
+                  command=lambda: self.select_ou_subtrees()).pack()
         
         # Selected OUs
         selected_frame = ttk.Frame(selection_frame)
@@ -143,12 +1997,8 @@ class GAMSimplifiedGUI:
         selected_listbox_frame = ttk.Frame(selected_frame)
         selected_listbox_frame.pack(fill='both', expand=True, pady=(2, 0))
         
-        self.selected_ous_listbox = tk.Listbox(selected_listbox_frame, height=6, selectmode=tk.EXTENDED)
-        selected_scrollbar = ttk.Scrollbar(selected_listbox_frame, orient='vertical', command=self.selected_ous_listbox.yview)
-        self.selected_ous_listbox.configure(yscrollcommand=selected_scrollbar.set)
-        
+        self.selected_ous_listbox = VirtualListbox(selected_listbox_frame, height=6, selectmode=tk.EXTENDED)
         self.selected_ous_listbox.pack(side='left', fill='both', expand=True)
-        selected_scrollbar.pack(side='right', fill='y')
         
         # Multi-OU actions
         multi_action_frame = ttk.Frame(multi_ou_frame)
@@ -156,6 +2006,11 @@ class GAMSimplifiedGUI:
         
         ttk.Button(multi_action_frame, text="List Users from Selected OUs", 
                   command=lambda: self.list_users_from_multiple_ous()).pack(side='left', padx=(0, 10))
+                  
+        # Listing an OU already includes its sub-OUs, so nested selections can share one query
+        self.collapse_nested_ous = tk.BooleanVar(value=True)
+        ttk.Checkbutton(multi_action_frame, text="Collapse nested OUs into one query",
+                       variable=self.collapse_nested_ous).pack(side='left', padx=(0, 10))
         
         self.selected_ous_count = ttk.Label(multi_action_frame, text="0 OUs selected", font=('Arial', 9, 'italic'))
         self.selected_ous_count.pack(side='left')
@@ -213,16 +2068,88 @@ class GAMSimplifiedGUI:
         self.to_user_entry = ttk.Entry(drive_ops_frame, width=30)
         self.to_user_entry.grid(row=0, column=3, padx=5, pady=2)
         
-        ttk.Button(drive_ops_frame, text="Transfer All Files", 
+        ttk.Button(drive_ops_frame, text="Queue Transfer",
                   command=lambda: self.transfer_drive_ownership()).grid(row=0, column=4, padx=5)
         
         # Show drive usage
-        ttk.Label(drive_ops_frame, text="User for Drive Usage:").grid(row=1, column=0, sticky='w', padx=5)
+        ttk.Label(drive_ops_frame, text="User or OU for Drive Usage:").grid(row=1, column=0, sticky='w', padx=5)
         self.drive_usage_entry = ttk.Entry(drive_ops_frame, width=30)
         self.drive_usage_entry.grid(row=1, column=1, padx=5, pady=2)
         
+        self.drive_usage_scope = ttk.Combobox(drive_ops_frame, values=["User", "OU"], width=8, state='readonly')
+        self.drive_usage_scope.set("User")
+        self.drive_usage_scope.grid(row=1, column=2, padx=5)
+        
         ttk.Button(drive_ops_frame, text="Show Drive Usage", 
-                  command=lambda: self.run_gam_command(f"gam user {self.drive_usage_entry.get()} show drivefileacl")).grid(row=1, column=2, padx=5)
+                  command=lambda: self.analyze_drive_usage()).grid(row=1, column=3, padx=5)
+                  
+        ttk.Button(drive_ops_frame, text="Show File ACLs",
+                  command=lambda: self.run_gam_command(f"gam user {self.drive_usage_entry.get()} show drivefileacl")).grid(row=1, column=4, padx=5)
+                  
+        # Drive usage totals, updated while the file listing streams in
+        usage_frame = ttk.LabelFrame(drive_frame, text="Drive Usage", padding=10)
+        usage_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.drive_usage_summary = ttk.Label(usage_frame, text="Choose a user or OU and click Show Drive Usage",
+                                             font=('Arial', 9, 'italic'))
+        self.drive_usage_summary.pack(anchor='w', pady=(0, 5))
+        
+        usage_tables = ttk.Frame(usage_frame)
+        usage_tables.pack(fill='both', expand=True)
+        
+        columns = ('owner', 'files', 'size', 'external')
+        self.usage_owner_tree = ttk.Treeview(usage_tables, columns=columns, show='headings', height=8)
+        headings = {'owner': ("Owner", 220), 'files': ("Files", 70), 'size': ("Size", 80),
+                    'external': ("Shared Externally", 110)}
+        for column in columns:
+            text, width = headings[column]
+            self.usage_owner_tree.heading(column, text=text)
+            self.usage_owner_tree.column(column, width=width, anchor='w')
+        self.usage_owner_tree.pack(side='left', fill='both', expand=True, padx=(0, 5))
+        
+        columns = ('mimetype', 'files', 'size')
+        self.usage_type_tree = ttk.Treeview(usage_tables, columns=columns, show='headings', height=8)
+        headings = {'mimetype': ("File Type", 260), 'files': ("Files", 70), 'size': ("Size", 80)}
+        for column in columns:
+            text, width = headings[column]
+            self.usage_type_tree.heading(column, text=text)
+            self.usage_type_tree.column(column, width=width, anchor='w')
+        self.usage_type_tree.pack(side='left', fill='both', expand=True)
+                  
+        # Transfers can run for hours, so they are queued and run without a timeout
+        transfer_frame = ttk.LabelFrame(drive_frame, text="Transfer Queue", padding=10)
+        transfer_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        columns = ('from', 'to', 'state', 'progress', 'started', 'duration')
+        self.transfers_tree = ttk.Treeview(transfer_frame, columns=columns, show='headings', height=8)
+        headings = {'from': ("From User", 200), 'to': ("To User", 200), 'state': ("State", 90),
+                    'progress': ("Progress", 300), 'started': ("Started", 80), 'duration': ("Duration", 80)}
+        for column in columns:
+            text, width = headings[column]
+            self.transfers_tree.heading(column, text=text)
+            self.transfers_tree.column(column, width=width, anchor='w')
+        self.transfers_tree.pack(fill='both', expand=True)
+        
+        transfer_buttons = ttk.Frame(transfer_frame)
+        transfer_buttons.pack(fill='x', pady=5)
+        
+        ttk.Label(transfer_buttons, text="Concurrent Transfers:").pack(side='left', padx=5)
+        self.transfer_concurrency = tk.IntVar(value=MAX_CONCURRENT_TRANSFERS)
+        ttk.Spinbox(transfer_buttons, from_=1, to=MAX_TRANSFER_LIMIT, width=4,
+                   textvariable=self.transfer_concurrency).pack(side='left')
+                   
+        ttk.Button(transfer_buttons, text="Queue from CSV...",
+                  command=lambda: self.queue_transfers_from_csv()).pack(side='left', padx=5)
+                  
+        ttk.Button(transfer_buttons, text="⏹ Cancel Selected",
+                  command=lambda: self.cancel_selected_transfers()).pack(side='left', padx=5)
+                  
+        ttk.Button(transfer_buttons, text="Clear Finished",
+                  command=lambda: self.clear_finished_transfers()).pack(side='left', padx=5)
+                  
+        self.transfer_summary_label = ttk.Label(transfer_buttons, text=f"Results are logged to {TRANSFER_LOG_FILE}",
+                                                font=('Arial', 9, 'italic'))
+        self.transfer_summary_label.pack(side='left', padx=10)
         
     def create_group_management_tab(self):
         # Group Management Tab
@@ -235,9 +2162,10 @@ class GAMSimplifiedGUI:
         
         # List groups for OU
         ttk.Label(group_ops_frame, text="OU for Groups:").grid(row=0, column=0, sticky='w', padx=5)
-        self.group_ou_combobox = ttk.Combobox(group_ops_frame, width=45, state="readonly", font=('Arial', 9))
+        self.group_ou_combobox = ttk.Combobox(group_ops_frame, width=45, font=('Arial', 9))
         self.group_ou_combobox.grid(row=0, column=1, padx=5, pady=2)
         self.group_ou_combobox.set("🔄 Loading organizational units...")
+        self.bind_ou_filter(self.group_ou_combobox)
         
         ttk.Button(group_ops_frame, text="List Groups in OU", 
                   command=lambda: self.list_groups_in_ou()).grid(row=0, column=2, padx=5)
@@ -248,7 +2176,17 @@ class GAMSimplifiedGUI:
         self.group_email_entry.grid(row=1, column=1, padx=5, pady=2)
         
         ttk.Button(group_ops_frame, text="Get Group Members", 
-                  command=lambda: self.run_gam_command(f"gam print group-members group {self.group_email_entry.get()}")).grid(row=1, column=2, padx=5)
+                  command=lambda: self.get_group_members()).grid(row=1, column=2, padx=5)
+                  
+        # Local directory mirror (shares the setting with the User Management tab)
+        group_mirror_frame = ttk.Frame(group_ops_frame)
+        group_mirror_frame.grid(row=2, column=1, columnspan=2, sticky='w', padx=5, pady=2)
+        
+        ttk.Checkbutton(group_mirror_frame, text="Answer lookups from local mirror",
+                       variable=self.use_directory_mirror).pack(side='left')
+                       
+        self.group_mirror_label = ttk.Label(group_mirror_frame, text="", font=('Arial', 9, 'italic'))
+        self.group_mirror_label.pack(side='left', padx=5)
         
         # Advanced group reporting section
         report_frame = ttk.LabelFrame(group_frame, text="Advanced Group Reporting", padding=10)
@@ -302,7 +2240,66 @@ class GAMSimplifiedGUI:
                        variable=self.report_format, value="detailed").grid(row=0, column=1, sticky='w', padx=5)
         ttk.Radiobutton(additional_frame, text="📝 Summary (one row per group)", 
                        variable=self.report_format, value="summary").grid(row=0, column=2, sticky='w', padx=5)
-        
+                       
+        # Streaming asks for the file first and writes each group as soon as it is fetched
+        self.stream_group_report = tk.BooleanVar(value=False)
+        ttk.Checkbutton(additional_frame, text="💾 Write to file while generating (for very large reports)",
+                       variable=self.stream_group_report).grid(row=1, column=1, columnspan=2, sticky='w', padx=5)
+                       
+        # Delta refresh compares member counts with the last snapshot and only refetches changed groups
+        self.delta_group_report = tk.BooleanVar(value=False)
+        ttk.Checkbutton(additional_frame, text="🔁 Only refetch groups changed since the last snapshot",
+                       variable=self.delta_group_report).grid(row=2, column=1, columnspan=2, sticky='w', padx=5)
+                       
+        # Performance options
+        performance_frame = ttk.Frame(config_frame)
+        performance_frame.pack(fill='x', pady=5)
+        
+        ttk.Label(performance_frame, text="Parallel Fetches:").grid(row=0, column=0, sticky='w', padx=5)
+        self.report_concurrency = tk.IntVar(value=DEFAULT_MAX_CONCURRENCY)
+        ttk.Spinbox(performance_frame, from_=1, to=32, width=5,
+                   textvariable=self.report_concurrency).grid(row=0, column=1, sticky='w', padx=5)
+                   
+        ttk.Label(performance_frame, text="Timeout per Fetch (s):").grid(row=0, column=2, sticky='w', padx=5)
+        self.report_timeout = tk.IntVar(value=DEFAULT_JOB_TIMEOUT)
+        ttk.Spinbox(performance_frame, from_=5, to=600, increment=5, width=5,
+                   textvariable=self.report_timeout).grid(row=0, column=3, sticky='w', padx=5)
+                   
+        ttk.Label(performance_frame, text="Groups per Call:").grid(row=0, column=4, sticky='w', padx=5)
+        self.report_batch_size = tk.IntVar(value=DEFAULT_GROUPS_PER_CALL)
+        ttk.Spinbox(performance_frame, from_=1, to=100, width=5,
+                   textvariable=self.report_batch_size).grid(row=0, column=5, sticky='w', padx=5)
+                   
+        ttk.Label(performance_frame, text="Execution:").grid(row=1, column=0, sticky='w', padx=5)
+        self.execution_backend = tk.StringVar(value="process")
+        ttk.Radiobutton(performance_frame, text="One GAM process per command",
+                       variable=self.execution_backend, value="process").grid(row=1, column=1, columnspan=3, sticky='w', padx=5)
+        ttk.Radiobutton(performance_frame, text="Shared GAM batch",
+                       variable=self.execution_backend, value="batch").grid(row=1, column=4, columnspan=2, sticky='w', padx=5)
+                       
+        # Membership cache options (also used by Get Group Members)
+        ttk.Label(performance_frame, text="Cache TTL (min):").grid(row=2, column=0, sticky='w', padx=5)
+        self.membership_cache_ttl = tk.IntVar(value=MEMBERSHIP_CACHE_TTL // 60)
+        ttk.Spinbox(performance_frame, from_=1, to=1440, width=5,
+                   textvariable=self.membership_cache_ttl).grid(row=2, column=1, sticky='w', padx=5)
+                   
+        self.bypass_membership_cache = tk.BooleanVar(value=False)
+        ttk.Checkbutton(performance_frame, text="Bypass Cache",
+                       variable=self.bypass_membership_cache).grid(row=2, column=2, sticky='w', padx=5)
+                       
+        # Report results fill the cache and index so reruns and "which groups is X in?" need no GAM calls;
+        # both are capped, and untick this to keep a very large report out of them entirely
+        self.cache_report_results = tk.BooleanVar(value=True)
+        ttk.Checkbutton(performance_frame, text="Cache Report Results (not when writing to file)",
+                       variable=self.cache_report_results).grid(row=3, column=1, columnspan=2, sticky='w', padx=5)
+                       
+        self.persist_membership_cache = tk.BooleanVar(value=os.path.exists(MEMBERSHIP_CACHE_FILE))
+        ttk.Checkbutton(performance_frame, text="Keep Cache on Disk", variable=self.persist_membership_cache,
+                       command=lambda: self.save_membership_cache()).grid(row=2, column=3, columnspan=2, sticky='w', padx=5)
+                       
+        ttk.Button(performance_frame, text="Clear Cache",
+                  command=lambda: self.clear_membership_cache()).grid(row=2, column=5, sticky='w', padx=5)
+                   
         # Step 3: Generate report
         generate_frame = ttk.LabelFrame(report_frame, text="Step 3: Generate Report", padding=10)
         generate_frame.pack(fill='x', pady=5)
@@ -316,6 +2313,12 @@ class GAMSimplifiedGUI:
         ttk.Button(generate_buttons, text="💾 Save Report to CSV", 
                   command=lambda: self.save_group_report()).pack(side='left', padx=5)
         
+        ttk.Button(generate_buttons, text="⏹ Cancel",
+                  command=lambda: self.cancel_group_report()).pack(side='left', padx=5)
+                  
+        ttk.Button(generate_buttons, text="📋 Save Changes",
+                  command=lambda: self.save_group_change_report()).pack(side='left', padx=5)
+                  
         self.report_status_label = ttk.Label(generate_buttons, text="Ready to generate report", 
                                            font=('Arial', 9, 'italic'))
         self.report_status_label.pack(side='left', padx=10)
@@ -394,6 +2397,36 @@ class GAMSimplifiedGUI:
         
         ttk.Button(button_frame, text="List User's Calendars", 
                   command=lambda: self.list_user_calendars()).pack(side='left', padx=5)
+                  
+        # Sweep: run the same search across many mailboxes at once
+        sweep_frame = ttk.Frame(search_frame)
+        sweep_frame.pack(fill='x', pady=5)
+        
+        ttk.Label(sweep_frame, text="Sweep Mailboxes In:").grid(row=0, column=0, sticky='w', padx=5)
+        self.sweep_source = ttk.Combobox(sweep_frame, values=["OU", "Group", "CSV File"], width=9, state='readonly')
+        self.sweep_source.set("OU")
+        self.sweep_source.grid(row=0, column=1, sticky='w', padx=5, pady=2)
+        
+        self.sweep_target_entry = ttk.Entry(sweep_frame, width=30)
+        self.sweep_target_entry.grid(row=0, column=2, sticky='w', padx=5, pady=2)
+        
+        ttk.Button(sweep_frame, text="Browse CSV...",
+                  command=lambda: self.browse_sweep_csv()).grid(row=0, column=3, sticky='w', padx=5)
+                  
+        ttk.Label(sweep_frame, text="Parallel:").grid(row=0, column=4, sticky='w', padx=5)
+        self.sweep_concurrency = tk.IntVar(value=DEFAULT_MAX_CONCURRENCY)
+        ttk.Spinbox(sweep_frame, from_=1, to=32, width=5,
+                   textvariable=self.sweep_concurrency).grid(row=0, column=5, sticky='w', padx=5)
+                   
+        self.sweep_use_batch = tk.BooleanVar(value=False)
+        ttk.Checkbutton(sweep_frame, text="Shared GAM batch",
+                       variable=self.sweep_use_batch).grid(row=0, column=6, sticky='w', padx=5)
+                       
+        ttk.Button(sweep_frame, text="Sweep Mailboxes",
+                  command=lambda: self.sweep_calendar_events()).grid(row=0, column=7, sticky='w', padx=5)
+                  
+        self.sweep_status_label = ttk.Label(sweep_frame, text="", font=('Arial', 9, 'italic'))
+        self.sweep_status_label.grid(row=1, column=0, columnspan=8, sticky='w', padx=5)
         
         # Step 2: Select and Delete Event Section
         delete_frame = ttk.LabelFrame(calendar_frame, text="Step 2: Select and Delete Calendar Event", padding=10)
@@ -408,19 +2441,27 @@ class GAMSimplifiedGUI:
         selection_frame = ttk.Frame(delete_frame)
         selection_frame.pack(fill='both', expand=True, pady=5)
         
+        # Narrow a long event list by typing part of a title, date or status
+        event_filter_frame = ttk.Frame(selection_frame)
+        event_filter_frame.pack(fill='x', pady=(0, 2))
+        
+        ttk.Label(event_filter_frame, text="Filter:").pack(side='left')
+        self.event_filter_entry = ttk.Entry(event_filter_frame, width=30)
+        self.event_filter_entry.pack(side='left', padx=5)
+        self.event_filter_entry.bind('<KeyRelease>', lambda event: self.filter_event_listbox())
+        
         # Event listbox with scrollbar
         listbox_frame = ttk.Frame(selection_frame)
         listbox_frame.pack(fill='both', expand=True)
         
-        # Create listbox with scrollbars
-        self.event_listbox = tk.Listbox(listbox_frame, height=6, font=('Consolas', 9))
-        scrollbar_y = ttk.Scrollbar(listbox_frame, orient='vertical', command=self.event_listbox.yview)
+        # Create listbox with scrollbars; only the visible rows are rendered
+        self.event_listbox = VirtualListbox(listbox_frame, selectmode=tk.EXTENDED, height=6, font=('Consolas', 9),
+                                            format_row=self.format_event_row)
         scrollbar_x = ttk.Scrollbar(listbox_frame, orient='horizontal', command=self.event_listbox.xview)
         
-        self.event_listbox.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        self.event_listbox.listbox.configure(xscrollcommand=scrollbar_x.set)
         
         # Pack scrollbars and listbox
-        scrollbar_y.pack(side='right', fill='y')
         scrollbar_x.pack(side='bottom', fill='x')
         self.event_listbox.pack(side='left', fill='both', expand=True)
         
@@ -456,11 +2497,17 @@ class GAMSimplifiedGUI:
         delete_button_frame = ttk.Frame(delete_frame)
         delete_button_frame.pack(fill='x', pady=5)
         
-        ttk.Button(delete_button_frame, text="🗑️ Delete Selected Event", 
+        ttk.Button(delete_button_frame, text="🗑️ Delete Selected Events",
                   command=lambda: self.delete_selected_calendar_event()).pack(side='left', padx=5)
+                  
+        ttk.Button(delete_button_frame, text="Select All Shown",
+                  command=lambda: self.select_all_events()).pack(side='left', padx=5)
         
         ttk.Button(delete_button_frame, text="Clear Selection", 
                   command=lambda: self.clear_event_selection()).pack(side='left', padx=5)
+                  
+        self.selected_events_count = ttk.Label(delete_button_frame, text="", font=('Arial', 9, 'italic'))
+        self.selected_events_count.pack(side='left', padx=5)
         
         # Helper text
         helper_frame = ttk.LabelFrame(calendar_frame, text="💡 Quick Tips", padding=10)
@@ -511,80 +2558,379 @@ class GAMSimplifiedGUI:
         self.output_text = scrolledtext.ScrolledText(output_ops_frame, height=25, width=100)
         self.output_text.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Clear output button
-        ttk.Button(output_ops_frame, text="Clear Output", 
-                  command=lambda: self.output_text.delete(1.0, tk.END)).pack(pady=5)
+        # Everything shown here is also written to the session log on disk
+        self.session_log = SessionLog()
+        self.output_first_line = 0  # Session log line shown on the first line of the widget
+        self.output_paged_lines = 0  # Lines brought back by Load Earlier; trimming pauses while non-zero
         
-    def load_organizational_units(self):
-        """Load organizational units from GAM on startup"""
-        self.status_var.set("Loading organizational units...")
+        output_buttons = ttk.Frame(output_ops_frame)
+        output_buttons.pack(fill='x', pady=5)
         
-        def fetch_ous():
+        ttk.Button(output_buttons, text="⬆ Load Earlier",
+                  command=lambda: self.load_earlier_output()).pack(side='left', padx=5)
+                  
+        # Clear output button
+        ttk.Button(output_buttons, text="Clear Output",
+                  command=lambda: self.clear_output()).pack(side='left', padx=5)
+                  
+        ttk.Label(output_buttons, text="Lines to Keep in View:").pack(side='left', padx=(15, 5))
+        self.output_max_lines = tk.IntVar(value=DEFAULT_OUTPUT_MAX_LINES)
+        ttk.Spinbox(output_buttons, from_=500, to=100000, increment=500, width=8,
+                   textvariable=self.output_max_lines).pack(side='left')
+                   
+        self.output_log_label = ttk.Label(output_buttons, text="", font=('Arial', 9, 'italic'))
+        self.output_log_label.pack(side='left', padx=10)
+        
+    def append_output(self, text):
+        """Append text to the Output tab, spilling the oldest lines to the session log"""
+        self.session_log.write(text)
+        self.output_text.insert(tk.END, text)
+        self.trim_output()
+        
+    def trim_output(self):
+        """Keep the Output tab within its configured number of lines"""
+        try:
+            max_lines = max(1, int(self.output_max_lines.get()))
+        except (tk.TclError, ValueError):
+            max_lines = DEFAULT_OUTPUT_MAX_LINES
+            
+        # 'end-1c' sits on the line after the last newline, so this counts complete lines
+        line_count = int(self.output_text.index('end-1c').split('.')[0]) - 1
+        
+        # Pages brought back by Load Earlier stay until the view is scrolled back to the end,
+        # within a ceiling so streaming output cannot grow the widget without bound meanwhile
+        if self.output_paged_lines:
+            ceiling = max_lines * OUTPUT_TRIM_PAUSE_FACTOR + self.output_paged_lines
+            if self.output_text.yview()[1] < 1.0 and line_count <= ceiling:
+                return
+            self.output_paged_lines = 0
+            self.update_output_log_label()
+            
+        excess = line_count - max_lines
+        if excess > 0:
+            self.output_text.delete('1.0', f'{excess + 1}.0')
+            self.output_first_line += excess
+            self.update_output_log_label()
+            
+    def update_output_log_label(self):
+        """Show how much of the session is only available in the log"""
+        if self.output_paged_lines:
+            self.output_log_label.config(text="Showing earlier output, scroll to the end to resume trimming")
+        elif self.output_first_line > self.session_log.first_line:
+            self.output_log_label.config(
+                text=f"{self.output_first_line:,} earlier lines in session log")
+        else:
+            self.output_log_label.config(text="")
+            
+    def load_earlier_output(self):
+        """Page earlier lines back into the Output tab from the session log"""
+        start = max(self.session_log.first_line, self.output_first_line - OUTPUT_PAGE_LINES)
+        lines = self.session_log.read_lines(start, self.output_first_line)
+        if not lines:
+            self.status_var.set("No earlier output in the session log")
+            return
+            
+        self.output_text.insert('1.0', ''.join(lines))
+        self.output_text.see('1.0')
+        self.output_first_line -= len(lines)
+        self.output_paged_lines += len(lines)
+        self.update_output_log_label()
+        
+    def clear_output(self):
+        """Clear the Output tab; the session log keeps everything for Load Earlier and Save Output"""
+        self.output_text.delete(1.0, tk.END)
+        self.output_first_line = self.session_log.line_count
+        self.output_paged_lines = 0
+        self.update_output_log_label()
+        
+    def create_jobs_tab(self):
+        # Jobs Tab
+        jobs_frame = ttk.Frame(self.notebook)
+        self.notebook.add(jobs_frame, text="Jobs")
+        
+        jobs_ops_frame = ttk.LabelFrame(jobs_frame, text="Background Jobs", padding=10)
+        jobs_ops_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        tree_frame = ttk.Frame(jobs_ops_frame)
+        tree_frame.pack(fill='both', expand=True)
+        
+        columns = ('id', 'name', 'priority', 'state', 'progress', 'started', 'duration')
+        self.jobs_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        headings = {'id': ("ID", 50), 'name': ("Job", 380), 'priority': ("Priority", 90),
+                    'state': ("State", 90), 'progress': ("Progress", 140),
+                    'started': ("Started", 80), 'duration': ("Duration", 80)}
+        for column in columns:
+            text, width = headings[column]
+            self.jobs_tree.heading(column, text=text)
+            self.jobs_tree.column(column, width=width, anchor='w')
+            
+        jobs_scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.jobs_tree.yview)
+        self.jobs_tree.configure(yscrollcommand=jobs_scrollbar.set)
+        self.jobs_tree.pack(side='left', fill='both', expand=True)
+        jobs_scrollbar.pack(side='right', fill='y')
+        
+        jobs_buttons = ttk.Frame(jobs_ops_frame)
+        jobs_buttons.pack(fill='x', pady=5)
+        
+        ttk.Button(jobs_buttons, text="⏹ Cancel Selected",
+                  command=lambda: self.cancel_selected_jobs()).pack(side='left', padx=5)
+                  
+        ttk.Button(jobs_buttons, text="Clear Finished",
+                  command=lambda: self.job_scheduler.clear_finished()).pack(side='left', padx=5)
+                  
+        self.jobs_summary_label = ttk.Label(jobs_buttons, text="No jobs yet", font=('Arial', 9, 'italic'))
+        self.jobs_summary_label.pack(side='left', padx=10)
+        
+        # Group reports that stopped before finishing can be picked up from their journal
+        journals_frame = ttk.LabelFrame(jobs_frame, text="Unfinished Group Reports", padding=10)
+        journals_frame.pack(fill='x', padx=10, pady=5)
+        
+        columns = ('started', 'progress', 'output', 'state')
+        self.journals_tree = ttk.Treeview(journals_frame, columns=columns, show='headings', height=4)
+        headings = {'started': ("Started", 140), 'progress': ("Groups Done", 120),
+                    'output': ("Output", 380), 'state': ("State", 120)}
+        for column in columns:
+            text, width = headings[column]
+            self.journals_tree.heading(column, text=text)
+            self.journals_tree.column(column, width=width, anchor='w')
+        self.journals_tree.pack(fill='x')
+        
+        journals_buttons = ttk.Frame(journals_frame)
+        journals_buttons.pack(fill='x', pady=5)
+        
+        ttk.Button(journals_buttons, text="▶ Resume Selected",
+                  command=lambda: self.resume_group_report()).pack(side='left', padx=5)
+                  
+        ttk.Button(journals_buttons, text="🗑 Discard Selected",
+                  command=lambda: self.discard_report_journals()).pack(side='left', padx=5)
+                  
+        ttk.Button(journals_buttons, text="Refresh",
+                  command=lambda: self.refresh_report_journals()).pack(side='left', padx=5)
+                  
+    def refresh_jobs_panel(self):
+        """Redraw the Jobs tab from the scheduler's job list"""
+        jobs = list(self.job_scheduler.jobs.values())
+        known = set(self.jobs_tree.get_children())
+        
+        for job in jobs:
+            started = job.started.strftime('%H:%M:%S') if job.started else ""
+            if job.started:
+                elapsed = (job.finished or datetime.now()) - job.started
+                duration = str(elapsed).split('.')[0]
+            else:
+                duration = ""
+            priority = "Bulk" if job.is_bulk else "Interactive"
+            state = f"failed: {job.error}" if job.state == 'failed' and job.error else job.state
+            values = (job.id, job.name, priority, state, job.progress, started, duration)
+            
+            item = str(job.id)
+            if item in known:
+                self.jobs_tree.item(item, values=values)
+                known.discard(item)
+            else:
+                self.jobs_tree.insert('', 'end', iid=item, values=values)
+                
+        # Remove jobs that were cleared from the scheduler
+        for item in known:
+            self.jobs_tree.delete(item)
+            
+        running = sum(1 for job in jobs if job.state == 'running')
+        queued = sum(1 for job in jobs if job.state == 'queued')
+        self.jobs_summary_label.config(text=f"{running} running, {queued} queued")
+        
+    def cancel_selected_jobs(self):
+        """Cancel the jobs selected in the Jobs tab"""
+        selection = self.jobs_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a job to cancel")
+            return
+            
+        for item in selection:
+            self.job_scheduler.cancel(int(item))
+        self.refresh_report_journals()
+        
+    def refresh_report_journals(self):
+        """List the group report journals that can be resumed"""
+        self.journals_tree.delete(*self.journals_tree.get_children())
+        for journal in ReportJournal.list_journals():
+            spec = journal.spec
+            state = spec.get('state', 'running')
+            if self.journal_is_active(journal.directory):
+                state = "running"
+            elif state == 'running':
+                state = "interrupted"
+            started = datetime.fromtimestamp(spec.get('created', 0)).strftime('%Y-%m-%d %H:%M')
+            output = spec.get('filename') or "In memory (save when finished)"
+            progress = f"{journal.completed_count()}/{len(spec.get('groups', []))}"
+            self.journals_tree.insert('', 'end', iid=journal.directory, values=(started, progress, output, state))
+            
+    def journal_is_active(self, directory):
+        """True while the report job for a journal is queued or running
+        
+        Going by the job's state covers a report cancelled while it was still
+        queued, whose job function (and its cleanup) never runs.
+        """
+        job = self.active_journals.get(directory)
+        return job is not None and job.state in ('queued', 'running')
+        
+    def resume_group_report(self):
+        """Resume the group report selected in the Jobs tab"""
+        selection = self.journals_tree.selection()
+        if len(selection) != 1:
+            messagebox.showwarning("Warning", "Please select one report to resume")
+            return
+            
+        directory = selection[0]
+        if self.journal_is_active(directory):
+            messagebox.showwarning("Warning", "That report is still running")
+            return
+        if self.report_job and self.report_job.state in ('queued', 'running'):
+            messagebox.showwarning("Warning", "Another group report is running. Cancel it or wait for it to finish.")
+            return
+            
+        try:
+            journal = ReportJournal(directory).load()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not read report journal: {str(e)}")
+            return
+        journal.set_state('running')
+        self.start_group_report(journal)
+        self.notebook.select(2)  # Group Management tab
+        
+    def discard_report_journals(self):
+        """Delete the selected report journals"""
+        selection = [item for item in self.journals_tree.selection() if not self.journal_is_active(item)]
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a report that is not running")
+            return
+        if messagebox.askyesno("Confirm", f"Discard {len(selection)} unfinished report(s)? They can no longer be resumed."):
+            for directory in selection:
+                ReportJournal(directory).delete()
+            self.refresh_report_journals()
+            
+    def load_organizational_units(self, force=False):
+        """Load organizational units, serving the local cache first and revalidating in the background"""
+        cached = None if force else self.read_ou_cache()
+        
+        # The cached list is shown at once and always revalidated; the TTL only decides if it is called stale
+        if cached:
+            ous, fetched_at = cached
+            self.set_organizational_units(ous)
+            age = time.time() - fetched_at
+            if age < OU_CACHE_TTL:
+                self.status_var.set(f"✅ Loaded {len(self.organizational_units)} organizational units "
+                                    f"from cache ({self.describe_age(age)} old), checking for changes...")
+            else:
+                self.status_var.set(f"Loaded {len(self.organizational_units)} stale cached organizational units "
+                                    f"({self.describe_age(age)} old), refreshing...")
+        else:
+            self.status_var.set("Loading organizational units...")
+            
+        self.is_loading_ous = True
+        
+        def fetch_ous(job):
             try:
                 # Execute GAM command to get all OUs
-                result = subprocess.run("gam print orgs", shell=True, capture_output=True, text=True, timeout=60)
+                result = job.run_process("gam print orgs", timeout=60)
                 
                 # Parse the results in main thread
-                self.root.after(0, lambda: self.process_ou_results(result))
+                self.ui_updates.post(lambda: self.process_ou_results(result))
                 
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self.handle_ou_error("Timeout loading organizational units"))
+                self.ui_updates.post(lambda: self.handle_ou_error("Timeout loading organizational units"))
+            except JobCancelled:
+                self.ui_updates.post(lambda: self.handle_ou_error("Loading organizational units was cancelled"))
             except Exception as e:
-                self.root.after(0, lambda: self.handle_ou_error(f"Error loading OUs: {str(e)}"))
+                self.ui_updates.post(lambda e=e: self.handle_ou_error(f"Error loading OUs: {str(e)}"))
         
-        # Run in separate thread to avoid blocking GUI
-        thread = threading.Thread(target=fetch_ous)
-        thread.daemon = True
-        thread.start()
+        # Run as a background job to avoid blocking GUI
+        self.job_scheduler.submit("Load organizational units", fetch_ous, PRIORITY_INTERACTIVE)
     
     def process_ou_results(self, result):
         """Process the GAM organizational units results"""
-        self.organizational_units = []
-        self.formatted_ous = []  # Store formatted display versions
-        
         if result.returncode == 0:
-            # Parse the CSV output from GAM
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:  # Skip header line
-                for line in lines[1:]:
-                    # Extract OU path from CSV (usually first column)
-                    parts = line.split(',')
-                    if parts:
-                        ou_path = parts[0].strip('"')
+            ous = []
+            
+            # Parse the CSV output from GAM, the OU path is usually the first column
+            reader = GAMCSVReader(result.stdout)
+            if reader.find_header():
+                path_idx = reader.column('orgunitpath', default=0)
+                for fields in reader.rows():
+                    if len(fields) > path_idx:
+                        ou_path = fields[path_idx].strip()
                         if ou_path and ou_path != '/':  # Skip root OU
-                            self.organizational_units.append(ou_path)
-                            # Create formatted version for display
-                            formatted_ou = self.format_ou_for_display(ou_path)
-                            self.formatted_ous.append(formatted_ou)
-            
-            # Sort both lists together by the original OU path
-            combined = list(zip(self.organizational_units, self.formatted_ous))
-            combined.sort(key=lambda x: x[0])
-            self.organizational_units, self.formatted_ous = zip(*combined) if combined else ([], [])
-            self.organizational_units = list(self.organizational_units)
-            self.formatted_ous = list(self.formatted_ous)
-            
-            # Update comboxes
-            self.update_ou_comboboxes()
-            self.status_var.set(f"✅ Loaded {len(self.organizational_units)} organizational units")
+                            ous.append(ou_path)
+            
+            changed = self.set_organizational_units(ous)
+            self.write_ou_cache(self.organizational_units)
+            
+            suffix = "" if changed else " (no changes)"
+            self.status_var.set(f"✅ Loaded {len(self.organizational_units)} organizational units{suffix}")
             
         else:
             self.handle_ou_error(f"GAM error: {result.stderr}")
+            
+    def set_organizational_units(self, ous):
+        """Store a new OU list and update the pickers; returns False if nothing changed"""
+        ou_index = OUIndex(ous)
+        if ou_index.paths == self.organizational_units and ou_index.paths:
+            self.is_loading_ous = False
+            return False
+            
+        # The index keeps the OUs in tree order so children follow their parent
+        self.ou_index = ou_index
+        self.organizational_units = ou_index.paths
+        # Store formatted display versions
+        self.formatted_ous = [self.format_ou_for_display(ou_path, depth)
+                              for ou_path, depth in zip(ou_index.paths, ou_index.depths)]
+        
+        # Update comboxes
+        self.update_ou_comboboxes()
+        return True
+        
+    def read_ou_cache(self):
+        """Return (ous, fetched_at) from the on-disk OU cache, or None if there is none"""
+        try:
+            with open(OU_CACHE_FILE, encoding='utf-8') as f:
+                cache = json.load(f)
+            return list(cache['organizational_units']), float(cache['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+            
+    def write_ou_cache(self, ous):
+        """Persist the OU list so the next launch can show it immediately"""
+        try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            temp_file = OU_CACHE_FILE + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'organizational_units': list(ous)}, f)
+            os.replace(temp_file, OU_CACHE_FILE)
+        except OSError:
+            pass  # The cache is only an optimisation
+            
+    def describe_age(self, seconds):
+        """Describe an age in seconds as a short human readable string"""
+        seconds = max(0, int(seconds))
+        if seconds < 60:
+            return f"{seconds}s"
+        if seconds < 3600:
+            return f"{seconds // 60}m"
+        if seconds < 86400:
+            return f"{seconds // 3600}h"
+        return f"{seconds // 86400}d"
     
-    def format_ou_for_display(self, ou_path):
+    def format_ou_for_display(self, ou_path, depth=None):
         """Format OU path for better display in dropdown"""
         if not ou_path or ou_path == '/':
             return "📁 Root Organization"
         
-        # Remove leading slash and split into parts
-        parts = ou_path.strip('/').split('/')
-        
-        # Create indentation based on depth
-        depth = len(parts) - 1
+        # Depth comes from the OU index when available
+        if depth is None:
+            depth = ou_path.strip('/').count('/')
         indent = "  " * depth
         
         # Get the last part (actual OU name)
-        ou_name = parts[-1]
+        ou_name = ou_path.rsplit('/', 1)[-1]
         
         # Add appropriate icons and formatting
         if depth == 0:
@@ -601,110 +2947,383 @@ class GAMSimplifiedGUI:
     
     def handle_ou_error(self, error_message):
         """Handle errors when loading OUs"""
-        self.organizational_units = []
-        self.update_ou_comboboxes()
-        self.status_var.set("Ready (Could not load OUs)")
+        if self.organizational_units:
+            # Keep serving the cached list rather than emptying the pickers
+            self.is_loading_ous = False
+            self.status_var.set("Ready (Could not refresh OUs, showing cached list)")
+        else:
+            self.update_ou_comboboxes()
+            self.status_var.set("Ready (Could not load OUs)")
         
         # Optionally show error in output tab
         if hasattr(self, 'output_text'):
-            self.output_text.insert(tk.END, f"\n[{datetime.now().strftime('%H:%M:%S')}] {error_message}\n")
-            self.output_text.insert(tk.END, "You can still enter OU paths manually or try refreshing.\n")
-            self.output_text.insert(tk.END, "-" * 50 + "\n")
+            self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] {error_message}\n")
+            if self.organizational_units:
+                self.append_output("OUs from the cached list can still be used, or try refreshing.\n")
+            else:
+                self.append_output("You can still enter OU paths manually or try refreshing.\n")
+            self.append_output("-" * 50 + "\n")
+            
+    def is_known_ou(self, ou_path):
+        """True for a loaded OU, or for any typed OU path when no OU list could be loaded"""
+        if ou_path in self.ou_index:
+            return True
+        # With nothing to check against, accept the path and let GAM reject it if it does not exist
+        return not self.organizational_units and not self.is_loading_ous and ou_path.startswith('/')
     
     def update_ou_comboboxes(self):
         """Update all OU comboboxes and listboxes with loaded data"""
         self.is_loading_ous = False
         
         if self.organizational_units:
+            # Keep the user's current choices when a refreshed list is swapped in
+            valid_ous = set(self.organizational_units)
+            
             # Update user management single OU combobox
+            current_ou = self.ou_combobox.get()
             self.ou_combobox['values'] = self.organizational_units
-            self.ou_combobox.set("Select an OU...")
+            self.ou_combobox.set(current_ou if current_ou in valid_ous else "Select an OU...")
             
             # Update available OUs listbox for multi-selection
-            self.available_ous_listbox.delete(0, tk.END)
-            for formatted_ou in self.formatted_ous:
-                self.available_ous_listbox.insert(tk.END, formatted_ou)
+            self.show_available_ous()
             
             # Update group management OU combobox  
             if hasattr(self, 'group_ou_combobox'):
+                current_group_ou = self.group_ou_combobox.get()
                 self.group_ou_combobox['values'] = self.organizational_units
-                self.group_ou_combobox.set("Select an OU...")
+                self.group_ou_combobox.set(current_group_ou if current_group_ou in valid_ous else "Select an OU...")
         else:
             # No OUs found
             self.ou_combobox['values'] = []
             self.ou_combobox.set("No OUs found")
             
-            self.available_ous_listbox.delete(0, tk.END)
-            self.available_ous_listbox.insert(0, "No OUs found")
+            self.available_ous_listbox.set_rows(["No OUs found"])
+            self.available_ou_paths = []
             
             if hasattr(self, 'group_ou_combobox'):
                 self.group_ou_combobox['values'] = []
                 self.group_ou_combobox.set("No OUs found")
     
+    def show_available_ous(self):
+        """Fill the available OU list, applying the filter and keeping the selection"""
+        if not self.organizational_units:
+            return
+            
+        previous_ous = self.available_ou_paths
+        selected_paths = {previous_ous[i] for i in self.available_ous_listbox.curselection()
+                          if i < len(previous_ous)}
+                          
+        query = self.available_ou_filter.get().strip()
+        if query:
+            # Filtered rows show the full path since their parents may be hidden
+            paths = self.ou_index.filter(query)
+            labels = [f"📁 {ou_path}" for ou_path in paths]
+        else:
+            paths = self.organizational_units
+            labels = self.formatted_ous
+            
+        self.available_ous_listbox.set_rows(labels)
+        self.available_ou_paths = list(paths)
+        for i, ou_path in enumerate(self.available_ou_paths):
+            if ou_path in selected_paths:
+                self.available_ous_listbox.selection_set(i)
+                
+    def select_ou_subtrees(self):
+        """Extend the available OU selection to every child of the selected OUs"""
+        selected = [self.available_ou_paths[i] for i in self.available_ous_listbox.curselection()
+                    if i < len(self.available_ou_paths)]
+        if not selected:
+            messagebox.showwarning("Warning", "Please select at least one OU")
+            return
+            
+        # Subtrees are contiguous in the unfiltered list
+        if self.available_ou_filter.get().strip():
+            self.available_ou_filter.delete(0, tk.END)
+            self.show_available_ous()
+            
+        for ou_path in selected:
+            start, end = self.ou_index.subtree_range(ou_path)
+            self.available_ous_listbox.selection_set(start, end - 1)
+        self.available_ous_listbox.see(self.ou_index.positions[selected[0]])
+        self.status_var.set(f"Selected {len(self.available_ous_listbox.curselection())} OUs including sub-OUs")
+        
+    def add_selected_ous(self):
+        """Move the OUs selected in the available list into the selected list"""
+        selected = [self.available_ou_paths[i] for i in self.available_ous_listbox.curselection()
+                    if i < len(self.available_ou_paths)]
+        if not selected:
+            messagebox.showwarning("Warning", "Please select at least one OU to add")
+            return
+            
+        chosen = set(self.selected_ous)
+        self.selected_ous.extend(ou_path for ou_path in selected if ou_path not in chosen)
+        self.selected_ous.sort(key=lambda ou_path: self.ou_index.positions.get(ou_path, len(self.ou_index)))
+        self.available_ous_listbox.selection_clear(0, tk.END)
+        self.update_selected_ous()
+        
+    def remove_selected_ous(self):
+        """Remove the highlighted OUs from the selected list"""
+        removed = set(self.selected_ous_listbox.selected_rows())
+        if not removed:
+            messagebox.showwarning("Warning", "Please select at least one OU to remove")
+            return
+        self.selected_ous = [ou_path for ou_path in self.selected_ous if ou_path not in removed]
+        self.update_selected_ous()
+        
+    def clear_selected_ous(self):
+        self.selected_ous = []
+        self.update_selected_ous()
+        
+    def update_selected_ous(self):
+        self.selected_ous_listbox.set_rows(list(self.selected_ous))
+        count = len(self.selected_ous)
+        self.selected_ous_count.config(text=f"{count} OU{'s' if count != 1 else ''} selected")
+        
+    def collapse_ou_paths(self, ou_paths):
+        """Drop OUs whose parent OU is also listed, since a listing covers every sub-OU
+        
+        OU paths are compared case-insensitively, as Google treats them, and
+        the root '/' covers every other OU.
+        """
+        collapsed = []
+        parents = []  # Lowercased kept paths without a trailing slash, so the root is ''
+        for ou_path in sorted(set(ou_paths), key=lambda path: path.lower().strip('/').split('/')):
+            path = ou_path.lower().rstrip('/')
+            if not any(path == parent or path.startswith(parent + '/') for parent in parents):
+                collapsed.append(ou_path)
+                parents.append(path)
+        return collapsed
+        
+    def list_users_from_multiple_ous(self):
+        """List the users of every selected OU in parallel, merged into one deduplicated table"""
+        if not self.selected_ous:
+            messagebox.showwarning("Warning", "Please add at least one OU to the Selected OUs list")
+            return
+            
+        ous = list(self.selected_ous)
+        if self.collapse_nested_ous.get():
+            ous = self.collapse_ou_paths(ous)
+            
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if mirror:
+                rows = {}
+                for ou in ous:
+                    for user in mirror.users_in_ou(ou, include_children=True):
+                        rows.setdefault(user[0].lower(), user)
+                self.show_mirror_rows(f"Users in {len(ous)} OUs", MIRROR_USER_COLUMNS, list(rows.values()), 'users')
+            return
+            
+        commands = [self.users_in_ou_command(ou, USER_LISTING_FIELDS) for ou in ous]
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Listing users from {len(ous)} OUs "
+                           f"({len(self.selected_ous)} selected)\n")
+        self.append_output("-" * 50 + "\n")
+        self.notebook.select(6)  # Output tab index
+        self.status_var.set(f"Listing users from {len(ous)} OUs...")
+        
+        def list_users(job):
+            seen = set()
+            failed = []
+            header = [False]
+            
+            # Each OU's rows are merged into the table as soon as its listing returns
+            def on_result(index, command, result, completed):
+                if isinstance(result, Exception) or result is None or result.returncode != 0:
+                    failed.append(ous[index])
+                    error = result if isinstance(result, Exception) else getattr(result, 'stderr', '')
+                    self.ui_updates.post_output(f"[{ous[index]}] ERROR: {str(error).strip()}\n")
+                    return
+                    
+                reader = GAMCSVReader(result.stdout)
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator='\n')
+                for fields in reader.rows():
+                    if not header[0]:
+                        writer.writerow(reader.headers)
+                        header[0] = True
+                    email_idx = reader.column('primaryemail', default=0)
+                    email = fields[email_idx].strip().lower() if len(fields) > email_idx else ''
+                    if email and email not in seen:
+                        seen.add(email)
+                        writer.writerow(fields)
+                if buffer.tell():
+                    self.ui_updates.post_output(buffer.getvalue())
+                job.set_progress(f"{completed}/{len(ous)} OUs, {len(seen)} users")
+                self.ui_updates.post(lambda completed=completed, users=len(seen): self.status_var.set(
+                    f"Listed {completed}/{len(ous)} OUs, {users} unique users"), key='status')
+                    
+            try:
+                self.run_gam_commands(commands, DEFAULT_COMMAND_TIMEOUT, DEFAULT_MAX_CONCURRENCY,
+                                      on_result=on_result, job=job, keep_results=False)
+                job.check_cancelled()
+                summary = f"✅ {len(seen)} unique users from {len(ous)} OUs"
+                if failed:
+                    summary += f" ({len(failed)} failed: {', '.join(failed[:3])})"
+            except JobCancelled:
+                summary = "⏹ Listing cancelled"
+            except Exception as e:
+                summary = f"❌ Error listing users: {str(e)}"
+                
+            self.ui_updates.post_output("\n" + "=" * 50 + "\n\n")
+            self.ui_updates.post(lambda: self.status_var.set(summary), key='status')
+            
+        self.job_scheduler.submit(f"List users from {len(ous)} OUs", list_users, PRIORITY_BULK)
+        
+    def bind_ou_filter(self, combobox):
+        """Let typing into an OU combobox narrow its dropdown to matching OUs"""
+        combobox.bind('<KeyRelease>', lambda event: self.filter_ou_combobox(combobox, event))
+        combobox.bind('<FocusIn>', lambda event: self.clear_ou_placeholder(combobox))
+        
+    def filter_ou_combobox(self, combobox, event=None):
+        if event is not None and event.keysym in ('Up', 'Down', 'Return', 'Escape', 'Tab'):
+            return
+        text = combobox.get().strip()
+        combobox['values'] = self.organizational_units if text in self.ou_index else self.ou_index.filter(text)
+        
+    def clear_ou_placeholder(self, combobox):
+        """Clear prompts like "Select an OU..." so typing starts a fresh filter"""
+        text = combobox.get()
+        if self.organizational_units and (text == "Select an OU..." or text.startswith("🔄")):
+            combobox.set("")
+            combobox['values'] = self.organizational_units
+            
     def refresh_organizational_units(self):
-        """Refresh the organizational units list"""
+        """Refresh the organizational units list, bypassing the cache"""
         if not self.is_loading_ous:
-            self.is_loading_ous = True
-            self.ou_combobox.set("🔄 Loading OUs...")
-            if hasattr(self, 'group_ou_combobox'):
-                self.group_ou_combobox.set("🔄 Loading OUs...")
-            self.available_ous_listbox.delete(0, tk.END)
-            self.available_ous_listbox.insert(0, "🔄 Loading organizational units...")
-            self.load_organizational_units()
+            if not self.organizational_units:
+                self.ou_combobox.set("🔄 Loading OUs...")
+                if hasattr(self, 'group_ou_combobox'):
+                    self.group_ou_combobox.set("🔄 Loading OUs...")
+                self.available_ous_listbox.set_rows(["🔄 Loading organizational units..."])
+            # Existing entries stay usable while the refreshed list loads
+            self.load_organizational_units(force=True)
 
-    def run_gam_command(self, command):
-        """Run a GAM command in the background"""
+    def run_gam_command(self, command, timeout=DEFAULT_COMMAND_TIMEOUT, on_success=None):
+        """Run a GAM command in the background, streaming its output as it arrives
+        
+        If on_success is given, it is called on the main thread with the full
+        stdout once the command has completed successfully.
+        """
         self.status_var.set(f"Running: {command}")
-        self.output_text.insert(tk.END, f"\n[{datetime.now().strftime('%H:%M:%S')}] Executing: {command}\n")
-        self.output_text.insert(tk.END, "-" * 50 + "\n")
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Executing: {command}\n")
+        self.append_output("-" * 50 + "\n")
         self.output_text.see(tk.END)
         
         # Switch to output tab
         self.notebook.select(6)  # Output tab index
         
-        def execute_command():
+        is_event_search = "print events" in command or "print calendar-events" in command
+        is_group_listing = "print groups" in command and "ou " in command
+        keep_output = is_group_listing or on_success is not None
+        
+        def read_lines(pipe):
+            for line in pipe:
+                self.ui_updates.post_output(line)
+                yield line
+                
+        def execute_command(job):
+            timed_out = threading.Event()
+            timer = None
+            process = None
             try:
-                # Execute the GAM command
-                result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
+                process = job.popen(command, bufsize=1)
                 
-                # Update GUI in main thread
-                self.root.after(0, lambda: self.display_command_result(result, command))
+                # Drain stderr separately so a chatty command cannot block on a full pipe
+                stderr_chunks = []
+                stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()))
+                stderr_thread.daemon = True
+                stderr_thread.start()
                 
-            except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self.display_error("Command timed out after 5 minutes"))
+                if timeout:
+                    def kill_process():
+                        timed_out.set()
+                        kill_process_tree(process)
+                    timer = threading.Timer(timeout, kill_process)
+                    timer.daemon = True
+                    timer.start()
+                    
+                lines = read_lines(process.stdout)
+                
+                # Only hold on to output that a parser needs afterwards
+                output_lines = [] if keep_output else None
+                if output_lines is not None:
+                    lines = self.collect_lines(lines, output_lines)
+                    
+                events = None
+                if is_event_search:
+                    events = self.read_calendar_events(lines)
+                for line in lines:
+                    pass
+                    
+                returncode = process.wait()
+                stderr_thread.join()
+                stderr = ''.join(chunk for chunk in stderr_chunks if chunk)
+                output = ''.join(output_lines) if output_lines is not None else None
+                
+                def finish():
+                    if job.cancelled:
+                        self.display_error("Command cancelled")
+                    elif timed_out.is_set():
+                        self.display_error(f"Command timed out after {timeout} seconds")
+                    else:
+                        self.display_command_result(returncode, stderr, command, events,
+                                                    output if is_group_listing else None)
+                        if returncode == 0 and on_success:
+                            on_success(output)
+                        
+            except JobCancelled:
+                def finish():
+                    self.display_error("Command cancelled")
             except Exception as e:
-                self.root.after(0, lambda: self.display_error(f"Error executing command: {str(e)}"))
+                def finish(e=e):
+                    self.display_error(f"Error executing command: {str(e)}")
+            finally:
+                if timer:
+                    timer.cancel()
+                if process:
+                    job.release(process)
+                    
+            # Update GUI in main thread, after the streamed output queued above
+            self.ui_updates.post(finish)
+            
+        # Interactive commands run ahead of any queued bulk work
+        self.job_scheduler.submit(command, execute_command, PRIORITY_INTERACTIVE)
         
-        # Run command in separate thread
-        thread = threading.Thread(target=execute_command)
-        thread.daemon = True
-        thread.start()
+    def write_streamed_output(self, text):
+        """Write output collected by worker threads and keep it scrolled into view"""
+        self.append_output(text)
+        self.output_text.see(tk.END)
         
-    def display_command_result(self, result, command):
-        """Display the result of a command execution"""
-        if result.returncode == 0:
-            self.output_text.insert(tk.END, result.stdout)
+    def collect_lines(self, lines, collected):
+        """Pass lines through while keeping a copy in the collected list"""
+        for line in lines:
+            collected.append(line)
+            yield line
+            
+    def display_command_result(self, returncode, stderr, command, events=None, group_output=None):
+        """Display the result of a command execution once its output has streamed in"""
+        if returncode == 0:
             self.status_var.set("Command completed successfully")
             
-            # Check if this was a calendar event search command and parse results
-            if "print events" in command or "print calendar-events" in command:
-                self.parse_calendar_events(result.stdout, command)
+            # Show the calendar events parsed while the output streamed in
+            if events is not None:
+                self.show_calendar_events(*events)
             
             # Check if this was a group listing command and capture available groups
-            if "print groups" in command and "ou " in command:
-                self.last_group_output = result.stdout
+            if group_output is not None:
+                self.last_group_output = group_output
                 
         else:
-            self.output_text.insert(tk.END, f"ERROR: {result.stderr}")
+            self.append_output(f"ERROR: {stderr}")
             self.status_var.set("Command failed")
             
-        self.output_text.insert(tk.END, "\n" + "=" * 50 + "\n\n")
+        self.append_output("\n" + "=" * 50 + "\n\n")
         self.output_text.see(tk.END)
         
     def display_error(self, error_message):
         """Display an error message"""
-        self.output_text.insert(tk.END, f"ERROR: {error_message}\n")
-        self.output_text.insert(tk.END, "\n" + "=" * 50 + "\n\n")
+        self.append_output(f"ERROR: {error_message}\n")
+        self.append_output("\n" + "=" * 50 + "\n\n")
         self.output_text.see(tk.END)
         self.status_var.set("Error occurred")
         
@@ -721,27 +3340,743 @@ class GAMSimplifiedGUI:
         from_user = self.from_user_entry.get().strip()
         to_user = self.to_user_entry.get().strip()
         
-        if from_user and to_user:
-            response = messagebox.askyesno("Confirm", f"Transfer all files from {from_user} to {to_user}?")
-            if response:
-                # This is a complex operation that might need multiple commands
-                self.run_gam_command(f"gam user {from_user} transfer drive {to_user}")
-        else:
-            messagebox.showwarning("Warning", "Please enter both from and to user emails")
+        if from_user and to_user:
+            response = messagebox.askyesno("Confirm", f"Transfer all files from {from_user} to {to_user}?")
+            if response:
+                # Large drives take far longer than a normal command, so this goes through the transfer queue
+                self.queue_drive_transfers([(from_user, to_user)])
+        else:
+            messagebox.showwarning("Warning", "Please enter both from and to user emails")
+            
+    def analyze_drive_usage(self):
+        """Stream the drive file listing of a user or OU and total it up as it arrives
+        
+        Rows are counted and dropped as soon as they are read, so even drives
+        with hundreds of thousands of files only cost the per-owner and
+        per-type totals. The listing has no timeout; cancel it from the Jobs tab.
+        """
+        target = self.drive_usage_entry.get().strip()
+        scope = self.drive_usage_scope.get()
+        if not target:
+            messagebox.showwarning("Warning", "Please enter a user email or OU path")
+            return
+        if scope == "OU" and not self.is_known_ou(target):
+            messagebox.showwarning("Warning", "Please enter a known organizational unit path")
+            return
+            
+        fields = ','.join(DRIVE_USAGE_FIELDS)
+        if scope == "OU":
+            command = f'gam ou_and_children "{target}" print filelist showownedby me fields {fields}'
+        else:
+            command = f"gam user {target} print filelist showownedby me fields {fields}"
+            
+        self.drive_usage_summary.config(text=f"🔄 Listing files for {target}...")
+        self.show_drive_usage(DriveUsageAggregator())
+        
+        def analyze(job):
+            usage = DriveUsageAggregator()
+            process = None
+            started = time.monotonic()
+            try:
+                process = job.popen(command)
+                stderr_chunks = []
+                stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()))
+                stderr_thread.daemon = True
+                stderr_thread.start()
+                
+                reader = GAMCSVReader(process.stdout)
+                if reader.find_header():
+                    usage.bind(reader.headers)
+                last_refresh = time.monotonic()
+                for fields in reader.rows():
+                    usage.add(fields)
+                    if time.monotonic() - last_refresh >= DRIVE_USAGE_REFRESH_SECONDS:
+                        last_refresh = time.monotonic()
+                        job.set_progress(f"{usage.files} files")
+                        self.post_drive_usage(usage, f"🔄 {target}")
+                        
+                returncode = process.wait()
+                stderr_thread.join()
+                job.check_cancelled()
+                stderr = ''.join(chunk for chunk in stderr_chunks if chunk).strip()
+                if returncode != 0:
+                    message = f"❌ File listing failed for {target}: {stderr.splitlines()[-1] if stderr else returncode}"
+                else:
+                    message = f"✅ {target}"
+            except JobCancelled:
+                message = f"⏹ Cancelled, partial totals for {target}"
+            except Exception as e:
+                message = f"❌ Error analyzing drive usage: {str(e)}"
+            finally:
+                if process:
+                    job.release(process)
+                    
+            self.post_drive_usage(usage, f"{message} in {self.describe_age(time.monotonic() - started)}")
+            
+        self.job_scheduler.submit(f"Drive usage for {scope} {target}", analyze, PRIORITY_BULK)
+        
+    def post_drive_usage(self, usage, prefix):
+        """Hand a snapshot of the running totals to the GUI thread"""
+        snapshot = (usage.files, usage.bytes, usage.shared_external, len(usage.owners),
+                    usage.top_owners(), usage.top_mime_types())
+        self.ui_updates.post(lambda: self.show_drive_usage(snapshot, prefix), key='drive_usage')
+        
+    def show_drive_usage(self, usage, prefix=""):
+        if isinstance(usage, DriveUsageAggregator):
+            usage = (usage.files, usage.bytes, usage.shared_external, len(usage.owners),
+                     usage.top_owners(), usage.top_mime_types())
+        files, total_bytes, shared_external, owners, top_owners, top_mime_types = usage
+        
+        self.usage_owner_tree.delete(*self.usage_owner_tree.get_children())
+        for owner, owner_files, owner_bytes, external in top_owners:
+            self.usage_owner_tree.insert('', 'end', values=(owner, owner_files, self.format_bytes(owner_bytes), external))
+        self.usage_type_tree.delete(*self.usage_type_tree.get_children())
+        for mime_type, type_files, type_bytes in top_mime_types:
+            self.usage_type_tree.insert('', 'end', values=(mime_type, type_files, self.format_bytes(type_bytes)))
+            
+        if prefix:
+            self.drive_usage_summary.config(text=f"{prefix}: {files} files, {self.format_bytes(total_bytes)}, "
+                                                 f"{owners} owners, {shared_external} shared externally")
+                                                 
+    def format_bytes(self, size):
+        """Describe a byte count as a short human readable string"""
+        for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+            if size < 1024 or unit == 'TB':
+                return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+            size /= 1024
+            
+    def queue_transfers_from_csv(self):
+        """Queue one transfer per row of a CSV file of from/to user pairs"""
+        filename = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                                              title="Queue Drive Transfers")
+        if not filename:
+            return
+            
+        try:
+            with open(filename, newline='', encoding='utf-8-sig') as csvfile:
+                # Without a header the first two columns are taken as from and to
+                first_line = csvfile.readline()
+                reader = GAMCSVReader(itertools.chain([first_line], csvfile), has_header='@' not in first_line)
+                reader.find_header()
+                from_idx = reader.column('from', 'fromuser', 'olduser', 'source', default=0)
+                to_idx = reader.column('to', 'touser', 'newuser', 'target', default=1)
+                pairs = [(fields[from_idx].strip(), fields[to_idx].strip()) for fields in reader.rows()
+                         if len(fields) > max(from_idx, to_idx) and '@' in fields[from_idx] and '@' in fields[to_idx]]
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read transfer list: {str(e)}")
+            return
+            
+        if not pairs:
+            messagebox.showwarning("Warning", "No from/to user pairs found in the file")
+            return
+        response = messagebox.askyesno("Confirm", f"Queue {len(pairs)} drive transfers from {os.path.basename(filename)}?\n\n"
+                                                  f"First: {pairs[0][0]} → {pairs[0][1]}")
+        if response:
+            self.queue_drive_transfers(pairs)
+            
+    def queue_drive_transfers(self, pairs):
+        """Add transfers to the queue and start as many as the concurrency limit allows"""
+        for from_user, to_user in pairs:
+            transfer_id = str(next(self.transfer_ids))
+            self.drive_transfers[transfer_id] = {
+                'id': transfer_id, 'from': from_user, 'to': to_user, 'state': 'queued', 'progress': "",
+                'queued': datetime.now(), 'started': None, 'finished': None, 'error': None, 'job': None
+            }
+            self.transfers_tree.insert('', 'end', iid=transfer_id)
+            self.update_transfer_row(transfer_id)
+        self.start_queued_transfers()
+        
+    def start_queued_transfers(self):
+        running = sum(1 for transfer in self.drive_transfers.values() if transfer['state'] in ('starting', 'running'))
+        try:
+            limit = min(max(1, int(self.transfer_concurrency.get())), MAX_TRANSFER_LIMIT)
+        except (tk.TclError, ValueError):
+            limit = MAX_CONCURRENT_TRANSFERS
+            
+        # Transfers run for hours, so each gets its own thread instead of holding a bulk slot
+        # that reports, sweeps and bulk sign-outs are waiting for
+        for transfer in self.drive_transfers.values():
+            if running >= limit:
+                break
+            if transfer['state'] == 'queued':
+                transfer['state'] = 'starting'
+                transfer['job'] = self.job_scheduler.submit_dedicated(
+                    f"Transfer drive {transfer['from']} → {transfer['to']}", self.run_drive_transfer(transfer))
+                self.update_transfer_row(transfer['id'])
+                running += 1
+        self.update_transfer_summary()
+        
+    def run_drive_transfer(self, transfer):
+        """Return the job function for one transfer; it streams GAM's output and has no timeout"""
+        command = f"gam user {transfer['from']} transfer drive {transfer['to']}"
+        prefix = f"[{transfer['from']} → {transfer['to']}] "
+        
+        def show_line(line):
+            line = line.strip()
+            if line:
+                transfer['progress'] = line
+                self.ui_updates.post_output(prefix + line + "\n")
+                self.ui_updates.post(lambda: self.update_transfer_row(transfer['id']), key=f"transfer_{transfer['id']}")
+                
+        def execute_transfer(job):
+            transfer['started'] = datetime.now()
+            
+            def begin():
+                if transfer['state'] == 'starting':
+                    transfer['state'] = 'running'
+                self.update_transfer_row(transfer['id'])
+            self.ui_updates.post(begin)
+            
+            process = None
+            state, error = 'failed', None
+            try:
+                self.ui_updates.post_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Executing: {command}\n")
+                process = job.popen(command, bufsize=1)
+                
+                # GAM reports some progress on stderr, so both pipes feed the progress column;
+                # only the last few lines are kept for the error message
+                stderr_lines = deque(maxlen=20)
+                def read_stderr():
+                    for line in process.stderr:
+                        stderr_lines.append(line)
+                        show_line(line)
+                stderr_thread = threading.Thread(target=read_stderr)
+                stderr_thread.daemon = True
+                stderr_thread.start()
+                
+                for line in process.stdout:
+                    show_line(line)
+                returncode = process.wait()
+                stderr_thread.join()
+                job.check_cancelled()
+                
+                if returncode == 0:
+                    state = 'done'
+                else:
+                    error = ''.join(stderr_lines).strip().splitlines()[-1] if ''.join(stderr_lines).strip() \
+                        else f"GAM exited with code {returncode}"
+            except JobCancelled:
+                state, error = 'cancelled', "Cancelled"
+            except Exception as e:
+                error = str(e)
+            finally:
+                if process:
+                    job.release(process)
+                    
+            transfer['finished'] = datetime.now()
+            self.record_transfer(transfer, state, error)
+            
+            def finish():
+                transfer['state'] = state
+                transfer['error'] = error
+                if error:
+                    transfer['progress'] = error
+                self.update_transfer_row(transfer['id'])
+                self.start_queued_transfers()
+            self.ui_updates.post(finish)
+            
+        return execute_transfer
+        
+    def record_transfer(self, transfer, state, error):
+        """Append a finished transfer to the transfer log so unattended batches can be reviewed"""
+        entry = {
+            'from': transfer['from'], 'to': transfer['to'], 'state': state, 'error': error,
+            'last_output': transfer['progress'],
+            'started': transfer['started'].isoformat(timespec='seconds') if transfer['started'] else None,
+            'finished': transfer['finished'].isoformat(timespec='seconds')
+        }
+        try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            with open(TRANSFER_LOG_FILE, 'a', encoding='utf-8') as log_file:
+                log_file.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            self.ui_updates.post_output(f"Could not write transfer log: {str(e)}\n")
+            
+    def update_transfer_row(self, transfer_id):
+        transfer = self.drive_transfers.get(transfer_id)
+        if not transfer or not self.transfers_tree.exists(transfer_id):
+            return
+        started = transfer['started'].strftime('%H:%M:%S') if transfer['started'] else ""
+        duration = ""
+        if transfer['started']:
+            duration = str((transfer['finished'] or datetime.now()) - transfer['started']).split('.')[0]
+        self.transfers_tree.item(transfer_id, values=(transfer['from'], transfer['to'], transfer['state'],
+                                                       transfer['progress'], started, duration))
+                                                       
+    def update_transfer_summary(self):
+        counts = {}
+        for transfer in self.drive_transfers.values():
+            counts[transfer['state']] = counts.get(transfer['state'], 0) + 1
+        if counts:
+            summary = ", ".join(f"{count} {state}" for state, count in counts.items())
+            self.transfer_summary_label.config(text=f"{summary} (logged to {TRANSFER_LOG_FILE})")
+            
+    def cancel_selected_transfers(self):
+        """Drop queued transfers and stop running ones"""
+        for transfer_id in self.transfers_tree.selection():
+            transfer = self.drive_transfers.get(transfer_id)
+            if not transfer:
+                continue
+            if transfer['state'] == 'queued':
+                transfer['state'] = 'cancelled'
+                self.update_transfer_row(transfer_id)
+            elif transfer['state'] in ('starting', 'running') and transfer['job']:
+                # The transfer's own thread records it and starts the next queued one
+                transfer['job'].cancel()
+        self.update_transfer_summary()
+        
+    def clear_finished_transfers(self):
+        for transfer_id, transfer in list(self.drive_transfers.items()):
+            if transfer['state'] not in ('queued', 'starting', 'running'):
+                del self.drive_transfers[transfer_id]
+                self.transfers_tree.delete(transfer_id)
+        self.update_transfer_summary()
+            
+    def get_group_members(self):
+        """Show a group's members, owners and managers, from the cache when possible"""
+        group_email = self.group_email_entry.get().strip()
+        if not group_email:
+            messagebox.showwarning("Warning", "Please enter a group email")
+            return
+            
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if mirror:
+                self.show_mirror_rows(f"Members of {group_email}", ['email', 'role'],
+                                      mirror.group_members(group_email), 'memberships')
+            return
+            
+        roles = [('members', 'member'), ('owners', 'owner'), ('managers', 'manager')]
+        self.apply_membership_cache_ttl()
+        
+        cached = None if self.bypass_membership_cache.get() else self.cached_group_roles(group_email, roles)
+        self.update_cache_status()
+        
+        if cached is None:
+            def cache_members(output):
+                fetched = self.parse_group_members(output, group_email)
+                fetched.setdefault(group_email.lower(), {'members': [], 'owners': [], 'managers': []})
+                self.cache_group_roles(fetched, roles)
+                self.save_membership_cache()
+                
+            self.run_gam_command(f"gam print group-members group {group_email}", on_success=cache_members)
+            return
+            
+        age = self.membership_cache.age(group_email, 'member') or 0
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Cached members of {group_email} "
+                           f"(fetched {self.describe_age(age)} ago, tick 'Bypass Cache' to refetch)\n")
+        self.append_output("-" * 50 + "\n")
+        rows = [f"{email},{role.upper()}\n" for role_key, role in roles for email in cached[role_key]]
+        self.append_output("email,role\n" + ''.join(rows))
+        self.append_output("\n" + "=" * 50 + "\n\n")
+        self.output_text.see(tk.END)
+        self.notebook.select(6)  # Output tab index
+        self.status_var.set(f"Loaded {group_email} members from cache")
+        
+    def get_user_info(self):
+        """Show a user's details, from the local mirror when enabled"""
+        email = self.user_email_entry.get().strip()
+        if not email:
+            messagebox.showwarning("Warning", "Please enter a user email")
+            return
+            
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if mirror:
+                user = mirror.user(email)
+                self.show_mirror_rows(f"User {email}", MIRROR_USER_COLUMNS, [user] if user else [], 'users')
+            return
+            
+        self.run_gam_command(f"gam info user {email}")
+        
+    def show_user_groups(self):
+        """Show which groups a user is in, from the mirror or the membership index"""
+        email = self.user_email_entry.get().strip()
+        if not email:
+            messagebox.showwarning("Warning", "Please enter a user email")
+            return
+            
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if mirror:
+                self.show_mirror_rows(f"Groups for {email}", ['group', 'role'],
+                                      mirror.groups_for_member(email), 'memberships')
+            return
+            
+        if not self.membership_index.is_complete():
+            # A partial index cannot show every group the user is in, so ask GAM directly
+            self.run_gam_command(f"gam print groups member {email}")
+            return
+            
+        indexed_groups = self.membership_index.group_count()
+        groups = self.membership_index.groups_for(email)
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Groups for {email} "
+                           f"(from the membership index of all {indexed_groups} groups)\n")
+        self.append_output("-" * 50 + "\n")
+        rows = [f"{group},{'/'.join(role.upper() for role in roles)}\n" for group, roles in groups]
+        self.append_output("group,role\n" + ''.join(rows))
+        self.append_output("\n" + "=" * 50 + "\n\n")
+        self.output_text.see(tk.END)
+        self.notebook.select(6)  # Output tab index
+        self.status_var.set(f"{email} is in {len(groups)} of {indexed_groups} groups")
+        
+    def list_users_in_single_ou(self):
+        """List the users in the OU selected in the single OU picker"""
+        ou = self.ou_combobox.get().strip()
+        if not ou or not self.is_known_ou(ou):
+            messagebox.showwarning("Warning", "Please select an organizational unit")
+            return
+            
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if mirror:
+                self.show_mirror_rows(f"Users in {ou}", MIRROR_USER_COLUMNS,
+                                      mirror.users_in_ou(ou, include_children=True), 'users')
+            return
+            
+        self.run_gam_command(self.users_in_ou_command(ou, USER_LISTING_FIELDS))
+        
+    def users_in_ou_command(self, ou_path, fields):
+        """One bulk listing of an OU and its sub-OUs, with only the given fields"""
+        return f"gam print users query \"orgUnitPath='{ou_path}'\" fields {','.join(fields)}"
+                             
+    def get_directory_mirror(self):
+        """Open the local directory mirror on first use"""
+        if self.directory_mirror is None:
+            try:
+                self.directory_mirror = DirectoryMirror()
+            except (OSError, sqlite3.Error) as e:
+                messagebox.showerror("Error", f"Could not open local directory mirror: {str(e)}")
+                return None
+        return self.directory_mirror
+        
+    def show_mirror_rows(self, title, columns, rows, table):
+        """Write rows answered by the local mirror to the Output tab"""
+        synced_at = self.directory_mirror.synced_at(table)
+        if synced_at is None:
+            age_text = "never synced, use Sync Changes or Full Sync first"
+        else:
+            age_text = f"snapshot {self.describe_age(time.time() - synced_at)} old"
+            if table == 'memberships':
+                age_text += f", {self.describe_full_membership_sync()}"
+            
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        writer.writerows(rows)
+        
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] {title} from local mirror ({age_text})\n")
+        self.append_output("-" * 50 + "\n")
+        self.append_output(buffer.getvalue())
+        self.append_output(f"{len(rows)} rows\n" + "=" * 50 + "\n\n")
+        self.output_text.see(tk.END)
+        self.notebook.select(6)  # Output tab index
+        self.status_var.set(f"{title}: {len(rows)} rows from local mirror ({age_text})")
+        
+    def update_mirror_status(self):
+        """Show how old the local mirror's snapshot is next to its lookups"""
+        if self.directory_mirror is None and not os.path.exists(DIRECTORY_MIRROR_FILE):
+            user_text = group_text = "Not synced yet"
+        else:
+            mirror = self.get_directory_mirror()
+            if not mirror:
+                return
+            now = time.time()
+            users_at = mirror.synced_at('users')
+            groups_at = mirror.synced_at('memberships')
+            user_text = f"Users synced {self.describe_age(now - users_at)} ago" if users_at else "Users not synced"
+            group_text = (f"Memberships checked {self.describe_age(now - groups_at)} ago, "
+                          f"{self.describe_full_membership_sync()}" if groups_at else "Memberships not synced")
+        self.user_mirror_label.config(text=user_text)
+        self.group_mirror_label.config(text=group_text)
+        
+    def describe_full_membership_sync(self):
+        """Say when every group's memberships were last refetched
+        
+        Sync Changes only refetches groups whose member count changed, so
+        member swaps and role changes show up only after a full refresh.
+        """
+        full_at = self.directory_mirror.synced_at('memberships_full')
+        if full_at is None:
+            return "never fully refreshed (member swaps and role changes need a Full Sync)"
+        return f"full refresh {self.describe_age(time.time() - full_at)} ago"
+        
+    def sync_directory_mirror(self, full=False):
+        """Refresh the local mirror from bulk GAM exports
+        
+        Users, groups and OUs are always re-exported in full, even by Sync
+        Changes, since each is a single paged call. Group memberships are only
+        refetched for groups that are new or whose direct member count changed,
+        which misses member swaps and role changes. So every group is refetched
+        when full is set or the last full refresh is older than
+        MIRROR_FULL_MEMBERSHIP_SYNC_AGE.
+        """
+        mirror = self.get_directory_mirror()
+        if not mirror:
+            return
+            
+        try:
+            max_workers = max(1, int(self.report_concurrency.get()))
+            timeout = max(1, int(self.report_timeout.get()))
+            batch_size = max(1, int(self.report_batch_size.get()))
+        except (tk.TclError, ValueError):
+            max_workers, timeout, batch_size = DEFAULT_MAX_CONCURRENCY, DEFAULT_JOB_TIMEOUT, DEFAULT_GROUPS_PER_CALL
+        backend = self.execution_backend.get()
+        roles = [('members', 'member'), ('owners', 'owner'), ('managers', 'manager')]
+        
+        def sync(job):
+            def set_progress(text):
+                job.set_progress(text)
+                self.ui_updates.post(lambda: self.user_mirror_label.config(text=f"🔄 {text}"), key='mirror_status')
+                
+            def run_export(command):
+                result = job.run_process(command, timeout=DEFAULT_COMMAND_TIMEOUT * 4)
+                if result.returncode != 0:
+                    raise RuntimeError(f"{command} failed: {result.stderr.strip()}")
+                return list(GAMCSVReader(result.stdout).records())
+                
+            try:
+                set_progress("Exporting OUs...")
+                rows = run_export("gam print orgs")
+                mirror.replace_org_units([(r.get('orgunitpath', ''), r.get('name', '')) for r in rows
+                                          if r.get('orgunitpath')])
+                                          
+                set_progress("Exporting users...")
+                rows = run_export("gam print users fields primaryemail,name,orgunitpath,suspended,lastlogintime")
+                mirror.replace_users([(r.get('primaryemail', ''), r.get('name.fullname', ''),
+                                       r.get('orgunitpath', ''), r.get('suspended', ''),
+                                       r.get('lastlogintime', '')) for r in rows if r.get('primaryemail')])
+                                       
+                set_progress("Exporting groups...")
+                rows = run_export("gam print groups fields email,name,description,directmemberscount")
+                mirror.replace_groups([(r.get('email', ''), r.get('name', ''), r.get('description', ''),
+                                        int(r['directmemberscount']) if r.get('directmemberscount', '').isdigit() else None)
+                                       for r in rows if r.get('email')])
+                                       
+                full_at = mirror.synced_at('memberships_full')
+                refresh_all = full or full_at is None or time.time() - full_at > MIRROR_FULL_MEMBERSHIP_SYNC_AGE
+                group_emails = mirror.group_emails() if refresh_all else mirror.stale_membership_groups()
+                chunks = [group_emails[i:i + batch_size] for i in range(0, len(group_emails), batch_size)]
+                commands = [self.group_members_command(chunk, roles) for chunk in chunks]
+                synced = [0]
+                failed = [0]
+                lock = threading.Lock()
+                
+                def on_result(index, command, result, completed):
+                    group_roles = self.group_roles_from_result(result, chunks[index], roles, timeout)
+                    if group_roles is None:
+                        # Fall back to one call per group for GAM versions without 'select'
+                        retry = self.run_gam_commands([self.group_members_command([email], roles)
+                                                       for email in chunks[index]], timeout, 1, backend, job=job)
+                        group_roles = {}
+                        for email, retry_result in zip(chunks[index], retry):
+                            group_roles.update(self.group_roles_from_result(retry_result, [email], roles, timeout) or {})
+                            
+                    # Only store memberships that were fetched without errors
+                    group_roles = {email: fetched for email, fetched in group_roles.items()
+                                   if not any(e.startswith("Error:") for emails in fetched.values() for e in emails)}
+                    mirror.replace_memberships(group_roles)
+                    self.cache_group_roles(group_roles, roles)
+                    with lock:
+                        failed[0] += len(chunks[index]) - len(group_roles)
+                        synced[0] += len(chunks[index])
+                        done = synced[0]
+                    set_progress(f"Memberships {done}/{len(group_emails)} groups")
+                    
+                set_progress(f"Memberships 0/{len(group_emails)} groups")
+                self.run_gam_commands(commands, timeout, max_workers, backend, on_result=on_result, job=job)
+                job.check_cancelled()
+                
+                # Groups that failed keep their old memberships, so only a clean run counts as a full refresh
+                if refresh_all and not failed[0]:
+                    mirror.mark_full_membership_sync()
+                refreshed = f"all {len(group_emails)}" if refresh_all else f"{len(group_emails)} changed"
+                message = f"✅ Local mirror synced ({refreshed} groups refreshed)"
+                if failed[0]:
+                    message += f", {failed[0]} failed"
+            except JobCancelled:
+                message = "⏹ Mirror sync cancelled"
+            except Exception as e:
+                message = f"❌ Mirror sync failed: {str(e)}"
+                
+            self.ui_updates.post(lambda: self.status_var.set(message))
+            self.ui_updates.post(self.update_mirror_status, key='mirror_status')
+            
+        self.job_scheduler.submit("Full mirror sync" if full else "Incremental mirror sync", sync, PRIORITY_BULK)
+        
+    def generate_user_report(self):
+        """Build the user report from one bulk listing per selected OU"""
+        ous = list(self.selected_ous)
+        if ous and self.collapse_nested_ous.get():
+            ous = self.collapse_ou_paths(ous)
+        if not ous:
+            ou = self.ou_combobox.get().strip()
+            if self.is_known_ou(ou):
+                ous = [ou]
+        if not ous:
+            messagebox.showwarning("Warning", "Please add OUs to the Selected OUs list, or pick an OU above")
+            return
+            
+        # Only ask GAM for the fields the report needs
+        include_basic = self.include_basic_info.get()
+        include_groups = self.include_groups.get()
+        include_last_login = self.include_last_login.get()
+        include_ou_path = self.include_ou_path.get()
+        fields = ['primaryemail']
+        header = ['Email']
+        if include_basic:
+            fields.extend(['name', 'suspended'])
+            header.extend(['Name', 'Suspended'])
+        if include_last_login:
+            fields.append('lastlogintime')
+            header.append('Last Login')
+        if include_ou_path:
+            fields.append('orgunitpath')
+            header.append('OU Path')
+        if include_groups:
+            header.append('Groups')
+            
+        # Group memberships come from the local mirror or the membership index, never per-user calls
+        mirror = None
+        if self.use_directory_mirror.get():
+            mirror = self.get_directory_mirror()
+            if not mirror:
+                return
+        elif include_groups and not self.membership_index.group_count():
+            if not messagebox.askyesno("Group Memberships",
+                                       "No group memberships have been fetched yet, so the Groups column "
+                                       "will be empty.\n\nRun a group report or a mirror sync first to fill it. "
+                                       "Continue anyway?"):
+                return
+                
+        self.user_report_status.config(text=f"🔄 Generating report for {len(ous)} OU(s)...")
+        
+        def user_groups(email):
+            if mirror:
+                return sorted({group for group, role in mirror.groups_for_member(email)})
+            return [group for group, roles in self.membership_index.groups_for(email)]
+            
+        def remove_spool_file(spool_file):
+            if spool_file:
+                try:
+                    os.remove(spool_file)
+                except OSError:
+                    pass
+                    
+        def generate_report(job):
+            seen = set()
+            failed = []
+            spool_file = None
+            try:
+                # Created here rather than up front so a report cancelled while queued leaves nothing behind
+                fd, spool_file = tempfile.mkstemp(prefix="user_report_", suffix=".csv")
+                os.close(fd)
+                with open(spool_file, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(header)
+                    
+                    def write_users(records):
+                        for record in records:
+                            email = record.get('primaryemail', '').strip()
+                            if not email or email.lower() in seen:
+                                continue  # Users in nested OUs come back once per enclosing query
+                            seen.add(email.lower())
+                            row = [email]
+                            if include_basic:
+                                name = record.get('name.fullname') or ' '.join(
+                                    filter(None, [record.get('name.givenname'), record.get('name.familyname')]))
+                                row.extend([name, record.get('suspended', '')])
+                            if include_last_login:
+                                row.append(record.get('lastlogintime', ''))
+                            if include_ou_path:
+                                row.append(record.get('orgunitpath', ''))
+                            if include_groups:
+                                row.append('; '.join(user_groups(email)))
+                            writer.writerow(row)
+                            
+                    if mirror:
+                        for ou in ous:
+                            write_users(dict(zip(MIRROR_USER_KEYS, user))
+                                        for user in mirror.users_in_ou(ou, include_children=True))
+                    else:
+                        commands = [self.users_in_ou_command(ou, fields) for ou in ous]
+                        
+                        def on_result(index, command, result, completed):
+                            if isinstance(result, Exception) or result is None or result.returncode != 0:
+                                failed.append(ous[index])
+                            else:
+                                write_users(GAMCSVReader(result.stdout).records())
+                            csvfile.flush()
+                            job.set_progress(f"{completed}/{len(ous)} OUs, {len(seen)} users")
+                            self.ui_updates.post(lambda completed=completed, users=len(seen): self.user_report_status.config(
+                                text=f"🔄 {completed}/{len(ous)} OUs listed, {users} users"), key='user_report_status')
+                                
+                        self.run_gam_commands(commands, DEFAULT_COMMAND_TIMEOUT, DEFAULT_MAX_CONCURRENCY,
+                                              on_result=on_result, job=job, keep_results=False)
+                        job.check_cancelled()
+                        
+                def finish():
+                    self.discard_user_report()
+                    self.user_report_file = spool_file
+                    self.user_report_rows = len(seen)
+                    suffix = f", {len(failed)} OU(s) failed: {', '.join(failed[:3])}" if failed else ""
+                    self.user_report_status.config(text=f"✅ Report ready: {len(seen)} users from {len(ous)} OU(s){suffix}")
+                self.ui_updates.post(finish, key='user_report_status')
+                
+            except JobCancelled:
+                remove_spool_file(spool_file)
+                self.ui_updates.post(lambda: self.user_report_status.config(text="⏹ Report cancelled"),
+                                     key='user_report_status')
+            except Exception as e:
+                remove_spool_file(spool_file)
+                self.ui_updates.post(lambda e=e: self.user_report_status.config(
+                    text=f"❌ Error generating report: {str(e)}"), key='user_report_status')
+                    
+        self.job_scheduler.submit(f"User report ({len(ous)} OUs)", generate_report, PRIORITY_BULK)
+        
+    def save_user_report(self):
+        """Save the generated user report to a CSV file"""
+        if not self.user_report_file or not os.path.exists(self.user_report_file):
+            messagebox.showwarning("Warning", "No report data to save. Please generate a report first.")
+            return
+            
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Save User Report"
+        )
+        if not filename:
+            return
+            
+        try:
+            shutil.copyfile(self.user_report_file, filename)
+            messagebox.showinfo("Success", f"User report ({self.user_report_rows} users) saved to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save report: {str(e)}")
+            
+    def discard_user_report(self):
+        """Remove the spool file of the previous user report"""
+        if self.user_report_file:
+            try:
+                os.remove(self.user_report_file)
+            except OSError:
+                pass
+            self.user_report_file = None
+            self.user_report_rows = 0
             
     def list_groups_in_ou(self):
         """List all groups for users in a specific OU"""
         ou = self.group_ou_combobox.get().strip()
-        if ou and ou != "Loading OUs..." and ou != "No OUs found":
+        # The combobox is editable, so only accept a loaded OU unless the OU list could not be loaded
+        if ou and self.is_known_ou(ou):
             # This might require a more complex command depending on GAM version
             self.run_gam_command(f"gam ou \"{ou}\" print groups")
         else:
             messagebox.showwarning("Warning", "Please select an organizational unit")
             
     def save_output(self):
-        """Save the output to a file"""
-        output_content = self.output_text.get(1.0, tk.END)
-        if output_content.strip():
+        """Save the session's output log to a file"""
+        if self.session_log.has_content():
             filename = filedialog.asksaveasfilename(
                 defaultextension=".txt",
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
@@ -749,8 +4084,7 @@ class GAMSimplifiedGUI:
             )
             if filename:
                 try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(output_content)
+                    self.session_log.export(filename)
                     messagebox.showinfo("Success", f"Output saved to {filename}")
                 except Exception as e:
                     messagebox.showerror("Error", f"Could not save file: {str(e)}")
@@ -845,6 +4179,307 @@ class GAMSimplifiedGUI:
     
 
     
+    def browse_sweep_csv(self):
+        filename = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if filename:
+            self.sweep_source.set("CSV File")
+            self.sweep_target_entry.delete(0, tk.END)
+            self.sweep_target_entry.insert(0, filename)
+            
+    def event_search_command(self, user_email, query, start_date, end_date):
+        """Build the event search for one mailbox from a query and/or date range"""
+        command = f'gam user {user_email} print events query "{query}"' if query else \
+            f"gam user {user_email} print calendar-events"
+        if start_date:
+            command += f" starttime {start_date}T00:00:00"
+        if end_date:
+            command += f" endtime {end_date}T23:59:59"
+        return command
+        
+    def resolve_user_targets(self, job, source, target):
+        """Resolve an OU, group, CSV file or pasted list to deduplicated user emails"""
+        if source == "Pasted List":
+            emails = re.split(r'[\s,;]+', target)
+        elif source == "CSV File":
+            with open(target, newline='', encoding='utf-8-sig') as csvfile:
+                # A plain list of addresses has no header row
+                first_line = csvfile.readline()
+                reader = GAMCSVReader(itertools.chain([first_line], csvfile), has_header='@' not in first_line)
+                reader.find_header()
+                email_idx = reader.column('primaryemail', 'email', 'user', default=0)
+                emails = [fields[email_idx] for fields in reader.rows() if len(fields) > email_idx]
+        else:
+            if source == "Group":
+                command = f"gam print group-members group {target} recursive noduplicates types user"
+            else:
+                command = self.users_in_ou_command(target, ['primaryemail'])
+            result = job.run_process(command, timeout=DEFAULT_COMMAND_TIMEOUT * 4)
+            if result.returncode != 0:
+                raise RuntimeError(f"{command} failed: {result.stderr.strip()}")
+            reader = GAMCSVReader(result.stdout)
+            reader.find_header()
+            email_idx = reader.column('primaryemail', 'email', default=0)
+            emails = [fields[email_idx] for fields in reader.rows() if len(fields) > email_idx]
+            
+        seen = set()
+        users = []
+        for email in emails:
+            email = email.strip()
+            if '@' in email and email.lower() not in seen:
+                seen.add(email.lower())
+                users.append(email)
+        return users
+        
+    def sweep_calendar_events(self):
+        """Run the event search across every mailbox in an OU, group or CSV file
+        
+        Searches run on the fan-out pool (or as shared GAM batches) and each
+        mailbox's matches are appended to the event list as soon as it returns.
+        """
+        source = self.sweep_source.get()
+        target = self.sweep_target_entry.get().strip()
+        query = self.event_query_entry.get().strip()
+        start_date = self.start_date_entry.get().strip()
+        end_date = self.end_date_entry.get().strip()
+        
+        if not target:
+            messagebox.showwarning("Warning", f"Please enter the {source} to sweep")
+            return
+        if source == "OU" and not self.is_known_ou(target):
+            messagebox.showwarning("Warning", "Please enter a known organizational unit path")
+            return
+        if source == "CSV File" and not os.path.exists(target):
+            messagebox.showwarning("Warning", f"CSV file not found: {target}")
+            return
+        if not query and not start_date and not end_date:
+            messagebox.showwarning("Warning", "Please enter a search query or a date range to sweep for")
+            return
+        for date_text in (start_date, end_date):
+            if date_text:
+                try:
+                    datetime.strptime(date_text, '%Y-%m-%d')
+                except ValueError:
+                    messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format")
+                    return
+                    
+        try:
+            max_workers = max(1, int(self.sweep_concurrency.get()))
+        except (tk.TclError, ValueError):
+            max_workers = DEFAULT_MAX_CONCURRENCY
+        backend = 'batch' if self.sweep_use_batch.get() else 'process'
+        
+        self.clear_event_selection()
+        self.parsed_events = []
+        self.event_listbox.set_rows([])
+        self.sweep_status_label.config(text=f"🔄 Resolving mailboxes in {source} {target}...")
+        
+        def set_status(text):
+            self.ui_updates.post(lambda: self.sweep_status_label.config(text=text), key='sweep_status')
+            
+        def sweep(job):
+            try:
+                mailboxes = self.resolve_user_targets(job, source, target)
+                job.check_cancelled()
+                commands = [self.event_search_command(email, query, start_date, end_date) for email in mailboxes]
+                started = time.monotonic()
+                matches = [0]
+                failed = []
+                
+                def on_result(index, command, result, completed):
+                    if isinstance(result, Exception) or result is None or result.returncode != 0:
+                        failed.append(mailboxes[index])
+                    else:
+                        events, error_message = self.read_calendar_events(result.stdout)
+                        for event_data in events:
+                            event_data['swept'] = True
+                        if events:
+                            matches[0] += len(events)
+                            self.ui_updates.post(lambda events=events: self.add_swept_events(events))
+                    rate = completed / max(time.monotonic() - started, 0.001)
+                    progress = (f"{completed}/{len(mailboxes)} mailboxes, {matches[0]} matches, "
+                                f"{rate:.1f} mailboxes/s")
+                    job.set_progress(progress)
+                    set_status(f"🔄 {progress}")
+                    
+                set_status(f"🔄 0/{len(mailboxes)} mailboxes")
+                self.run_gam_commands(commands, DEFAULT_COMMAND_TIMEOUT, max_workers, backend,
+                                      on_result=on_result, job=job, keep_results=False)
+                job.check_cancelled()
+                
+                elapsed = time.monotonic() - started
+                message = (f"✅ Swept {len(mailboxes)} mailboxes in {elapsed:.0f}s: "
+                           f"{matches[0]} matching events")
+                if failed:
+                    message += f", {len(failed)} mailboxes failed ({', '.join(failed[:3])})"
+            except JobCancelled:
+                message = "⏹ Sweep cancelled"
+            except Exception as e:
+                message = f"❌ Sweep failed: {str(e)}"
+                
+            set_status(message)
+            self.ui_updates.post(lambda: self.status_var.set(message))
+            
+        self.job_scheduler.submit(f"Calendar sweep of {source} {target}", sweep, PRIORITY_BULK)
+        
+    def add_swept_events(self, events):
+        """Append one mailbox's matches to the event list"""
+        self.parsed_events.extend(events)
+        self.event_listbox.append_rows(events)
+        
+    def bulk_sign_out_users(self):
+        """Force sign out every user in an OU, group, CSV file or pasted list
+        
+        The target is resolved to its users first, so the confirmation can
+        show exactly how many accounts will be signed out.
+        """
+        source = self.signout_source.get()
+        if source == "Pasted List":
+            target = self.signout_paste_text.get('1.0', tk.END).strip()
+        else:
+            target = self.signout_target_entry.get().strip()
+        if not target:
+            messagebox.showwarning("Warning", f"Please enter the {source} to sign out")
+            return
+        if source == "OU" and not self.is_known_ou(target):
+            messagebox.showwarning("Warning", "Please enter a known organizational unit path")
+            return
+        if source == "CSV File" and not os.path.exists(target):
+            messagebox.showwarning("Warning", f"CSV file not found: {target}")
+            return
+        try:
+            rate = max(1, int(self.signout_rate.get()))
+        except (tk.TclError, ValueError):
+            rate = DEFAULT_SIGNOUT_RATE
+            
+        where = "the pasted list" if source == "Pasted List" else f"{source} {target}"
+        self.signout_status_label.config(text=f"🔄 Resolving users in {where}...")
+        
+        def resolve_users(job):
+            try:
+                users = self.resolve_user_targets(job, source, target)
+            except JobCancelled:
+                message = "⏹ Bulk sign out cancelled"
+            except Exception as e:
+                message = f"❌ Could not resolve {where}: {str(e)}"
+            else:
+                self.ui_updates.post(lambda: self.confirm_bulk_sign_out(users, where, rate))
+                return
+            self.ui_updates.post(lambda: self.signout_status_label.config(text=message), key='signout_status')
+            
+        self.job_scheduler.submit(f"Resolve users in {where}", resolve_users, PRIORITY_INTERACTIVE)
+        
+    def update_signout_source(self):
+        """Show the paste box only while the Pasted List source is selected"""
+        if self.signout_source.get() == "Pasted List":
+            self.signout_target_entry.config(state='disabled')
+            self.signout_paste_text.pack(side='top', fill='x', pady=2)
+        else:
+            self.signout_target_entry.config(state='normal')
+            self.signout_paste_text.pack_forget()
+            
+    def confirm_bulk_sign_out(self, users, where, rate):
+        """Show how many accounts a bulk sign out hits, then run it as a rate-limited bulk job"""
+        if not users:
+            self.signout_status_label.config(text=f"No users found in {where}")
+            return
+            
+        sample = "\n".join(f"   • {email}" for email in users[:5])
+        if len(users) > 5:
+            sample += f"\n   • ... and {len(users) - 5} more"
+        response = messagebox.askyesno("Confirm Bulk Sign Out",
+                                       f"Force sign out {len(users)} user{'s' if len(users) != 1 else ''} "
+                                       f"in {where}?\n\n"
+                                       f"{sample}\n\n"
+                                       f"This will:\n"
+                                       f"• Sign out each user from all devices\n"
+                                       f"• Invalidate all their active sessions\n"
+                                       f"• Require them to sign in again")
+        if not response:
+            self.signout_status_label.config(text="Bulk sign out cancelled")
+            return
+            
+        self.signout_results = []
+        
+        def set_status(text):
+            self.ui_updates.post(lambda: self.signout_status_label.config(text=text), key='signout_status')
+            
+        def sign_out(job):
+            started = time.monotonic()
+            results = []
+            try:
+                self.ui_updates.post_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Bulk sign out of "
+                                            f"{len(users)} users in {where}\n" + "-" * 50 + "\n"
+                                            "email,result,error\n")
+                failed = [0]
+                
+                def on_result(index, command, result, completed):
+                    if isinstance(result, JobCancelled):
+                        outcome = ('Not run', 'cancelled')
+                    elif isinstance(result, Exception) or result is None or result.returncode != 0:
+                        failed[0] += 1
+                        error = result if isinstance(result, Exception) else getattr(result, 'stderr', '')
+                        outcome = ('Failed', str(error).strip().replace('\n', ' ') or 'failed')
+                    else:
+                        outcome = ('Signed out', '')
+                    results.append((users[index], outcome[0], outcome[1],
+                                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+                                    
+                    # GAM errors often contain commas, so the line is quoted like the exported results
+                    line = io.StringIO()
+                    csv.writer(line, lineterminator='\n').writerow([users[index], outcome[0], outcome[1]])
+                    self.ui_updates.post_output(line.getvalue())
+                    elapsed = time.monotonic() - started
+                    progress = f"{completed}/{len(users)} users, {failed[0]} failed, {elapsed:.0f}s"
+                    job.set_progress(progress)
+                    set_status(f"🔄 {progress}")
+                    
+                set_status(f"🔄 0/{len(users)} users")
+                self.run_gam_commands([f"gam user {email} signout" for email in users], DEFAULT_COMMAND_TIMEOUT,
+                                      DEFAULT_MAX_CONCURRENCY, on_result=on_result, job=job,
+                                      keep_results=False, rate_limiter=RateLimiter(rate))
+                job.check_cancelled()
+                
+                message = (f"✅ Signed out {len(users) - failed[0]} of {len(users)} users "
+                           f"in {time.monotonic() - started:.1f}s")
+                if failed[0]:
+                    message += f", {failed[0]} failed"
+            except JobCancelled:
+                message = f"⏹ Bulk sign out cancelled after {len(results)} users"
+            except Exception as e:
+                message = f"❌ Bulk sign out failed: {str(e)}"
+                
+            def finish():
+                self.signout_results = results
+                self.signout_status_label.config(text=message)
+                self.status_var.set(message)
+            self.ui_updates.post_output("=" * 50 + "\n\n")
+            self.ui_updates.post(finish, key='signout_status')
+            
+        self.job_scheduler.submit(f"Bulk sign out of {where}", sign_out, PRIORITY_BULK)
+        
+    def save_sign_out_results(self):
+        """Export the per-user results of the last bulk sign out"""
+        if not self.signout_results:
+            messagebox.showwarning("Warning", "No sign out results to export. Please run a bulk sign out first.")
+            return
+            
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Export Sign Out Results"
+        )
+        if not filename:
+            return
+            
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(['email', 'result', 'error', 'completed'])
+                writer.writerows(self.signout_results)
+            messagebox.showinfo("Success", f"Sign out results ({len(self.signout_results)} users) saved to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save file: {str(e)}")
+            
     def force_sign_out_user(self):
         """Force sign out a user from all devices"""
         email = self.signout_email_entry.get().strip()
@@ -860,124 +4495,119 @@ class GAMSimplifiedGUI:
         else:
             messagebox.showwarning("Warning", "Please enter a user email")
     
-    def parse_calendar_events(self, output, command):
-        """Parse calendar event output and populate the selection list"""
-        self.parsed_events = []
+    def read_calendar_events(self, lines):
+        """Read calendar events from GAM output text or an iterable of lines
+        
+        The lines are consumed one at a time, so this can run directly on a
+        command's stdout stream. Returns (events, error_message); any lines
+        after the event data are left unread.
+        """
+        events = []
         
         try:
-            lines = output.strip().split('\n')
-            if len(lines) < 2:  # No events found
-                self.event_listbox.delete(0, tk.END)
-                self.event_listbox.insert(0, "No events found")
-                return
-            
             # Skip informational lines like "Getting Events for..."
-            header_line = None
-            data_start = 0
+            reader = GAMCSVReader(lines, is_header=lambda line: line.startswith('primaryEmail,') or 'id,' in line)
             
-            for i, line in enumerate(lines):
-                if line.startswith('primaryEmail,') or 'id,' in line:
-                    header_line = line
-                    data_start = i + 1
-                    break
-            
-            if not header_line:
-                self.event_listbox.delete(0, tk.END)
-                self.event_listbox.insert(0, "Could not parse event data")
-                return
-            
-            # Parse header to get column indices
-            headers = [h.strip() for h in header_line.split(',')]
+            if not reader.find_header():
+                if reader.lines_skipped < 2:  # No events found
+                    return events, "No events found"
+                return events, "Could not parse event data"
             
             # Find required column indices
             try:
-                email_idx = headers.index('primaryEmail')
-                id_idx = headers.index('id')
-                summary_idx = headers.index('summary')
-                start_idx = headers.index('start.dateTime')
-                status_idx = headers.index('status')
+                email_idx = reader.headers.index('primaryemail')
+                id_idx = reader.headers.index('id')
+                summary_idx = reader.headers.index('summary')
+                start_idx = reader.headers.index('start.datetime')
+                status_idx = reader.headers.index('status')
             except ValueError as e:
-                self.event_listbox.delete(0, tk.END)
-                self.event_listbox.insert(0, f"Missing required columns: {e}")
-                return
+                return events, f"Missing required columns: {e}"
             
-            # Parse event data
-            for line_num, line in enumerate(lines[data_start:], data_start + 1):
-                if not line.strip():
-                    continue
+            required = max(email_idx, id_idx, summary_idx, start_idx, status_idx)
+            
+            for fields in reader.rows():
+                if len(fields) <= required:
+                    continue  # Skip malformed lines
                 
+                event_data = {
+                    'email': fields[email_idx],
+                    'id': fields[id_idx],
+                    'summary': fields[summary_idx],
+                    'start_datetime': fields[start_idx],
+                    'status': fields[status_idx],
+                    'line_number': reader.line_num
+                }
+                
+                # Format datetime for display
                 try:
-                    # Parse CSV line (handling commas in quoted fields)
-                    import csv
-                    import io
-                    reader = csv.reader(io.StringIO(line))
-                    fields = next(reader)
+                    if event_data['start_datetime']:
+                        dt = datetime.fromisoformat(event_data['start_datetime'].replace('Z', '+00:00'))
+                        event_data['formatted_datetime'] = dt.strftime('%Y-%m-%d %I:%M %p')
+                    else:
+                        event_data['formatted_datetime'] = 'No date'
+                except ValueError:
+                    event_data['formatted_datetime'] = event_data['start_datetime']
                     
-                    if len(fields) > max(email_idx, id_idx, summary_idx, start_idx, status_idx):
-                        event_data = {
-                            'email': fields[email_idx],
-                            'id': fields[id_idx],
-                            'summary': fields[summary_idx],
-                            'start_datetime': fields[start_idx],
-                            'status': fields[status_idx],
-                            'line_number': line_num
-                        }
-                        
-                        # Format datetime for display
-                        try:
-                            if event_data['start_datetime']:
-                                # Parse and format the datetime
-                                from datetime import datetime
-                                dt = datetime.fromisoformat(event_data['start_datetime'].replace('Z', '+00:00'))
-                                formatted_dt = dt.strftime('%Y-%m-%d %I:%M %p')
-                                event_data['formatted_datetime'] = formatted_dt
-                            else:
-                                event_data['formatted_datetime'] = 'No date'
-                        except:
-                            event_data['formatted_datetime'] = event_data['start_datetime']
-                        
-                        self.parsed_events.append(event_data)
-                        
-                except Exception as e:
-                    continue  # Skip malformed lines
-            
-            # Update the listbox
-            self.update_event_listbox()
+                events.append(event_data)
             
         except Exception as e:
-            self.event_listbox.delete(0, tk.END)
-            self.event_listbox.insert(0, f"Error parsing events: {str(e)}")
+            return events, f"Error parsing events: {str(e)}"
+            
+        return events, None
+        
+    def show_calendar_events(self, events, error_message=None):
+        """Populate the selection list with parsed calendar events"""
+        self.parsed_events = events
+        
+        if error_message and not events:
+            self.event_listbox.set_rows([error_message])
+            return
+            
+        # Update the listbox
+        self.update_event_listbox()
     
     def update_event_listbox(self):
         """Update the event listbox with parsed events"""
-        self.event_listbox.delete(0, tk.END)
-        
         if not self.parsed_events:
-            self.event_listbox.insert(0, "No events found")
+            self.event_listbox.set_rows(["No events found"])
             return
         
-        # Add events to listbox
-        for i, event in enumerate(self.parsed_events):
-            # Format: "[Date] Event Title (Status)"
-            display_text = f"[{event['formatted_datetime']}] {event['summary']} ({event['status']})"
-            self.event_listbox.insert(i, display_text)
+        # The listbox formats events as they scroll into view
+        self.event_listbox.set_rows(self.parsed_events)
+        self.filter_event_listbox()
         
         # Auto-select first event if only one found
         if len(self.parsed_events) == 1:
             self.event_listbox.selection_set(0)
             self.on_event_select(None)
     
+    def format_event_row(self, event):
+        """Display text for one event: [Date] Event Title (Status)"""
+        if isinstance(event, str):
+            return event  # Status messages such as "No events found"
+        text = f"[{event['formatted_datetime']}] {event['summary']} ({event['status']})"
+        if event.get('swept'):
+            text = f"{event['email']}: {text}"
+        if event.get('delete_result'):
+            text += f" - {event['delete_result']}"
+        return text
+        
+    def filter_event_listbox(self):
+        query = self.event_filter_entry.get().strip().lower()
+        if query and self.parsed_events:
+            self.event_listbox.set_filter(lambda event: query in self.format_event_row(event).lower())
+        else:
+            self.event_listbox.set_filter(None)
+            
     def on_event_select(self, event):
         """Handle event selection in the listbox"""
-        selection = self.event_listbox.curselection()
-        if not selection or not self.parsed_events:
+        selected = self.event_listbox.selected_rows()
+        if not selected or not self.parsed_events or isinstance(selected[0], str):
+            self.selected_events_count.config(text="")
             return
         
-        selected_idx = selection[0]
-        if selected_idx >= len(self.parsed_events):
-            return
-            
-        selected_event = self.parsed_events[selected_idx]
+        selected_event = selected[0]
+        self.selected_events_count.config(text=f"{len(selected)} event{'s' if len(selected) != 1 else ''} selected")
         
         # Update the detail fields
         self.update_entry_field(self.delete_user_entry, selected_event['email'])
@@ -999,9 +4629,23 @@ class GAMSimplifiedGUI:
         self.update_entry_field(self.selected_event_title, "")
         self.update_entry_field(self.delete_event_id_entry, "")
         self.update_entry_field(self.selected_event_datetime, "")
+        self.selected_events_count.config(text="")
+        
+    def select_all_events(self):
+        """Select every event the filter currently shows"""
+        if not self.parsed_events:
+            return
+        self.event_listbox.selection_set(0, tk.END)
+        self.on_event_select(None)
     
     def delete_selected_calendar_event(self):
-        """Delete the currently selected calendar event"""
+        """Delete the selected calendar events, in one job when more than one is selected"""
+        selected = [event for event in self.event_listbox.selected_rows()
+                    if not isinstance(event, str) and event.get('delete_result') != EVENT_DELETED_RESULT]
+        if len(selected) > 1:
+            self.delete_calendar_events(selected)
+            return
+            
         user_email = self.delete_user_entry.get().strip()
         event_id = self.delete_event_id_entry.get().strip()
         event_title = self.selected_event_title.get().strip()
@@ -1022,16 +4666,102 @@ class GAMSimplifiedGUI:
                                      f"Are you sure you want to delete this event?")
         
         if response:
+            # Mark the row once GAM confirms, so the rest of a long list stays usable
+            def mark_deleted(output, events=selected):
+                for deleted_event in events:
+                    deleted_event['delete_result'] = EVENT_DELETED_RESULT
+                self.event_listbox.schedule_render()
+                
             # Use the correct GAM command format for deleting calendar events
-            self.run_gam_command(f"gam calendar {user_email} delete events eventId {event_id} doit")
+            self.run_gam_command(f"gam calendar {user_email} delete events eventId {event_id} doit",
+                                 on_success=mark_deleted)
             
             # Clear the selection after deletion attempt
             self.clear_event_selection()
             
-            # Clear the event list to encourage a new search
-            self.event_listbox.delete(0, tk.END)
-            self.parsed_events = []
-    
+    def delete_calendar_events(self, events):
+        """Confirm once, then delete many events as one bulk job with a result per row"""
+        mailboxes = {event['email'].lower() for event in events}
+        titles = {}
+        for event in events:
+            titles[event['summary']] = titles.get(event['summary'], 0) + 1
+        top_titles = sorted(titles.items(), key=lambda item: -item[1])[:5]
+        title_lines = "\n".join(f"   • {title.splitlines()[0] if title else '(no title)'} ×{count}"
+                                for title, count in top_titles)
+        if len(titles) > len(top_titles):
+            title_lines += f"\n   • ... and {len(titles) - len(top_titles)} more titles"
+            
+        response = messagebox.askyesno("⚠️ Confirm Delete Events",
+                                       f"Delete {len(events)} calendar events from {len(mailboxes)} "
+                                       f"mailbox{'es' if len(mailboxes) != 1 else ''}:\n\n"
+                                       f"{title_lines}\n\n"
+                                       f"⚠️ This action CANNOT be undone!\n\n"
+                                       f"Are you sure you want to delete these events?")
+        if not response:
+            return
+            
+        try:
+            max_workers = max(1, int(self.sweep_concurrency.get()))
+        except (tk.TclError, ValueError):
+            max_workers = DEFAULT_MAX_CONCURRENCY
+        backend = 'batch' if self.sweep_use_batch.get() else 'process'
+        commands = [f"gam calendar {event['email']} delete events eventId {event['id']} doit" for event in events]
+        
+        for event in events:
+            event['delete_result'] = "⏳ deleting"
+        self.event_listbox.schedule_render()
+        self.append_output(f"\n[{datetime.now().strftime('%H:%M:%S')}] Deleting {len(events)} calendar events\n")
+        self.append_output("-" * 50 + "\n")
+        self.status_var.set(f"Deleting {len(events)} calendar events...")
+        
+        def delete_events(job):
+            failed = [0]
+            
+            def on_result(index, command, result, completed):
+                event = events[index]
+                if isinstance(result, Exception) or result is None or result.returncode != 0:
+                    failed[0] += 1
+                    error = result if isinstance(result, Exception) else getattr(result, 'stderr', '')
+                    error = str(error).strip().splitlines()[-1] if str(error).strip() else "failed"
+                    outcome = f"❌ {error}"
+                else:
+                    outcome = EVENT_DELETED_RESULT
+                    
+                # Rows are updated in place and redrawn once per batch of UI updates
+                def show_result(event=event, outcome=outcome):
+                    event['delete_result'] = outcome
+                self.ui_updates.post(show_result)
+                self.ui_updates.post(self.event_listbox.schedule_render, key='event_rows')
+                self.ui_updates.post_output(f"{event['email']},{event['id']},{outcome}\n")
+                job.set_progress(f"{completed}/{len(events)} events, {failed[0]} failed")
+                self.ui_updates.post(lambda completed=completed, failures=failed[0]: self.status_var.set(
+                    f"Deleted {completed - failures}/{len(events)} events, {failures} failed"), key='status')
+                    
+            try:
+                self.run_gam_commands(commands, DEFAULT_COMMAND_TIMEOUT, max_workers, backend,
+                                      on_result=on_result, job=job, keep_results=False)
+                job.check_cancelled()
+                message = f"✅ Deleted {len(events) - failed[0]} of {len(events)} events"
+                if failed[0]:
+                    message += f", {failed[0]} failed (see list)"
+            except JobCancelled:
+                message = "⏹ Event deletion cancelled"
+            except Exception as e:
+                message = f"❌ Error deleting events: {str(e)}"
+                
+            # Events that never ran are no longer pending
+            def finish():
+                for event in events:
+                    if event.get('delete_result') == "⏳ deleting":
+                        event['delete_result'] = "⏹ not deleted"
+                self.event_listbox.schedule_render()
+                self.status_var.set(message)
+            self.ui_updates.post_output("=" * 50 + "\n\n")
+            self.ui_updates.post(finish)
+            
+        self.job_scheduler.submit(f"Delete {len(events)} calendar events", delete_events, PRIORITY_BULK)
+        self.clear_event_selection()
+        
     def capture_groups_from_output(self):
         """Capture groups from the last group listing output"""
         if not hasattr(self, 'last_group_output') or not self.last_group_output:
@@ -1043,68 +4773,48 @@ class GAMSimplifiedGUI:
             lines = self.last_group_output.strip().split('\n')
             
             # Debug: Show output in the GUI for troubleshooting
-            self.output_text.insert(tk.END, f"\n[DEBUG] Analyzing group output format:\n")
-            self.output_text.insert(tk.END, f"Total lines: {len(lines)}\n")
+            self.append_output(f"\n[DEBUG] Analyzing group output format:\n")
+            self.append_output(f"Total lines: {len(lines)}\n")
             
             # Show first few lines
             debug_lines = lines[:8] if len(lines) >= 8 else lines
             for i, line in enumerate(debug_lines):
-                self.output_text.insert(tk.END, f"Line {i:2d}: {repr(line)}\n")
+                self.append_output(f"Line {i:2d}: {repr(line)}\n")
             if len(lines) > 8:
-                self.output_text.insert(tk.END, f"... and {len(lines) - 8} more lines\n")
-            self.output_text.insert(tk.END, "-" * 50 + "\n")
-            
-            # Find the header line with multiple strategies
-            header_line = None
-            data_start = 0
+                self.append_output(f"... and {len(lines) - 8} more lines\n")
+            self.append_output("-" * 50 + "\n")
             
-            # Strategy 1: Look for lines with common group headers
-            for i, line in enumerate(lines):
-                if not line.strip() or line.startswith('Getting') or line.startswith('Got'):
-                    continue
-                
-                line_lower = line.lower()
-                # Check for CSV format with group-related headers
-                if ',' in line and any(keyword in line_lower for keyword in ['email', 'group', 'name', 'description']):
-                    # Additional check: make sure it's not just data that happens to contain these words
-                    parts = line.split(',')
-                    if len(parts) >= 2:  # At least 2 columns
-                        header_line = line
-                        data_start = i + 1
-                        self.output_text.insert(tk.END, f"[DEBUG] Found header (Strategy 1) at line {i}: {line}\n")
-                        break
-            
-            # Strategy 2: If no header found, look for the first CSV-like line
-            if not header_line:
-                for i, line in enumerate(lines):
-                    if not line.strip() or line.startswith('Getting') or line.startswith('Got'):
-                        continue
-                    if ',' in line and len(line.split(',')) >= 2:
-                        # Check if this looks like it could be group data
-                        parts = [p.strip() for p in line.split(',')]
-                        if any('@' in part for part in parts):  # Contains email addresses
-                            header_line = line
-                            data_start = i
-                            self.output_text.insert(tk.END, f"[DEBUG] Using first data line as header (Strategy 2) at line {i}: {line}\n")
-                            break
-            
-            if not header_line:
+            # Strategy 1: Look for a CSV header with common group columns
+            header_keywords = ['email', 'group', 'name', 'description']
+            reader = GAMCSVReader(self.last_group_output, is_header=lambda line: ',' in line and any(
+                keyword in line.lower() for keyword in header_keywords))
+            if reader.find_header():
+                self.append_output(f"[DEBUG] Found header (Strategy 1) after {reader.lines_skipped} lines: "
+                                   f"{reader.headers}\n")
+            else:
+                # Strategy 2: No header, read from the first CSV line containing an email address
+                reader = GAMCSVReader(self.last_group_output, is_header=lambda line: ',' in line and '@' in line,
+                                      has_header=False)
+                if reader.find_header():
+                    self.append_output(f"[DEBUG] No header, reading data from line {reader.lines_skipped} "
+                                       f"(Strategy 2)\n")
+                                       
+            if reader.headers is None:
                 error_msg = "Could not find group data in output.\n\nTroubleshooting:\n"
                 error_msg += f"- Total lines: {len(lines)}\n"
                 error_msg += f"- Non-empty lines: {len([l for l in lines if l.strip()])}\n"
                 error_msg += "- Check the Output tab for detailed debug information"
                 
-                self.output_text.insert(tk.END, f"[DEBUG] No header found. All non-empty lines:\n")
+                self.append_output(f"[DEBUG] No header found. All non-empty lines:\n")
                 for i, line in enumerate(lines):
                     if line.strip():
-                        self.output_text.insert(tk.END, f"  {i:2d}: {line}\n")
+                        self.append_output(f"  {i:2d}: {line}\n")
                 
                 messagebox.showerror("Error", error_msg)
                 return
             
-            # Parse header to get column indices
-            headers = [h.strip().strip('"') for h in header_line.split(',')]
-            self.output_text.insert(tk.END, f"[DEBUG] Parsed headers: {headers}\n")
+            headers = reader.headers
+            rows = list(reader.rows())
             
             # Find email and name columns with flexible matching
             email_idx = None
@@ -1115,41 +4825,34 @@ class GAMSimplifiedGUI:
             name_patterns = ['name', 'displayname', 'groupname', 'description', 'title']
             
             for i, header in enumerate(headers):
-                header_lower = header.lower().strip()
-                
                 # Check for email column
                 if email_idx is None:
                     for pattern in email_patterns:
-                        if pattern in header_lower:
+                        if pattern in header:
                             email_idx = i
-                            self.output_text.insert(tk.END, f"[DEBUG] Found email column at index {i}: '{header}'\n")
+                            self.append_output(f"[DEBUG] Found email column at index {i}: '{header}'\n")
                             break
                 
                 # Check for name column
                 if name_idx is None:
                     for pattern in name_patterns:
-                        if pattern in header_lower:
+                        if pattern in header:
                             name_idx = i
-                            self.output_text.insert(tk.END, f"[DEBUG] Found name column at index {i}: '{header}'\n")
+                            self.append_output(f"[DEBUG] Found name column at index {i}: '{header}'\n")
                             break
             
             # Fallback: if no email column found, try to detect it from data
             if email_idx is None:
-                self.output_text.insert(tk.END, f"[DEBUG] No email column found in headers, trying to detect from data...\n")
-                # Look at the first data line to find column with @ symbol
-                for i, line in enumerate(lines[data_start:], data_start):
-                    if line.strip() and not line.startswith('Getting') and not line.startswith('Got'):
-                        try:
-                            fields = next(csv.reader(io.StringIO(line)))
-                            for j, field in enumerate(fields):
-                                if '@' in field.strip():
-                                    email_idx = j
-                                    self.output_text.insert(tk.END, f"[DEBUG] Detected email column at index {j} from data\n")
-                                    break
-                            if email_idx is not None:
-                                break
-                        except:
-                            continue
+                self.append_output(f"[DEBUG] No email column found in headers, trying to detect from data...\n")
+                # Look at the first data row with an @ symbol
+                for fields in rows:
+                    for j, field in enumerate(fields):
+                        if '@' in field:
+                            email_idx = j
+                            self.append_output(f"[DEBUG] Detected email column at index {j} from data\n")
+                            break
+                    if email_idx is not None:
+                        break
             
             if email_idx is None:
                 messagebox.showerror("Error", 
@@ -1160,37 +4863,26 @@ class GAMSimplifiedGUI:
             
             # Parse group data
             groups_found = 0
-            for line_num, line in enumerate(lines[data_start:], data_start):
-                if not line.strip() or line.startswith('Getting') or line.startswith('Got'):
-                    continue
-                
-                try:
-                    reader = csv.reader(io.StringIO(line))
-                    fields = next(reader)
+            for fields in rows:
+                if len(fields) > email_idx and fields[email_idx].strip():
+                    email = fields[email_idx].strip()
+                    name = fields[name_idx].strip() if name_idx is not None and len(fields) > name_idx else email
                     
-                    if len(fields) > email_idx and fields[email_idx].strip():
-                        email = fields[email_idx].strip()
-                        name = fields[name_idx].strip() if name_idx and len(fields) > name_idx else email
-                        
-                        # Validate that this looks like a group email
-                        if '@' in email and '.' in email:
-                            group_data = {
-                                'email': email,
-                                'name': name
-                            }
-                            self.captured_groups.append(group_data)
-                            groups_found += 1
-                            
-                            # Show first few captured groups for verification
-                            if groups_found <= 3:
-                                self.output_text.insert(tk.END, f"[DEBUG] Captured: {email} ({name})\n")
+                    # Validate that this looks like a group email
+                    if '@' in email and '.' in email:
+                        group_data = {
+                            'email': email,
+                            'name': name
+                        }
+                        self.captured_groups.append(group_data)
+                        groups_found += 1
                         
-                except Exception as e:
-                    self.output_text.insert(tk.END, f"[DEBUG] Error parsing line {line_num}: {str(e)} - Line: {line}\n")
-                    continue
+                        # Show first few captured groups for verification
+                        if groups_found <= 3:
+                            self.append_output(f"[DEBUG] Captured: {email} ({name})\n")
             
-            self.output_text.insert(tk.END, f"[DEBUG] Total groups captured: {len(self.captured_groups)}\n")
-            self.output_text.insert(tk.END, "=" * 50 + "\n")
+            self.append_output(f"[DEBUG] Total groups captured: {len(self.captured_groups)}\n")
+            self.append_output("=" * 50 + "\n")
             self.output_text.see(tk.END)
             
             # Update the label and show result
@@ -1210,7 +4902,7 @@ class GAMSimplifiedGUI:
                     "Make sure the GAM command returned group data in CSV format.")
                 
         except Exception as e:
-            self.output_text.insert(tk.END, f"[DEBUG] Exception in capture_groups_from_output: {str(e)}\n")
+            self.append_output(f"[DEBUG] Exception in capture_groups_from_output: {str(e)}\n")
             self.output_text.see(tk.END)
             messagebox.showerror("Error", f"Error capturing groups: {str(e)}")
     
@@ -1224,132 +4916,517 @@ class GAMSimplifiedGUI:
             messagebox.showwarning("Warning", "Please select at least one type to include in the report.")
             return
         
+        # Read the options in the main thread before handing off to workers
+        roles = []
+        if self.include_members.get():
+            roles.append(('members', 'member'))
+        if self.include_owners.get():
+            roles.append(('owners', 'owner'))
+        if self.include_managers.get():
+            roles.append(('managers', 'manager'))
+            
+        try:
+            max_workers = max(1, int(self.report_concurrency.get()))
+            timeout = max(1, int(self.report_timeout.get()))
+            batch_size = max(1, int(self.report_batch_size.get()))
+        except (tk.TclError, ValueError):
+            messagebox.showwarning("Warning", "Parallel fetches, groups per call and timeout must be whole numbers.")
+            return
+            
+        # A streamed report goes straight to a file chosen up front
+        filename = None
+        if self.stream_group_report.get():
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                title="Write Group Report To"
+            )
+            if not filename:
+                return
+                
+        spec = {
+            'groups': list(self.captured_groups),
+            'roles': roles,
+            'max_workers': max_workers,
+            'timeout': timeout,
+            'batch_size': batch_size,
+            'backend': self.execution_backend.get(),
+            'use_cache': not self.bypass_membership_cache.get(),
+            'cache_results': self.cache_report_results.get(),
+            'filename': filename,
+            'detailed': self.report_format.get() == "detailed",
+            'delta': self.delta_group_report.get(),
+        }
+        try:
+            journal = ReportJournal.create(spec)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not create report journal: {str(e)}")
+            return
+            
+        self.start_group_report(journal)
+        
+    def start_group_report(self, journal):
+        """Run a journalled group report as a background bulk job, skipping groups it already recorded"""
+        spec = journal.spec
+        groups = spec['groups']
+        roles = [tuple(role) for role in spec['roles']]
+        max_workers = spec['max_workers']
+        timeout = spec['timeout']
+        batch_size = spec['batch_size']
+        backend = spec['backend']
+        use_cache = spec['use_cache']
+        filename = spec['filename']
+        # A streamed report keeps nothing per group, so its results are never cached either
+        cache_results = spec.get('cache_results', True) and not filename
+        persist_cache = self.persist_membership_cache.get()
+        detailed = spec['detailed']
+        delta = spec.get('delta', False)
+        self.apply_membership_cache_ttl()
+        
         self.report_status_label.config(text="🔄 Generating report...")
-        self.group_report_data = []
+        self.group_report_data = GroupReportStore()
         
-        # Generate report in background thread
-        def generate_report():
+        # Generate report as a background bulk job
+        def generate_report(job):
+            csvfile = None
+            snapshot = None
             try:
-                total_groups = len(self.captured_groups)
+                if filename:
+                    # Each group is written once, in the order its fetch finishes
+                    csvfile = open(filename, 'w', newline='', encoding='utf-8')
+                    writer = GroupReportWriter(csvfile, detailed, [role_key for role_key, role in roles])
+                    group_names = {}
+                    for group in groups:
+                        group_names.setdefault(group['email'].lower(), (group['email'], group['name']))
+                    report_groups = [{'email': email, 'name': name} for email, name in group_names.values()]
+                    report_data = None
+                else:
+                    # Results go straight into the compact store, in the original group order
+                    writer = None
+                    report_groups = groups
+                    report_data = GroupReportStore()
+                    for group in groups:
+                        report_data.add_group(group['email'], group['name'])
+                        
+                total_groups = len(report_groups)
+                groups_done = [0]
+                
+                # Delta refresh: one bulk call for member counts decides which groups need refetching
+                changes = []
+                if delta:
+                    job.set_progress("Checking group member counts")
+                    snapshot = GroupSnapshot()
+                    member_counts = self.fetch_group_member_counts(job, timeout)
+                    
+                def store_roles(fetched, record=True):
+                    for group_email, group_roles in fetched.items():
+                        if writer:
+                            writer.write_group(*group_names.get(group_email, (group_email, group_email)), group_roles)
+                        else:
+                            report_data.set_roles(group_email, group_roles)
+                            
+                        # Failed fetches are left out of the journal and snapshot so they are retried
+                        if any(email.startswith("Error:") for emails in group_roles.values() for email in emails):
+                            continue
+                        if record:
+                            journal.record(group_email, group_roles)
+                        if snapshot is not None:
+                            previous = snapshot.get(group_email)
+                            self.compare_group_roles(group_email, previous, group_roles, changes)
+                            previous_roles = previous['roles'] if previous else {}
+                            snapshot.put(group_email, member_counts.get(group_email),
+                                         dict(previous_roles, **group_roles))
+                            
+                # Groups recorded by an earlier run of this report are replayed from the journal
+                completed = set()
+                for group_email, group_roles in journal.completed_groups():
+                    if group_email not in completed:
+                        completed.add(group_email)
+                        store_roles({group_email: group_roles}, record=False)
+                journal.open(len(completed))
+                if completed:
+                    job.set_progress(f"Resumed with {len(completed)}/{total_groups} groups done")
+                    
+                # Serve groups whose requested roles are all cached without calling GAM
+                to_fetch = []
+                for group in report_groups:
+                    if group['email'].lower() in completed:
+                        continue
+                    if snapshot is not None:
+                        unchanged = self.snapshot_group_roles(snapshot, member_counts, group['email'], roles)
+                        if unchanged is None:
+                            to_fetch.append(group)  # The cache may predate the change, so refetch
+                        else:
+                            store_roles({group['email'].lower(): unchanged})
+                        continue
+                    cached = self.cached_group_roles(group['email'], roles) if use_cache else None
+                    if cached is None:
+                        to_fetch.append(group)
+                    else:
+                        store_roles({group['email'].lower(): cached})
+                groups_done[0] = total_groups - len(to_fetch)
+                refetched = len(to_fetch)
+                self.ui_updates.post(self.update_cache_status, key='cache_status')
+                
+                # One job per chunk of groups; each job fetches every requested role in one call
+                chunks = [to_fetch[i:i + batch_size] for i in range(0, len(to_fetch), batch_size)]
                 
-                for i, group in enumerate(self.captured_groups):
-                    group_email = group['email']
-                    group_name = group['name']
+                commands = [self.group_members_command([g['email'] for g in chunk], roles) for chunk in chunks]
+                retry_emails = []
+                
+                # Results are handled as they arrive and then dropped, so nothing piles up in memory
+                def on_result(index, command, result, completed):
+                    chunk = chunks[index]
+                    chunk_emails = [g['email'] for g in chunk]
+                    chunk_roles = self.group_roles_from_result(result, chunk_emails, roles, timeout)
+                    if chunk_roles is None:
+                        # GAM rejected the multi-group selection, fall back to one call per group
+                        retry_emails.extend(chunk_emails)
+                        return
+                    store_roles(chunk_roles)
+                    if cache_results:
+                        self.cache_group_roles(chunk_roles, roles)
+                    
+                    groups_done[0] += len(chunk)
+                    done = groups_done[0]
+                    group_email = chunk[-1]['email']
                     
                     # Update status in main thread
-                    self.root.after(0, lambda i=i: self.report_status_label.config(
-                        text=f"🔄 Processing group {i+1}/{total_groups}: {group_email}"))
+                    job.set_progress(f"{done}/{total_groups} groups")
+                    self.ui_updates.post(lambda done=done, group_email=group_email: self.report_status_label.config(
+                        text=f"🔄 Processed group {done}/{total_groups}: {group_email}"), key='report_status')
+                        
+                self.run_gam_commands(commands, timeout, max_workers, backend, on_result=on_result, job=job,
+                                      keep_results=False)
+                job.check_cancelled()
+                
+                if retry_emails:
+                    retry_commands = [self.group_members_command([email], roles) for email in retry_emails]
                     
-                    # Collect data for this group
-                    group_data = {
-                        'group_email': group_email,
-                        'group_name': group_name,
-                        'members': [],
-                        'owners': [],
-                        'managers': []
-                    }
+                    def on_retry_result(index, command, result, completed):
+                        email = retry_emails[index]
+                        group_roles = self.group_roles_from_result(result, [email], roles, timeout) or {}
+                        store_roles(group_roles)
+                        if cache_results:
+                            self.cache_group_roles(group_roles, roles)
+                        
+                    self.run_gam_commands(retry_commands, timeout, max_workers, backend, on_result=on_retry_result,
+                                          job=job, keep_results=False)
+                    job.check_cancelled()
                     
-                    # Get group members if requested
-                    if self.include_members.get():
-                        try:
-                            result = subprocess.run(
-                                f"gam print group-members group {group_email} role member",
-                                shell=True, capture_output=True, text=True, timeout=30
-                            )
-                            if result.returncode == 0:
-                                group_data['members'] = self.parse_group_members(result.stdout)
-                        except Exception as e:
-                            group_data['members'] = [f"Error: {str(e)}"]
+                if snapshot is not None:
+                    if cache_results:
+                        # The member counts list every group in the domain, so this is the one time
+                        # the index can be known to hold all of them
+                        self.membership_index.mark_complete(member_counts)
+                    snapshot.commit()
+                    self.group_change_report = changes
+                    changed_groups = len({change[0] for change in changes})
+                    delta_summary = (f" | Δ {refetched}/{total_groups} groups refetched, "
+                                     f"{changed_groups} changed, {len(changes)} membership changes")
+                else:
+                    delta_summary = ""
                     
-                    # Get group owners if requested
-                    if self.include_owners.get():
-                        try:
-                            result = subprocess.run(
-                                f"gam print group-members group {group_email} role owner",
-                                shell=True, capture_output=True, text=True, timeout=30
-                            )
-                            if result.returncode == 0:
-                                group_data['owners'] = self.parse_group_members(result.stdout)
-                        except Exception as e:
-                            group_data['owners'] = [f"Error: {str(e)}"]
+                if writer:
+                    writer.flush()
+                    message = (f"✅ Report written to {os.path.basename(filename)}: "
+                               f"{writer.groups_written} groups, {writer.entries_written} total entries{delta_summary}")
+                    self.ui_updates.post(lambda: self.report_status_label.config(text=message), key='report_status')
+                else:
+                    self.group_report_data = report_data
                     
-                    # Get group managers if requested
-                    if self.include_managers.get():
-                        try:
-                            result = subprocess.run(
-                                f"gam print group-members group {group_email} role manager",
-                                shell=True, capture_output=True, text=True, timeout=30
-                            )
-                            if result.returncode == 0:
-                                group_data['managers'] = self.parse_group_members(result.stdout)
-                        except Exception as e:
-                            group_data['managers'] = [f"Error: {str(e)}"]
+                    # Update UI in main thread
+                    self.ui_updates.post(lambda: self.report_generation_complete(delta_summary), key='report_status')
+                if cache_results:
+                    self.write_membership_cache(persist_cache)
                     
-                    self.group_report_data.append(group_data)
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self.report_generation_complete())
+                # The report is complete, nothing is left to resume
+                journal.delete()
                 
+            except JobCancelled:
+                journal.set_state('cancelled')
+                partial = " (partial file kept)" if csvfile else ""
+                self.ui_updates.post(lambda: self.report_status_label.config(
+                    text=f"⏹ Report cancelled{partial}, resume it from the Jobs tab"), key='report_status')
             except Exception as e:
-                self.root.after(0, lambda: self.report_status_label.config(
-                    text=f"❌ Error generating report: {str(e)}"))
-        
-        # Run in background thread
-        thread = threading.Thread(target=generate_report)
-        thread.daemon = True
-        thread.start()
-    
-    def parse_group_members(self, output):
-        """Parse group member output and return list of emails"""
-        members = []
-        try:
-            lines = output.strip().split('\n')
+                journal.set_state('failed')
+                self.ui_updates.post(lambda e=e: self.report_status_label.config(
+                    text=f"❌ Error generating report: {str(e)}"), key='report_status')
+            finally:
+                journal.close()
+                if csvfile:
+                    csvfile.close()
+                if snapshot is not None:
+                    snapshot.close()
+                self.ui_updates.post(self.refresh_report_journals, key='report_journals')
+        
+        self.report_job = self.job_scheduler.submit(
+            f"Group report ({len(groups)} groups)", generate_report, PRIORITY_BULK)
+        self.active_journals[journal.directory] = self.report_job
+        self.refresh_report_journals()
+        
+    def run_gam_commands(self, commands, timeout=DEFAULT_JOB_TIMEOUT, max_workers=DEFAULT_MAX_CONCURRENCY,
+                         backend='process', on_result=None, job=None, keep_results=True, rate_limiter=None):
+        """Run many GAM commands and return their results in input order
+        
+        With the 'process' backend each command gets its own GAM process on the
+        worker pool. With the 'batch' backend commands are grouped into GAM batch
+        files so hundreds of commands share one GAM process. Each result is a
+        CompletedProcess, or the exception raised while running that command.
+        on_result is called as (index, command, result, completed_count).
+        When a job is given its processes count toward the scheduler's limits,
+        and cancelling the job stops the remaining commands. keep_results=False
+        hands each result to on_result only, so large runs hold no output.
+        A RateLimiter spaces out command starts; with the batch backend each
+        batch waits for as many starts as it has commands.
+        """
+        commands = list(commands)
+        cancel_event = job.cancel_event if job else None
+        
+        if backend != 'batch':
+            def run_one(command):
+                if rate_limiter:
+                    rate_limiter.acquire(cancel_event=cancel_event)
+                if job:
+                    return job.run_process(command, timeout=timeout)
+                return subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
+                
+            return FanOutExecutor(max_workers).map(run_one, commands, on_result=on_result, cancel_event=cancel_event,
+                                                   keep_results=keep_results)
             
-            # Find header line
-            header_line = None
-            data_start = 0
+        batches = [list(range(i, min(i + DEFAULT_BATCH_SIZE, len(commands))))
+                   for i in range(0, len(commands), DEFAULT_BATCH_SIZE)]
+        runner = GAMBatchRunner(run_process=job.run_process if job else None)
+        results = [None] * len(commands)
+        completed = [0]
+        lock = threading.Lock()
+        
+        def run_batch(indexes):
+            if rate_limiter:
+                rate_limiter.acquire(len(indexes), cancel_event=cancel_event)
+            return runner.run([commands[i] for i in indexes], timeout=timeout * len(indexes))
             
-            for i, line in enumerate(lines):
-                if 'email' in line.lower():
-                    header_line = line
-                    data_start = i + 1
-                    break
+        def on_batch_result(batch_index, indexes, batch_results, batch_completed):
+            for position, i in enumerate(indexes):
+                result = batch_results if isinstance(batch_results, Exception) else batch_results[position]
+                if keep_results:
+                    results[i] = result
+                if on_result:
+                    with lock:
+                        completed[0] += 1
+                        done = completed[0]
+                    on_result(i, commands[i], result, done)
+                    
+        FanOutExecutor(max_workers).map(run_batch, batches, on_result=on_batch_result, cancel_event=cancel_event,
+                                        keep_results=False)
+        return results
+        
+    def group_members_command(self, group_emails, roles):
+        """Build a GAM command that prints all requested roles for one or more groups
+        
+        roles is a list of (role_key, role) pairs such as ('owners', 'owner').
+        """
+        role_list = ','.join(role for role_key, role in roles)
+        if len(group_emails) == 1:
+            return f"gam print group-members group {group_emails[0]} roles {role_list}"
+        return f"gam print group-members select \"{','.join(group_emails)}\" roles {role_list}"
+        
+    def group_roles_from_result(self, result, group_emails, roles, timeout=DEFAULT_JOB_TIMEOUT):
+        """Turn a group-members command result into per-group role lists
+        
+        Returns a dict keyed by lowercase group email, or None when a
+        multi-group call failed and the groups should be fetched one by one.
+        """
+        if isinstance(result, subprocess.TimeoutExpired):
+            error = f"Error: Timed out after {timeout} seconds"
+            return {email.lower(): {role_key: [error] for role_key, role in roles} for email in group_emails}
+        if isinstance(result, Exception):
+            return {email.lower(): {role_key: [f"Error: {str(result)}"] for role_key, role in roles}
+                    for email in group_emails}
+                    
+        if result.returncode != 0:
+            return None if len(group_emails) > 1 else {}
             
-            if not header_line:
-                return members
+        default_group = group_emails[0] if len(group_emails) == 1 else None
+        fetched = self.parse_group_members(result.stdout, default_group)
+        
+        # Groups with nobody in the requested roles do not appear in the output at all
+        for email in group_emails:
+            fetched.setdefault(email.lower(), {'members': [], 'owners': [], 'managers': []})
+        return fetched
+        
+    def cached_group_roles(self, group_email, roles):
+        """Return a group's role lists from the membership cache, or None unless every role is cached"""
+        group_roles = {}
+        for role_key, role in roles:
+            emails = self.membership_cache.get(group_email, role)
+            if emails is None:
+                return None
+            group_roles[role_key] = emails
+        return group_roles
+        
+    def cache_group_roles(self, fetched, roles):
+        """Store freshly fetched role lists, skipping any that failed"""
+        for group_email, group_roles in fetched.items():
+            for role_key, role in roles:
+                emails = group_roles.get(role_key, [])
+                if not any(email.startswith("Error:") for email in emails):
+                    self.membership_cache.put(group_email, role, emails)
+                    self.membership_index.set_role(group_email, role, emails)
+                    
+    def apply_membership_cache_ttl(self):
+        try:
+            self.membership_cache.ttl = max(1, int(self.membership_cache_ttl.get())) * 60
+        except (tk.TclError, ValueError):
+            self.membership_cache.ttl = MEMBERSHIP_CACHE_TTL
+        self.membership_index.ttl = self.membership_cache.ttl
             
-            # Parse members
-            headers = [h.strip() for h in header_line.split(',')]
-            email_idx = headers.index('email') if 'email' in headers else 0
+    def update_cache_status(self):
+        """Show the membership cache hit rate in the status bar"""
+        cache = self.membership_cache
+        if cache.hits + cache.misses:
+            self.cache_status_var.set(f"Membership cache: {cache.hits} hits / {cache.misses} misses "
+                                      f"({cache.hit_rate():.0%})")
+        else:
+            self.cache_status_var.set(f"Membership cache: {len(cache.entries)} entries")
             
-            for line in lines[data_start:]:
-                if not line.strip():
-                    continue
+    def save_membership_cache(self):
+        """Persist the membership cache in a background job, so large caches never block the GUI"""
+        persist = self.persist_membership_cache.get()
+        self.job_scheduler.submit("Save membership cache",
+                                  lambda job: self.write_membership_cache(persist), PRIORITY_BULK)
+                                  
+    def write_membership_cache(self, persist):
+        """Write the membership cache to disk, or remove any saved copy; runs on a worker thread"""
+        try:
+            with self.cache_save_lock:
+                if persist:
+                    self.membership_cache.save(MEMBERSHIP_CACHE_FILE)
+                elif os.path.exists(MEMBERSHIP_CACHE_FILE):
+                    os.remove(MEMBERSHIP_CACHE_FILE)
+        except OSError as e:
+            self.ui_updates.post(lambda e=e: self.status_var.set(f"Could not save membership cache: {str(e)}"))
+        self.ui_updates.post(self.update_cache_status, key='cache_status')
+        
+    def clear_membership_cache(self):
+        self.membership_cache.clear()
+        self.membership_index.clear()
+        self.save_membership_cache()
+        self.status_var.set("Membership cache cleared")
+    
+    def parse_group_members(self, output, default_group=None):
+        """Parse multi-role group member output into members/owners/managers per group
+        
+        Rows are split on the role column. Output for a single group may omit the
+        group column, in which case rows are assigned to default_group.
+        """
+        role_keys = {'member': 'members', 'owner': 'owners', 'manager': 'managers'}
+        groups = {}
+        try:
+            reader = GAMCSVReader(output, is_header=lambda line: 'email' in line.lower())
+            if not reader.find_header():
+                return groups
                 
-                try:
-                    reader = csv.reader(io.StringIO(line))
-                    fields = next(reader)
+            email_idx = reader.column('email', default=0)
+            role_idx = reader.column('role')
+            group_idx = reader.column('group')
+            
+            for fields in reader.rows():
+                if len(fields) <= email_idx:
+                    continue
                     
-                    if len(fields) > email_idx:
-                        members.append(fields[email_idx])
-                        
-                except Exception:
+                if group_idx is not None and len(fields) > group_idx:
+                    group_email = fields[group_idx].strip()
+                else:
+                    group_email = default_group
+                if not group_email:
                     continue
                     
-        except Exception:
+                role = fields[role_idx].strip().lower() if role_idx is not None and len(fields) > role_idx else 'member'
+                role_key = role_keys.get(role, 'members')
+                
+                group_roles = groups.setdefault(group_email.lower(), {'members': [], 'owners': [], 'managers': []})
+                group_roles[role_key].append(fields[email_idx])
+                
+        except csv.Error:
             pass
-        
-        return members
+            
+        return groups
     
-    def report_generation_complete(self):
+    def fetch_group_member_counts(self, job, timeout=DEFAULT_JOB_TIMEOUT):
+        """Return {group email: directMembersCount} from one domain-wide call"""
+        result = job.run_process("gam print groups fields email,directmemberscount",
+                                 timeout=max(timeout, DEFAULT_COMMAND_TIMEOUT))
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not read group member counts: {result.stderr.strip()}")
+        counts = {}
+        for record in GAMCSVReader(result.stdout).records():
+            count = record.get('directmemberscount', '')
+            if record.get('email') and count.isdigit():
+                counts[record['email'].lower()] = int(count)
+        return counts
+        
+    def snapshot_group_roles(self, snapshot, member_counts, group_email, roles):
+        """Return a group's role lists from the snapshot if its member count is unchanged, else None"""
+        entry = snapshot.get(group_email)
+        count = member_counts.get(group_email.lower())
+        if not entry or count is None or entry.get('count') != count:
+            return None
+        if any(role_key not in entry['roles'] for role_key, role in roles):
+            return None
+        return {role_key: entry['roles'][role_key] for role_key, role in roles}
+        
+    def compare_group_roles(self, group_email, previous, group_roles, changes):
+        """Append (group, role, member, 'added'/'removed') rows for differences from the snapshot"""
+        if not previous:
+            return
+        for role_key, emails in group_roles.items():
+            if role_key not in previous['roles']:
+                continue
+            before = set(previous['roles'][role_key])
+            after = set(emails)
+            role = role_key[:-1]
+            changes.extend((group_email, role, email, 'added') for email in sorted(after - before))
+            changes.extend((group_email, role, email, 'removed') for email in sorted(before - after))
+            
+    def save_group_change_report(self):
+        """Save the membership changes found by the last delta refresh"""
+        if not self.group_change_report:
+            messagebox.showinfo("Info", "No membership changes recorded. Run a report with "
+                                "'Only refetch groups changed since the last snapshot' ticked first.")
+            return
+            
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Save Membership Changes"
+        )
+        if not filename:
+            return
+            
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(['Group Email', 'Role', 'Member Email', 'Change'])
+                writer.writerows(self.group_change_report)
+            messagebox.showinfo("Success", f"Membership changes saved to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save changes: {str(e)}")
+            
+    def cancel_group_report(self):
+        """Cancel the group report that is currently running"""
+        if self.report_job and self.report_job.state in ('queued', 'running'):
+            self.report_job.cancel()
+            self.report_status_label.config(text="⏹ Cancelling report...")
+            
+    def report_generation_complete(self, delta_summary=""):
         """Handle completion of report generation"""
         if self.group_report_data:
             total_groups = len(self.group_report_data)
-            total_members = sum(len(g['members']) + len(g['owners']) + len(g['managers']) 
-                              for g in self.group_report_data)
+            total_members = self.group_report_data.entry_count()
             
             self.report_status_label.config(
-                text=f"✅ Report ready: {total_groups} groups, {total_members} total entries")
+                text=f"✅ Report ready: {total_groups} groups, {total_members} total entries{delta_summary}")
         else:
             self.report_status_label.config(text="❌ No data generated")
     
@@ -1370,76 +5447,28 @@ class GAMSimplifiedGUI:
         
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                if self.report_format.get() == "detailed":
-                    self.save_detailed_report(csvfile)
-                else:
-                    self.save_summary_report(csvfile)
+                self.write_report_store(csvfile, self.report_format.get() == "detailed")
             
             messagebox.showinfo("Success", f"Group report saved to {filename}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not save report: {str(e)}")
     
-    def save_detailed_report(self, csvfile):
-        """Save detailed report (one row per member)"""
-        writer = csv.writer(csvfile)
-        
-        # Write header
-        header = ['Group Email', 'Group Name', 'Member Email', 'Role']
-        writer.writerow(header)
-        
-        # Write data
-        for group in self.group_report_data:
-            group_email = group['group_email']
-            group_name = group['group_name']
-            
-            # Write members
-            if self.include_members.get():
-                for member in group['members']:
-                    writer.writerow([group_email, group_name, member, 'Member'])
-            
-            # Write owners
-            if self.include_owners.get():
-                for owner in group['owners']:
-                    writer.writerow([group_email, group_name, owner, 'Owner'])
-            
-            # Write managers
-            if self.include_managers.get():
-                for manager in group['managers']:
-                    writer.writerow([group_email, group_name, manager, 'Manager'])
-    
-    def save_summary_report(self, csvfile):
-        """Save summary report (one row per group)"""
-        writer = csv.writer(csvfile)
-        
-        # Build header
-        header = ['Group Email', 'Group Name']
+    def write_report_store(self, csvfile, detailed):
+        """Write the generated report from the compact store"""
+        store = self.group_report_data
+        role_keys = []
         if self.include_members.get():
-            header.extend(['Member Count', 'Members'])
+            role_keys.append('members')
         if self.include_owners.get():
-            header.extend(['Owner Count', 'Owners'])
+            role_keys.append('owners')
         if self.include_managers.get():
-            header.extend(['Manager Count', 'Managers'])
-        
-        writer.writerow(header)
-        
-        # Write data
-        for group in self.group_report_data:
-            row = [group['group_email'], group['group_name']]
-            
-            if self.include_members.get():
-                members = group['members']
-                row.extend([len(members), '; '.join(members)])
-            
-            if self.include_owners.get():
-                owners = group['owners']
-                row.extend([len(owners), '; '.join(owners)])
-            
-            if self.include_managers.get():
-                managers = group['managers']
-                row.extend([len(managers), '; '.join(managers)])
+            role_keys.append('managers')
             
-            writer.writerow(row)
+        writer = GroupReportWriter(csvfile, detailed, role_keys)
+        for record in store:
+            writer.write_group(record.group_email, record.group_name,
+                               {role_key: store.role_emails(record, role_key) for role_key in role_keys})
     
 
 